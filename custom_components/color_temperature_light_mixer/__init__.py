@@ -18,11 +18,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
-from custom_components.color_temperature_light_mixer.config_flow_handler.schemas.config import get_user_schema
 from custom_components.color_temperature_light_mixer.data import ColorTemperatureMixerData
 from homeassistant.config_entries import SOURCE_IMPORT
 from homeassistant.const import CONF_SOURCE, Platform
@@ -30,7 +30,8 @@
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_loaded_integration
 
-from .const import DOMAIN, LOGGER
+from .const import CONF_BRIGHTNESS_CACHE_SIZE, DEFAULT_BRIGHTNESS_CACHE_SIZE, DOMAIN, LOGGER
+from .utils.cache import BRIGHTNESS_CACHE
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -41,12 +42,28 @@
     Platform.LIGHT,
 ]
 
+
 # This integration is configured via config entries only
 # CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 # Allow import via YAML
+@cache
+def _mixer_config_schema() -> vol.All:
+    """Return the schema of a mixer configured via YAML, built the first time a mixer is found in the YAML."""
+
+    # The config flow schemas are only imported when needed, keeping them out of the import of the integration
+    from .config_flow_handler.schemas.config import ensure_light_lists, get_import_schema  # noqa: PLC0415
+
+    return vol.All(ensure_light_lists, get_import_schema())
+
+
+def _validate_mixer_config(config: Any) -> dict[str, Any]:
+    """Validate the YAML configuration of a mixer."""
+    return _mixer_config_schema()(config)
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.All(cv.ensure_list, [get_user_schema()]),
+        DOMAIN: vol.All(cv.ensure_list, [_validate_mixer_config]),
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -114,6 +131,12 @@ async def async_setup_entry(
         integration=async_get_loaded_integration(hass, entry.domain),
     )
 
+    # The brightness cache is shared by all the entries and sized after the largest request
+    BRIGHTNESS_CACHE.request_maxsize(
+        entry.entry_id, entry.options.get(CONF_BRIGHTNESS_CACHE_SIZE, DEFAULT_BRIGHTNESS_CACHE_SIZE)
+    )
+    entry.async_on_unload(partial(BRIGHTNESS_CACHE.release_maxsize, entry.entry_id))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
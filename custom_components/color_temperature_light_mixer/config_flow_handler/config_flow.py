@@ -14,13 +14,31 @@
 
 from typing import Any
 
+import voluptuous as vol
+
+from custom_components.color_temperature_light_mixer.config_flow_handler.options_flow import (
+    ColorTemperatureMixerOptionsFlow,
+)
 from custom_components.color_temperature_light_mixer.config_flow_handler.schemas import (
+    get_intermediate_light_schema,
     get_reconfigure_schema,
     get_user_schema,
+    validate_channel_lights,
+    validate_intermediate_lights,
+)
+from custom_components.color_temperature_light_mixer.const import (
+    CONF_ADD_INTERMEDIATE_LIGHT,
+    CONF_COLD_LIGHT,
+    CONF_INTERMEDIATE_LIGHTS,
+    CONF_WARM_LIGHT,
+    DOMAIN,
+    LOGGER,
 )
-from custom_components.color_temperature_light_mixer.const import DOMAIN, LOGGER
 from homeassistant import config_entries
-from homeassistant.const import CONF_NAME
+from homeassistant.components.light import ATTR_COLOR_TEMP_KELVIN
+from homeassistant.const import CONF_ENTITY_ID, CONF_NAME
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
 
@@ -34,6 +52,7 @@ class ColorTemperatureMixerConfigFlowHandler(config_entries.ConfigFlow, domain=D
     Supported flows:
     - user: Initial setup via UI
     - reconfigure: Update existing configuration
+    - intermediate_light: Each intermediate light of the user or reconfigure flow, in turn
 
     For more details:
     https://developers.home-assistant.io/docs/config_entries_config_flow_handler
@@ -41,22 +60,27 @@ class ColorTemperatureMixerConfigFlowHandler(config_entries.ConfigFlow, domain=D
 
     VERSION = 1
 
-    # @staticmethod
-    # def async_get_options_flow(
-    #     config_entry: config_entries.ConfigEntry,
-    # ) -> ColorTemperatureMixerOptionsFlow:
-    #     """
-    #     Get the options flow for this handler.
+    def __init__(self) -> None:
+        """Initialize the flow."""
 
-    #     Returns:
-    #         The options flow instance for modifying integration options.
+        self._data: dict[str, Any] = {}
+        self._intermediate_lights: list[dict[str, Any]] = []
+        # Intermediate lights of the entry being reconfigured, suggested in turn when entering them again
+        self._previous_lights: list[dict[str, Any]] = []
 
-    #     """
-    #     from custom_components.color_temperature_light_mixer.config_flow_handler.options_flow import (
-    #         ColorTemperatureMixerOptionsFlow,
-    #     )
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> ColorTemperatureMixerOptionsFlow:
+        """
+        Get the options flow for this handler.
+
+        Returns:
+            The options flow instance for modifying integration options.
 
-    #     return ColorTemperatureMixerOptionsFlow()
+        """
+        return ColorTemperatureMixerOptionsFlow()
 
     async def async_step_user(
         self,
@@ -81,10 +105,12 @@ async def async_step_user(
             # await self.async_set_unique_id(slugify(user_input[CONF_NAME]))
             # self._abort_if_unique_id_configured()
 
-            return self.async_create_entry(
-                title=user_input[CONF_NAME],
-                data=user_input,
-            )
+            errors = self._validate_channel_lights(user_input)
+            if not errors:
+                self._data = {key: value for key, value in user_input.items() if key != CONF_ADD_INTERMEDIATE_LIGHT}
+                if user_input[CONF_ADD_INTERMEDIATE_LIGHT]:
+                    return await self.async_step_intermediate_light()
+                return self._async_finish()
 
         integration = async_get_loaded_integration(self.hass, DOMAIN)
         assert integration.documentation is not None, "Integration documentation URL is not set in manifest.json"
@@ -117,17 +143,115 @@ async def async_step_reconfigure(
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            return self.async_update_reload_and_abort(
-                entry,
-                data=user_input,
-            )
+            errors = self._validate_channel_lights(user_input)
+            if not errors:
+                self._data = {key: value for key, value in user_input.items() if key != CONF_ADD_INTERMEDIATE_LIGHT}
+                previous_lights = entry.data.get(CONF_INTERMEDIATE_LIGHTS, [])
+                if user_input[CONF_ADD_INTERMEDIATE_LIGHT]:
+                    self._previous_lights = list(previous_lights)
+                    return await self.async_step_intermediate_light()
+                # The current intermediate lights are kept, if still within the new temperatures
+                try:
+                    self._intermediate_lights = validate_intermediate_lights(
+                        {**self._data, CONF_INTERMEDIATE_LIGHTS: previous_lights}
+                    )
+                except vol.Invalid:
+                    errors[CONF_ADD_INTERMEDIATE_LIGHT] = "invalid_intermediate_lights"
+                else:
+                    return self._async_finish()
 
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=get_reconfigure_schema(entry.data),
+            data_schema=get_reconfigure_schema(user_input or entry.data),
             errors=errors,
         )
 
+    async def async_step_intermediate_light(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """
+        Handle an intermediate light, repeated as long as another one is added.
+
+        Args:
+            user_input: The user input from the intermediate light form, or None for initial display.
+
+        Returns:
+            The config flow result, either showing a form or finishing the user or reconfigure flow.
+
+        """
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            light = {
+                CONF_ENTITY_ID: user_input[CONF_ENTITY_ID],
+                ATTR_COLOR_TEMP_KELVIN: user_input[ATTR_COLOR_TEMP_KELVIN],
+            }
+            try:
+                lights = validate_intermediate_lights(
+                    {**self._data, CONF_INTERMEDIATE_LIGHTS: [*self._intermediate_lights, light]}
+                )
+            except vol.Invalid:
+                errors[CONF_ENTITY_ID] = "invalid_intermediate_lights"
+            else:
+                self._intermediate_lights = lights
+                if not user_input[CONF_ADD_INTERMEDIATE_LIGHT]:
+                    return self._async_finish()
+                user_input = None
+
+        number = len(self._intermediate_lights)
+        if user_input is None and number < len(self._previous_lights):
+            user_input = self._previous_lights[number]
+        return self.async_show_form(
+            step_id="intermediate_light",
+            data_schema=get_intermediate_light_schema(self._data, user_input),
+            errors=errors,
+            description_placeholders={"number": str(number + 1)},
+        )
+
+    @staticmethod
+    def _validate_channel_lights(user_input: dict[str, Any]) -> dict[str, str]:
+        """
+        Validate the warm and cold lights entered, and whether intermediate lights can be added to them.
+
+        Args:
+            user_input: The user input from the user or reconfigure form.
+
+        Returns:
+            The errors of the form, empty if the lights are valid.
+
+        """
+        try:
+            validate_channel_lights(user_input)
+        except vol.Invalid:
+            return {CONF_COLD_LIGHT: "invalid_channel_lights"}
+        if user_input[CONF_ADD_INTERMEDIATE_LIGHT] and set(cv.ensure_list(user_input[CONF_WARM_LIGHT])) == set(
+            cv.ensure_list(user_input[CONF_COLD_LIGHT])
+        ):
+            # Lights driving both white channels cannot be mixed with intermediate lights
+            return {CONF_ADD_INTERMEDIATE_LIGHT: "invalid_intermediate_lights"}
+        return {}
+
+    @callback
+    def _async_finish(self) -> config_entries.ConfigFlowResult:
+        """
+        Create the entry, or update the one being reconfigured, with the lights entered.
+
+        Returns:
+            The config flow result creating or updating the entry.
+
+        """
+        data = {**self._data, CONF_INTERMEDIATE_LIGHTS: self._intermediate_lights}
+        if self.source == config_entries.SOURCE_RECONFIGURE:
+            return self.async_update_reload_and_abort(
+                self._get_reconfigure_entry(),
+                data=data,
+            )
+        return self.async_create_entry(
+            title=data[CONF_NAME],
+            data=data,
+        )
+
     async def async_step_import(
         self,
         user_input: dict[str, Any] | None = None,
@@ -137,6 +261,17 @@ async def async_step_import(
         if user_input is None:
             return self.async_abort(reason="no_data")
 
+        try:
+            validate_channel_lights(user_input)
+        except vol.Invalid as err:
+            LOGGER.error("Invalid warm and cold lights of %s: %s", user_input[CONF_NAME], err)
+            return self.async_abort(reason="invalid_channel_lights")
+        try:
+            user_input[CONF_INTERMEDIATE_LIGHTS] = validate_intermediate_lights(user_input)
+        except vol.Invalid as err:
+            LOGGER.error("Invalid intermediate lights of %s: %s", user_input[CONF_NAME], err)
+            return self.async_abort(reason="invalid_intermediate_lights")
+
         await self.async_set_unique_id(user_input[CONF_NAME])
 
         for entry in self._async_current_entries():
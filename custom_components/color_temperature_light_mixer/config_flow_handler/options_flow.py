@@ -13,6 +13,11 @@
 from typing import Any
 
 from custom_components.color_temperature_light_mixer.config_flow_handler.schemas import get_options_schema
+from custom_components.color_temperature_light_mixer.const import (
+    CONF_COLD_LIGHT_CALIBRATION,
+    CONF_WARM_LIGHT_CALIBRATION,
+)
+from custom_components.color_temperature_light_mixer.utils.calibration import ChannelCalibration
 from homeassistant import config_entries
 
 
@@ -47,12 +52,22 @@ async def async_step_init(
             The config flow result, either showing a form or creating an options entry.
 
         """
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            for calibration in (CONF_WARM_LIGHT_CALIBRATION, CONF_COLD_LIGHT_CALIBRATION):
+                try:
+                    ChannelCalibration.from_option(user_input.get(calibration, ""))
+                except ValueError:
+                    errors[calibration] = "invalid_calibration"
+
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
-            data_schema=get_options_schema(self.config_entry.options),
+            data_schema=get_options_schema(user_input or self.config_entry.options),
+            errors=errors,
         )
 
 
@@ -21,14 +21,24 @@
 from __future__ import annotations
 
 from custom_components.color_temperature_light_mixer.config_flow_handler.schemas.config import (
+    ensure_light_lists,
+    get_import_schema,
+    get_intermediate_light_schema,
     get_reconfigure_schema,
     get_user_schema,
+    validate_channel_lights,
+    validate_intermediate_lights,
 )
 from custom_components.color_temperature_light_mixer.config_flow_handler.schemas.options import get_options_schema
 
 # Re-export all schemas for convenient imports
 __all__ = [
+    "ensure_light_lists",
+    "get_import_schema",
+    "get_intermediate_light_schema",
     "get_options_schema",
     "get_reconfigure_schema",
     "get_user_schema",
+    "validate_channel_lights",
+    "validate_intermediate_lights",
 ]
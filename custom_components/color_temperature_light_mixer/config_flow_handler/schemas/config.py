@@ -3,6 +3,7 @@
 
 Schemas for the main configuration flow steps:
 - User setup
+- YAML import
 - Reconfiguration
 
 When this file grows too large (>300 lines), consider splitting into:
@@ -18,16 +19,52 @@
 import voluptuous as vol
 
 from custom_components.color_temperature_light_mixer.const import (
+    CONF_ADD_INTERMEDIATE_LIGHT,
     CONF_COLD_LIGHT,
     CONF_COLD_LIGHT_TEMPERATURE_KELVIN,
     CONF_DEFAULT_COLD_LIGHT_TEMPERATURE,
     CONF_DEFAULT_WARM_LIGHT_TEMPERATURE,
+    CONF_INTERMEDIATE_LIGHTS,
     CONF_WARM_LIGHT,
     CONF_WARM_LIGHT_TEMPERATURE_KELVIN,
 )
+from homeassistant.components.light import ATTR_COLOR_TEMP_KELVIN
 from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
-from homeassistant.const import CONF_NAME
-from homeassistant.helpers import selector
+from homeassistant.const import CONF_ENTITY_ID, CONF_NAME
+from homeassistant.helpers import config_validation as cv, selector
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+INTERMEDIATE_LIGHTS_SCHEMA = vol.All(
+    cv.ensure_list,
+    [
+        vol.Schema(
+            {
+                vol.Required(CONF_ENTITY_ID): cv.entity_domain(LIGHT_DOMAIN),
+                vol.Required(ATTR_COLOR_TEMP_KELVIN): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            }
+        )
+    ],
+)
+
+
+def ensure_light_lists(config: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Convert the warm and cold lights of a configuration to lists of lights.
+
+    Configurations made before the channels could have several lights have a single entity id for each channel.
+
+    Args:
+        config: The configuration of the mixer.
+
+    Returns:
+        A copy of the configuration, with a list of entity ids for each of the warm and cold lights.
+
+    """
+    config = dict(config)
+    for key in (CONF_WARM_LIGHT, CONF_COLD_LIGHT):
+        if key in config:
+            config[key] = cv.ensure_list(config[key])
+    return config
 
 
 def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
@@ -41,7 +78,7 @@ def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
         Voluptuous schema for user credentials input.
 
     """
-    defaults = defaults or {}
+    defaults = ensure_light_lists(defaults or {})
     return vol.Schema(
         {
             vol.Required(
@@ -58,6 +95,7 @@ def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(
                     filter=selector.EntityFilterSelectorConfig(domain=LIGHT_DOMAIN),
+                    multiple=True,
                 )
             ),
             vol.Required(
@@ -75,6 +113,7 @@ def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(
                     filter=selector.EntityFilterSelectorConfig(domain=LIGHT_DOMAIN),
+                    multiple=True,
                 )
             ),
             vol.Required(
@@ -86,11 +125,33 @@ def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
                     unit=selector.ColorTempSelectorUnit.KELVIN,
                 ),
             ),
+            vol.Required(
+                CONF_ADD_INTERMEDIATE_LIGHT,
+                default=defaults.get(CONF_ADD_INTERMEDIATE_LIGHT, False),
+            ): selector.BooleanSelector(),
+        },
+    )
+
+
+def get_import_schema() -> vol.Schema:
+    """
+    Get schema for a mixer configured via YAML.
+
+    The intermediate lights are listed along with the warm and cold lights, instead of being entered one at a time.
+
+    Returns:
+        Voluptuous schema for the YAML configuration of a mixer.
+
+    """
+    return vol.Schema(
+        {
+            **{key: value for key, value in get_user_schema().schema.items() if key != CONF_ADD_INTERMEDIATE_LIGHT},
+            vol.Optional(CONF_INTERMEDIATE_LIGHTS): INTERMEDIATE_LIGHTS_SCHEMA,
         },
     )
 
 
-def get_reconfigure_schema(defaults: Mapping[str, str]) -> vol.Schema:
+def get_reconfigure_schema(defaults: Mapping[str, Any]) -> vol.Schema:
     """
     Get schema for reconfigure step.
 
@@ -101,6 +162,7 @@ def get_reconfigure_schema(defaults: Mapping[str, str]) -> vol.Schema:
         Voluptuous schema for reconfiguration.
 
     """
+    defaults = ensure_light_lists(defaults)
     return vol.Schema(
         {
             vol.Required(
@@ -109,6 +171,7 @@ def get_reconfigure_schema(defaults: Mapping[str, str]) -> vol.Schema:
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(
                     filter=selector.EntityFilterSelectorConfig(domain=LIGHT_DOMAIN),
+                    multiple=True,
                 )
             ),
             vol.Required(
@@ -126,6 +189,7 @@ def get_reconfigure_schema(defaults: Mapping[str, str]) -> vol.Schema:
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(
                     filter=selector.EntityFilterSelectorConfig(domain=LIGHT_DOMAIN),
+                    multiple=True,
                 )
             ),
             vol.Required(
@@ -137,11 +201,125 @@ def get_reconfigure_schema(defaults: Mapping[str, str]) -> vol.Schema:
                     unit=selector.ColorTempSelectorUnit.KELVIN,
                 ),
             ),
+            vol.Required(
+                CONF_ADD_INTERMEDIATE_LIGHT,
+                default=defaults.get(CONF_ADD_INTERMEDIATE_LIGHT, False),
+            ): selector.BooleanSelector(),
+        }
+    )
+
+
+def get_intermediate_light_schema(data: Mapping[str, Any], defaults: Mapping[str, Any] | None = None) -> vol.Schema:
+    """
+    Get schema for the intermediate light step, repeated for each intermediate light.
+
+    Args:
+        data: The configuration of the mixer, whose warm and cold temperatures bound the one of the light.
+        defaults: Optional dictionary of default values to pre-populate the form.
+
+    Returns:
+        Voluptuous schema for an intermediate light.
+
+    """
+    defaults = defaults or {}
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_ENTITY_ID,
+                default=defaults.get(CONF_ENTITY_ID, vol.UNDEFINED),
+            ): selector.EntitySelector(
+                selector.EntitySelectorConfig(
+                    filter=selector.EntityFilterSelectorConfig(domain=LIGHT_DOMAIN),
+                )
+            ),
+            vol.Required(
+                ATTR_COLOR_TEMP_KELVIN,
+                default=defaults.get(ATTR_COLOR_TEMP_KELVIN, vol.UNDEFINED),
+            ): selector.ColorTempSelector(
+                selector.ColorTempSelectorConfig(
+                    unit=selector.ColorTempSelectorUnit.KELVIN,
+                    min=data[CONF_WARM_LIGHT_TEMPERATURE_KELVIN],
+                    max=data[CONF_COLD_LIGHT_TEMPERATURE_KELVIN],
+                ),
+            ),
+            vol.Required(
+                CONF_ADD_INTERMEDIATE_LIGHT,
+                default=False,
+            ): selector.BooleanSelector(),
         }
     )
 
 
+def validate_channel_lights(data: Mapping[str, Any]) -> None:
+    """
+    Validate the lights of the warm and cold channels of a mixer.
+
+    Args:
+        data: The configuration of the mixer.
+
+    Raises:
+        vol.Invalid: If a channel has no lights, or the channels share only some of their lights. The same lights in
+            both channels are lights driving both white channels.
+
+    """
+    warm_lights = set(cv.ensure_list(data[CONF_WARM_LIGHT]))
+    cold_lights = set(cv.ensure_list(data[CONF_COLD_LIGHT]))
+    if not warm_lights or not cold_lights:
+        raise vol.Invalid("The warm and cold lights must have at least one light each")
+    if warm_lights != cold_lights and warm_lights & cold_lights:
+        raise vol.Invalid(f"{', '.join(sorted(warm_lights & cold_lights))} cannot be both warm and cold lights")
+
+
+def validate_intermediate_lights(data: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """
+    Validate the intermediate lights of a mixer.
+
+    Args:
+        data: The configuration of the mixer, including the warm and cold lights.
+
+    Returns:
+        The intermediate lights, each with its entity id and temperature in Kelvin.
+
+    Raises:
+        vol.Invalid: If a light is malformed or repeated, or its temperature is not strictly between the ones of the
+            warm and cold lights and different from the others, or the warm and cold lights are the same lights.
+
+    """
+    lights = INTERMEDIATE_LIGHTS_SCHEMA(data.get(CONF_INTERMEDIATE_LIGHTS) or [])
+    warm_lights = set(cv.ensure_list(data[CONF_WARM_LIGHT]))
+    cold_lights = set(cv.ensure_list(data[CONF_COLD_LIGHT]))
+    if lights and warm_lights == cold_lights:
+        # The mixer sets such lights with an RGBWW color packing the warm and cold channels only
+        raise vol.Invalid("Lights driving both white channels cannot be mixed with intermediate lights")
+
+    entity_ids = warm_lights | cold_lights
+    warm_mired = color_temperature_kelvin_to_mired(data[CONF_WARM_LIGHT_TEMPERATURE_KELVIN])
+    cold_mired = color_temperature_kelvin_to_mired(data[CONF_COLD_LIGHT_TEMPERATURE_KELVIN])
+    mireds = {warm_mired, cold_mired}
+    for light in lights:
+        if light[CONF_ENTITY_ID] in entity_ids:
+            raise vol.Invalid(f"{light[CONF_ENTITY_ID]} is used more than once")
+        entity_ids.add(light[CONF_ENTITY_ID])
+
+        # The mixer distinguishes the lights by their temperatures in mired
+        mired = color_temperature_kelvin_to_mired(light[ATTR_COLOR_TEMP_KELVIN])
+        if not cold_mired < mired < warm_mired or mired in mireds:
+            raise vol.Invalid(
+                f"The temperature of {light[CONF_ENTITY_ID]} must be between the ones of the warm and cold lights, "
+                "and different from the ones of the other lights"
+            )
+        mireds.add(mired)
+
+    return lights
+
+
 __all__ = [
+    "INTERMEDIATE_LIGHTS_SCHEMA",
+    "ensure_light_lists",
+    "get_import_schema",
+    "get_intermediate_light_schema",
     "get_reconfigure_schema",
     "get_user_schema",
+    "validate_channel_lights",
+    "validate_intermediate_lights",
 ]
@@ -17,6 +17,45 @@
 
 import voluptuous as vol
 
+from custom_components.color_temperature_light_mixer.const import (
+    CONF_AWAIT_DISPATCH,
+    CONF_BRIGHTNESS_CACHE_SIZE,
+    CONF_BRIGHTNESS_LOOKUP_TABLE,
+    CONF_CIRCADIAN,
+    CONF_COLD_LIGHT_CALIBRATION,
+    CONF_DISPATCH_TIMEOUT,
+    CONF_FIXED_POINT_ARITHMETIC,
+    CONF_LAZY_TEMPERATURE_LOOKUP_TABLE,
+    CONF_MAX_CONCURRENT_LIGHTS,
+    CONF_MAX_DISPATCH_RATE,
+    CONF_MIXED_TEMPERATURE_WEIGHT,
+    CONF_OPTIMISTIC,
+    CONF_SKIP_UNCHANGED_LIGHTS,
+    CONF_SOFTWARE_TRANSITION,
+    CONF_STATE_WRITE_WINDOW,
+    CONF_TRACE_SAMPLE_INTERVAL,
+    CONF_TRANSITION_FRAME_RATE,
+    CONF_WARM_LIGHT_CALIBRATION,
+    DEFAULT_AWAIT_DISPATCH,
+    DEFAULT_BRIGHTNESS_CACHE_SIZE,
+    DEFAULT_BRIGHTNESS_LOOKUP_TABLE,
+    DEFAULT_CIRCADIAN,
+    DEFAULT_DISPATCH_TIMEOUT,
+    DEFAULT_FIXED_POINT_ARITHMETIC,
+    DEFAULT_LAZY_TEMPERATURE_LOOKUP_TABLE,
+    DEFAULT_LIGHT_CALIBRATION,
+    DEFAULT_MAX_CONCURRENT_LIGHTS,
+    DEFAULT_MAX_DISPATCH_RATE,
+    DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_SKIP_UNCHANGED_LIGHTS,
+    DEFAULT_SOFTWARE_TRANSITION,
+    DEFAULT_STATE_WRITE_WINDOW,
+    DEFAULT_TRACE_SAMPLE_INTERVAL,
+    DEFAULT_TRANSITION_FRAME_RATE,
+)
+from homeassistant.helpers import selector
+
 
 def get_options_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
     """
@@ -30,7 +69,161 @@ def get_options_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
 
     """
     defaults = defaults or {}
-    return vol.Schema({})
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_MIXED_TEMPERATURE_WEIGHT,
+                default=defaults.get(CONF_MIXED_TEMPERATURE_WEIGHT, DEFAULT_MIXED_TEMPERATURE_WEIGHT),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0.1,
+                    max=10,
+                    step=0.1,
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Required(
+                CONF_BRIGHTNESS_LOOKUP_TABLE,
+                default=defaults.get(CONF_BRIGHTNESS_LOOKUP_TABLE, DEFAULT_BRIGHTNESS_LOOKUP_TABLE),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_LAZY_TEMPERATURE_LOOKUP_TABLE,
+                default=defaults.get(CONF_LAZY_TEMPERATURE_LOOKUP_TABLE, DEFAULT_LAZY_TEMPERATURE_LOOKUP_TABLE),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_BRIGHTNESS_CACHE_SIZE,
+                default=defaults.get(CONF_BRIGHTNESS_CACHE_SIZE, DEFAULT_BRIGHTNESS_CACHE_SIZE),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=65536,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+            vol.Required(
+                CONF_TRACE_SAMPLE_INTERVAL,
+                default=defaults.get(CONF_TRACE_SAMPLE_INTERVAL, DEFAULT_TRACE_SAMPLE_INTERVAL),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=1000,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+            vol.Required(
+                CONF_FIXED_POINT_ARITHMETIC,
+                default=defaults.get(CONF_FIXED_POINT_ARITHMETIC, DEFAULT_FIXED_POINT_ARITHMETIC),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_WARM_LIGHT_CALIBRATION,
+                default=defaults.get(CONF_WARM_LIGHT_CALIBRATION, DEFAULT_LIGHT_CALIBRATION),
+            ): selector.TextSelector(),
+            vol.Required(
+                CONF_COLD_LIGHT_CALIBRATION,
+                default=defaults.get(CONF_COLD_LIGHT_CALIBRATION, DEFAULT_LIGHT_CALIBRATION),
+            ): selector.TextSelector(),
+            vol.Required(
+                CONF_STATE_WRITE_WINDOW,
+                default=defaults.get(CONF_STATE_WRITE_WINDOW, DEFAULT_STATE_WRITE_WINDOW),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=1000,
+                        step=1,
+                        unit_of_measurement="ms",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+            vol.Required(
+                CONF_OPTIMISTIC,
+                default=defaults.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_AWAIT_DISPATCH,
+                default=defaults.get(CONF_AWAIT_DISPATCH, DEFAULT_AWAIT_DISPATCH),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_DISPATCH_TIMEOUT,
+                default=defaults.get(CONF_DISPATCH_TIMEOUT, DEFAULT_DISPATCH_TIMEOUT),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=100,
+                        max=60000,
+                        step=100,
+                        unit_of_measurement="ms",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+            vol.Required(
+                CONF_MAX_DISPATCH_RATE,
+                default=defaults.get(CONF_MAX_DISPATCH_RATE, DEFAULT_MAX_DISPATCH_RATE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=50,
+                    step=0.5,
+                    unit_of_measurement="commands/s",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Required(
+                CONF_SKIP_UNCHANGED_LIGHTS,
+                default=defaults.get(CONF_SKIP_UNCHANGED_LIGHTS, DEFAULT_SKIP_UNCHANGED_LIGHTS),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_SOFTWARE_TRANSITION,
+                default=defaults.get(CONF_SOFTWARE_TRANSITION, DEFAULT_SOFTWARE_TRANSITION),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_TRANSITION_FRAME_RATE,
+                default=defaults.get(CONF_TRANSITION_FRAME_RATE, DEFAULT_TRANSITION_FRAME_RATE),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=50,
+                        step=1,
+                        unit_of_measurement="frames/s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+            vol.Required(
+                CONF_CIRCADIAN,
+                default=defaults.get(CONF_CIRCADIAN, DEFAULT_CIRCADIAN),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_MAX_CONCURRENT_LIGHTS,
+                default=defaults.get(CONF_MAX_CONCURRENT_LIGHTS, DEFAULT_MAX_CONCURRENT_LIGHTS),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=100,
+                        step=1,
+                        unit_of_measurement="lights",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+        },
+    )
 
 
 __all__ = [
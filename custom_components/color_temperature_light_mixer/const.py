@@ -1,5 +1,6 @@
 """Constants for color_temperature_light_mixer."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 from homeassistant.components.light import ATTR_COLOR_TEMP_KELVIN
@@ -17,8 +18,75 @@
 CONF_WARM_LIGHT_TEMPERATURE_KELVIN = f"warm_light_{ATTR_COLOR_TEMP_KELVIN}"
 CONF_COLD_LIGHT = f"cold_light_{CONF_ENTITY_ID}"
 CONF_COLD_LIGHT_TEMPERATURE_KELVIN = f"cold_light_{ATTR_COLOR_TEMP_KELVIN}"
+# Lights with temperatures between the warm and cold ones, each with its CONF_ENTITY_ID and ATTR_COLOR_TEMP_KELVIN
+CONF_INTERMEDIATE_LIGHTS = "intermediate_lights"
+# Field of the config flow asking for one more intermediate light, entered in a step of its own
+CONF_ADD_INTERMEDIATE_LIGHT = "add_intermediate_light"
 
 CONF_DEFAULT_WARM_LIGHT_TEMPERATURE = 3000
 CONF_DEFAULT_COLD_LIGHT_TEMPERATURE = 6000
 
 BRIGHTNESS_RANGE = (1, 255)
+
+# Options
+CONF_MIXED_TEMPERATURE_WEIGHT = "mixed_temperature_weight"
+CONF_BRIGHTNESS_LOOKUP_TABLE = "brightness_lookup_table"
+CONF_LAZY_TEMPERATURE_LOOKUP_TABLE = "lazy_temperature_lookup_table"
+CONF_BRIGHTNESS_CACHE_SIZE = "brightness_cache_size"
+CONF_TRACE_SAMPLE_INTERVAL = "trace_sample_interval"
+CONF_FIXED_POINT_ARITHMETIC = "fixed_point_arithmetic"
+CONF_WARM_LIGHT_CALIBRATION = "warm_light_calibration"
+CONF_COLD_LIGHT_CALIBRATION = "cold_light_calibration"
+CONF_STATE_WRITE_WINDOW = "state_write_window"
+CONF_OPTIMISTIC = "optimistic"
+CONF_AWAIT_DISPATCH = "await_dispatch"
+CONF_DISPATCH_TIMEOUT = "dispatch_timeout"
+CONF_MAX_DISPATCH_RATE = "max_dispatch_rate"
+CONF_SKIP_UNCHANGED_LIGHTS = "skip_unchanged_lights"
+CONF_SOFTWARE_TRANSITION = "software_transition"
+CONF_TRANSITION_FRAME_RATE = "transition_frame_rate"
+CONF_CIRCADIAN = "circadian"
+CONF_MAX_CONCURRENT_LIGHTS = "max_concurrent_lights"
+
+DEFAULT_MIXED_TEMPERATURE_WEIGHT = 1.0
+DEFAULT_BRIGHTNESS_LOOKUP_TABLE = False
+DEFAULT_LAZY_TEMPERATURE_LOOKUP_TABLE = True
+DEFAULT_BRIGHTNESS_CACHE_SIZE = 256
+DEFAULT_TRACE_SAMPLE_INTERVAL = 1
+DEFAULT_FIXED_POINT_ARITHMETIC = False
+# Lights whose output is linear in their brightness
+DEFAULT_LIGHT_CALIBRATION = ""
+# Milliseconds, long enough to catch the updates of both lights after a command
+DEFAULT_STATE_WRITE_WINDOW = 50
+DEFAULT_OPTIMISTIC = False
+DEFAULT_AWAIT_DISPATCH = False
+# Milliseconds
+DEFAULT_DISPATCH_TIMEOUT = 10000
+# Commands per second to each light, 0 for no limit
+DEFAULT_MAX_DISPATCH_RATE = 0
+DEFAULT_SKIP_UNCHANGED_LIGHTS = True
+DEFAULT_SOFTWARE_TRANSITION = False
+# Frames per second
+DEFAULT_TRANSITION_FRAME_RATE = 10
+DEFAULT_CIRCADIAN = False
+# Lights commanded at the same time, 0 for a single call to all the lights of a channel
+DEFAULT_MAX_CONCURRENT_LIGHTS = 0
+
+# Maximum number of Newton iterations used to project an unreachable target on the achievable curve
+MIXED_SOLVER_MAX_ITERATIONS = 50
+
+# Number of targets projected at once by the batch MIXED solver, bounding its temporary memory
+BATCH_MIXED_CHUNK_SIZE = 4096
+
+# Upper bound of the memory taken by the brightness lookup tables of a single mixer
+BRIGHTNESS_TABLE_MAX_BYTES = 1024 * 1024
+
+# Fractional bits of the reciprocal used by the fixed-point decomposition, rounding exactly the brightnesses of any
+# mixer spanning less than 2000 mireds, i.e. of any pair of lights warmer than 500K
+FIXED_POINT_SHIFT = 32
+
+# Interval between the updates of the mixers following the daylight curve
+CIRCADIAN_UPDATE_INTERVAL = timedelta(minutes=1)
+
+# Number of the most recent round trips of each light kept to compute its latency percentiles
+DISPATCH_LATENCY_SAMPLES = 100
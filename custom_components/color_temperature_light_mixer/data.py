@@ -10,12 +10,18 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from enum import StrEnum, auto
+import math
 from typing import TYPE_CHECKING, Any, Self
 
+from homeassistant.components.light import ATTR_BRIGHTNESS
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.helpers.restore_state import ExtraStoredData
 
+from .const import DISPATCH_LATENCY_SAMPLES
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
@@ -24,6 +30,82 @@
 type ColorTemperatureMixerConfigEntry = ConfigEntry[ColorTemperatureMixerData]
 
 
+@dataclass(slots=True)
+class ChildLatencyStats:
+    """Round trips of the commands awaited from a light, and the commands it did not complete."""
+
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=DISPATCH_LATENCY_SAMPLES))
+    """Seconds taken by the most recent commands completed by the light"""
+    timeouts: int = 0
+    """Commands not completed within the timeout"""
+    failures: int = 0
+    """Commands that raised an error"""
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the latency below which the given percent of the recent commands completed, None without any."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        # Nearest rank
+        return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the latencies in milliseconds and the counters, for the diagnostics."""
+
+        def milliseconds(seconds: float | None) -> float | None:
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        return {
+            "samples": len(self.latencies),
+            "p50_ms": milliseconds(self.percentile(50)),
+            "p95_ms": milliseconds(self.percentile(95)),
+            "max_ms": milliseconds(max(self.latencies, default=None)),
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+        }
+
+
+@dataclass(slots=True)
+class DispatchStats:
+    """Counters of the commands forwarded to the lights of a mixer, and of the service calls carrying them."""
+
+    commands: int = 0
+    """Commands addressed to a single light"""
+    calls: int = 0
+    """Service calls made, each carrying the commands of one or more lights"""
+    skipped: int = 0
+    """Commands not forwarded since they would not change the light"""
+    children: dict[str, ChildLatencyStats] = field(default_factory=dict)
+    """Latencies of the lights, by entity id, when the service calls are awaited"""
+
+    @property
+    def calls_saved(self) -> int:
+        """Return the number of service calls saved by addressing several lights with a single call."""
+        return self.commands - self.calls
+
+    def record(self, commands: int, calls: int, skipped: int = 0) -> None:
+        """Record the service calls made to forward commands to the lights, and the commands skipped."""
+        self.commands += commands
+        self.calls += calls
+        self.skipped += skipped
+
+    def child(self, entity_id: str) -> ChildLatencyStats:
+        """Return the latencies of a light, creating them on its first command."""
+        if (stats := self.children.get(entity_id)) is None:
+            stats = self.children[entity_id] = ChildLatencyStats()
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, for the diagnostics."""
+        return {
+            "commands": self.commands,
+            "calls": self.calls,
+            "calls_saved": self.calls_saved,
+            "skipped": self.skipped,
+            "children": {entity_id: stats.as_dict() for entity_id, stats in self.children.items()},
+        }
+
+
 @dataclass
 class ColorTemperatureMixerData:
     """Runtime data for color_temperature_light_mixer config entries.
@@ -33,6 +115,8 @@ class ColorTemperatureMixerData:
     """
 
     integration: Integration
+    dispatch_stats: DispatchStats = field(default_factory=DispatchStats)
+    """Service calls forwarded to the lights of the mixer"""
 
 
 @dataclass
@@ -40,18 +124,68 @@ class ChildLightState:
     """Information about a light entity used as a child in the the light group."""
 
     entity_id: str
+    """Entity id of the light, the first one of a channel of several lights"""
     color_temp_kelvin: int
     brightness: int
+    """Brightness of the light, 0 when it is not on"""
+
+    state: str | None = None
+    """State of the light, None when it does not exist"""
+    supported_features: int = 0
+    """Features supported by the light"""
+    members: tuple[ChildLightState, ...] = ()
+    """Lights of a channel of several lights of the same temperature, whose aggregated state is this one"""
+    effect_list: list[str] | None = None
+    """Effects supported by the light"""
+    effect: str | None = None
+    """Effect of the light, if on"""
+    assumed_state: bool = False
+    """Whether the state of the light is assumed"""
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """Return the entity ids of the lights of the channel."""
+        return [member.entity_id for member in self.members] if self.members else [self.entity_id]
+
+    def aggregate_members(self) -> None:
+        """Aggregate the states of the lights of the channel: on if any of them is on, with their average brightness.
+
+        The lights without a known state are left out, the channel is unknown or unavailable only if all of them are.
+        """
+
+        known = [member for member in self.members if member.state in (STATE_ON, STATE_OFF)]
+        if known:
+            self.state = STATE_ON if any(member.state == STATE_ON for member in known) else STATE_OFF
+            self.brightness = round(sum(member.brightness for member in known) / len(known))
+        else:
+            states = {member.state for member in self.members}
+            self.state = (
+                STATE_UNKNOWN if STATE_UNKNOWN in states else STATE_UNAVAILABLE if STATE_UNAVAILABLE in states else None
+            )
+            self.brightness = 0
+
+        supported_features = 0
+        for member in self.members:
+            supported_features |= member.supported_features
+        self.supported_features = supported_features
 
 
 @dataclass
 class TurnOnSettings:
-    """Options to pass to the light to be turned on."""
+    """Options to pass to the lights of a channel to be turned on."""
 
-    entity_id: str
-    common_data: dict[str, int]
+    entity_ids: list[str]
+    common_data: dict[str, Any]
     brightness: int | None = None
 
+    @property
+    def service_data(self) -> dict[str, Any]:
+        """Return the data of the turn on service call of the light."""
+
+        if self.brightness is None:
+            return self.common_data
+        return {**self.common_data, ATTR_BRIGHTNESS: self.brightness}
+
 
 class BrightnessTemperaturePriority(StrEnum):
     """Enum that indicates what to prefer in the computation of the target brightness required to (temperature, brightness) target tuple."""
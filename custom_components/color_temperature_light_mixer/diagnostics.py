@@ -12,6 +12,8 @@
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.redact import async_redact_data
 
+from .utils.cache import BRIGHTNESS_CACHE
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -84,4 +86,10 @@ async def async_get_config_entry_diagnostics(
         "options": async_redact_data(entry.options, TO_REDACT),
     }
 
-    return {"entry": entry_info, "integration": integration_info, "devices": device_info}
+    return {
+        "entry": entry_info,
+        "integration": integration_info,
+        "devices": device_info,
+        "brightness_cache": BRIGHTNESS_CACHE.stats(),
+        "dispatch": entry.runtime_data.dispatch_stats.as_dict(),
+    }
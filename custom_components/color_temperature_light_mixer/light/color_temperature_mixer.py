@@ -3,16 +3,54 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+from functools import partial
+import time
 from typing import Any
 
-from graphql import UndefinedType
-
 from custom_components.color_temperature_light_mixer.const import (
+    BRIGHTNESS_RANGE,
+    CONF_AWAIT_DISPATCH,
+    CONF_BRIGHTNESS_LOOKUP_TABLE,
+    CONF_CIRCADIAN,
     CONF_COLD_LIGHT,
+    CONF_COLD_LIGHT_CALIBRATION,
     CONF_COLD_LIGHT_TEMPERATURE_KELVIN,
+    CONF_DISPATCH_TIMEOUT,
+    CONF_FIXED_POINT_ARITHMETIC,
+    CONF_INTERMEDIATE_LIGHTS,
+    CONF_LAZY_TEMPERATURE_LOOKUP_TABLE,
+    CONF_MAX_CONCURRENT_LIGHTS,
+    CONF_MAX_DISPATCH_RATE,
+    CONF_MIXED_TEMPERATURE_WEIGHT,
+    CONF_OPTIMISTIC,
+    CONF_SKIP_UNCHANGED_LIGHTS,
+    CONF_SOFTWARE_TRANSITION,
+    CONF_STATE_WRITE_WINDOW,
+    CONF_TRACE_SAMPLE_INTERVAL,
+    CONF_TRANSITION_FRAME_RATE,
     CONF_WARM_LIGHT,
+    CONF_WARM_LIGHT_CALIBRATION,
     CONF_WARM_LIGHT_TEMPERATURE_KELVIN,
+    DEFAULT_AWAIT_DISPATCH,
+    DEFAULT_BRIGHTNESS_LOOKUP_TABLE,
+    DEFAULT_CIRCADIAN,
+    DEFAULT_DISPATCH_TIMEOUT,
+    DEFAULT_FIXED_POINT_ARITHMETIC,
+    DEFAULT_LAZY_TEMPERATURE_LOOKUP_TABLE,
+    DEFAULT_LIGHT_CALIBRATION,
+    DEFAULT_MAX_CONCURRENT_LIGHTS,
+    DEFAULT_MAX_DISPATCH_RATE,
+    DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_SKIP_UNCHANGED_LIGHTS,
+    DEFAULT_SOFTWARE_TRANSITION,
+    DEFAULT_STATE_WRITE_WINDOW,
+    DEFAULT_TRACE_SAMPLE_INTERVAL,
+    DEFAULT_TRANSITION_FRAME_RATE,
+    DOMAIN,
     LOGGER,
 )
 from custom_components.color_temperature_light_mixer.data import (
@@ -23,16 +61,78 @@
     TurnOnSettings,
 )
 from custom_components.color_temperature_light_mixer.entity import ColorTemperatureMixerEntity
-from custom_components.color_temperature_light_mixer.utils.calculator import BrightnessCalculator, TemperatureCalculator
-from homeassistant.components.group.light import FORWARDED_ATTRIBUTES, LightGroup
-from homeassistant.components.group.util import find_state_attributes
-from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_COLOR_TEMP_KELVIN
+from custom_components.color_temperature_light_mixer.scheduler import async_get_circadian_scheduler
+from custom_components.color_temperature_light_mixer.state_dispatcher import async_get_child_state_dispatcher
+from custom_components.color_temperature_light_mixer.utils.cache import BRIGHTNESS_CACHE
+from custom_components.color_temperature_light_mixer.utils.calibration import ChannelCalibration
+from custom_components.color_temperature_light_mixer.utils.circadian import circadian_temperature
+from custom_components.color_temperature_light_mixer.utils.lookup_tables import (
+    BrightnessLookupTable,
+    TemperatureLookupTable,
+)
+from custom_components.color_temperature_light_mixer.utils.mixer_model import FixedPointMixerModel, MixerModel
+from custom_components.color_temperature_light_mixer.utils.multi_channel import MultiChannelModel
+from custom_components.color_temperature_light_mixer.utils.tracing import MixerLoggerAdapter, MixerTracer
+from custom_components.color_temperature_light_mixer.utils.transition import TransitionPlan
+from homeassistant.components.group.light import FORWARDED_ATTRIBUTES, SUPPORT_GROUP_LIGHT, LightGroup
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_EFFECT,
+    ATTR_EFFECT_LIST,
+    ATTR_RGBWW_COLOR,
+    ATTR_TRANSITION,
+    LightEntityFeature,
+)
 from homeassistant.components.light.const import DOMAIN as DOMAIN_LIGHT, ColorMode
-from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON, STATE_ON
-from homeassistant.core import State, callback
+from homeassistant.const import (
+    ATTR_ASSUMED_STATE,
+    ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
+    CONF_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, start
 from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
 
+# States of a light, None if it does not exist, making the mixer state unknown or unavailable
+INVALID_STATES = (None, STATE_UNKNOWN, STATE_UNAVAILABLE)
+UNAVAILABLE_STATES = (None, STATE_UNAVAILABLE)
+# Attributes of a command translated by the mixer into the brightnesses of the lights
+MIXER_ATTRIBUTES = frozenset((ATTR_BRIGHTNESS, ATTR_COLOR_TEMP_KELVIN))
+
+
+def _raise_first_error(results: list[Any]) -> None:
+    """Raise the first error of the calls gathered, once all of them are done."""
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def _channel(entity_ids: str | list[str], color_temp_kelvin: int) -> ChildLightState:
+    """Return the state of a channel of one or more lights of the same temperature, commanded together."""
+
+    entity_ids = cv.ensure_list(entity_ids)
+    if len(entity_ids) == 1:
+        return ChildLightState(entity_ids[0], color_temp_kelvin, 0)
+    return ChildLightState(
+        entity_ids[0],
+        color_temp_kelvin,
+        0,
+        members=tuple(ChildLightState(entity_id, color_temp_kelvin, 0) for entity_id in entity_ids),
+    )
+
+
 ENTITY_DESCRIPTIONS = (
     EntityDescription(
         key="color_temperature_mixer",
@@ -45,38 +145,166 @@
 class ColorTemperatureMixerLight(LightGroup, ColorTemperatureMixerEntity, RestoreEntity):
     """Light group that mixes a group of lights having different color temperatures."""
 
-    # overridden in async_update_group_state()
-    _attr_color_mode = ColorMode.COLOR_TEMP
-    _attr_supported_color_modes = {ColorMode.COLOR_TEMP}
-
     __last_turned_on_brightness: int | None = None
     __last_turned_on_temperature: int | None = None
 
     def __init__(self, config_entry: ColorTemperatureMixerConfigEntry, entity_description: EntityDescription) -> None:
         """Initialize the CCT light group."""
 
+        # The warm and cold channels may each be made of several lights, whose state is aggregated
+        self.__warm_light = _channel(
+            config_entry.data[CONF_WARM_LIGHT], config_entry.data[CONF_WARM_LIGHT_TEMPERATURE_KELVIN]
+        )
+        self.__cold_light = _channel(
+            config_entry.data[CONF_COLD_LIGHT], config_entry.data[CONF_COLD_LIGHT_TEMPERATURE_KELVIN]
+        )
+        # All the channels from the warmest to the coldest, the intermediate ones being mixed with their neighbours
+        self.__lights: tuple[ChildLightState, ...] = (
+            self.__warm_light,
+            *sorted(
+                (
+                    _channel(light[CONF_ENTITY_ID], light[ATTR_COLOR_TEMP_KELVIN])
+                    for light in config_entry.data.get(CONF_INTERMEDIATE_LIGHTS, ())
+                ),
+                key=lambda light: light.color_temp_kelvin,
+            ),
+            self.__cold_light,
+        )
+        # The channels driven by each entity, along with the state of the entity in each channel: both the warm and
+        # cold ones for a light with two white channels
+        self.__lights_by_entity_id: dict[str, tuple[tuple[ChildLightState, ChildLightState], ...]] = {}
+        for channel in self.__lights:
+            for light in channel.members or (channel,):
+                self.__lights_by_entity_id[light.entity_id] = (
+                    *self.__lights_by_entity_id.get(light.entity_id, ()),
+                    (channel, light),
+                )
+        # Lights driving both white channels, e.g. RGBWW lights, are set with their RGBWW color. The channels are
+        # compared as sets, as the config flow does, since they may list the lights in any order
+        self.__rgbww_output = set(self.__warm_light.entity_ids) == set(self.__cold_light.entity_ids)
+        # Rejected by validate_intermediate_lights, since _turn_on_rgbww_light packs the warm and cold channels only
+        assert not self.__rgbww_output or len(self.__lights) == 2, "Intermediate lights mixed with an RGBWW output"
+
         LightGroup.__init__(
             self,
             unique_id=config_entry.entry_id,
             name=None,  # pyright: ignore[reportArgumentType] Inherit device name, since it is the main feature of the device
-            entity_ids=[config_entry.data[CONF_WARM_LIGHT], config_entry.data[CONF_COLD_LIGHT]],
+            entity_ids=list(self.__lights_by_entity_id),
             mode=False,
         )
+        # COLOR_TEMP is always the only supported and current mode, since it is the main feature of the group
+        self._attr_color_mode = ColorMode.COLOR_TEMP
+        self._attr_supported_color_modes = {ColorMode.COLOR_TEMP}
         ColorTemperatureMixerEntity.__init__(
             self,
             config_entry=config_entry,
             entity_description=entity_description,
         )
 
+        self.__log = MixerLoggerAdapter(LOGGER, self._friendly_name)
+        self.__tracer = MixerTracer(
+            self.__log, config_entry.options.get(CONF_TRACE_SAMPLE_INTERVAL, DEFAULT_TRACE_SAMPLE_INTERVAL)
+        )
+
         self._attr_min_color_temp_kelvin = config_entry.data[CONF_WARM_LIGHT_TEMPERATURE_KELVIN]
         self._attr_max_color_temp_kelvin = config_entry.data[CONF_COLD_LIGHT_TEMPERATURE_KELVIN]
 
-        self.__warm_light: ChildLightState = ChildLightState(
-            config_entry.data[CONF_WARM_LIGHT], config_entry.data[CONF_WARM_LIGHT_TEMPERATURE_KELVIN], 0
+        self.__temperature_weight: float = config_entry.options.get(
+            CONF_MIXED_TEMPERATURE_WEIGHT, DEFAULT_MIXED_TEMPERATURE_WEIGHT
+        )
+        # Constants of the mixer, shared by all the brightness and temperature computations
+        model_type = (
+            FixedPointMixerModel
+            if config_entry.options.get(CONF_FIXED_POINT_ARITHMETIC, DEFAULT_FIXED_POINT_ARITHMETIC)
+            else MixerModel
+        )
+        self.__model = model_type.from_kelvin(
+            self.__warm_light.color_temp_kelvin, self.__cold_light.color_temp_kelvin, self.__temperature_weight
+        )
+        # Model of each pair of adjacent lights, None with the warm and cold lights only
+        self.__channel_model: MultiChannelModel | None = (
+            MultiChannelModel.from_kelvin(
+                [light.color_temp_kelvin for light in self.__lights], self.__temperature_weight, model_type
+            )
+            if len(self.__lights) > 2
+            else None
         )
-        self.__cold_light: ChildLightState = ChildLightState(
-            config_entry.data[CONF_COLD_LIGHT], config_entry.data[CONF_COLD_LIGHT_TEMPERATURE_KELVIN], 0
+        # Outputs of the lights at each brightness, compiled once, None for the lights whose output is linear
+        self.__warm_calibration = ChannelCalibration.from_option(
+            config_entry.options.get(CONF_WARM_LIGHT_CALIBRATION, DEFAULT_LIGHT_CALIBRATION)
         )
+        self.__cold_calibration = ChannelCalibration.from_option(
+            config_entry.options.get(CONF_COLD_LIGHT_CALIBRATION, DEFAULT_LIGHT_CALIBRATION)
+        )
+        self.__calibrations: tuple[ChannelCalibration | None, ...] = (
+            self.__warm_calibration,
+            *(None for _ in self.__lights[1:-1]),
+            self.__cold_calibration,
+        )
+        # The lookup tables cover the warm and cold lights only
+        self.__use_brightness_table: bool = self.__channel_model is None and config_entry.options.get(
+            CONF_BRIGHTNESS_LOOKUP_TABLE, DEFAULT_BRIGHTNESS_LOOKUP_TABLE
+        )
+        self.__brightness_table: BrightnessLookupTable | None = None
+        self.__lazy_temperature_table: bool = self.__channel_model is None and config_entry.options.get(
+            CONF_LAZY_TEMPERATURE_LOOKUP_TABLE, DEFAULT_LAZY_TEMPERATURE_LOOKUP_TABLE
+        )
+        # A lazy table is filled on demand, so it is cheap to allocate here
+        self.__temperature_table: TemperatureLookupTable | None = (
+            TemperatureLookupTable(
+                self.__warm_light.color_temp_kelvin,
+                self.__cold_light.color_temp_kelvin,
+                lazy=True,
+                warm_calibration=self.__warm_calibration,
+                cold_calibration=self.__cold_calibration,
+            )
+            if self.__lazy_temperature_table
+            else None
+        )
+        # Updates of the lights arriving within this many seconds from the first one are written as a single state
+        self.__state_write_window: float = (
+            config_entry.options.get(CONF_STATE_WRITE_WINDOW, DEFAULT_STATE_WRITE_WINDOW) / 1000
+        )
+        self.__cancel_state_write: Callable[[], None] | None = None
+        self.__dispatch_stats = config_entry.runtime_data.dispatch_stats
+        # Wait for the lights to complete each command, measuring their latency, for at most the timeout in seconds
+        self.__await_dispatch: bool = config_entry.options.get(CONF_AWAIT_DISPATCH, DEFAULT_AWAIT_DISPATCH)
+        self.__dispatch_timeout: float = (
+            config_entry.options.get(CONF_DISPATCH_TIMEOUT, DEFAULT_DISPATCH_TIMEOUT) / 1000
+        )
+        # Commands received while the previous one is being forwarded, or sooner than the interval in seconds allowed by
+        # the maximum rate, are queued: only the most recent one is kept and forwarded once possible
+        max_dispatch_rate: float = config_entry.options.get(CONF_MAX_DISPATCH_RATE, DEFAULT_MAX_DISPATCH_RATE)
+        self.__dispatch_interval = 1 / max_dispatch_rate if max_dispatch_rate else 0.0
+        self.__next_dispatch = 0.0
+        self.__dispatch_lock = asyncio.Lock()
+        self.__queued_command: tuple[TurnOnSettings, ...] | None = None
+        # Do not forward a brightness that a light already has
+        self.__skip_unchanged_lights: bool = config_entry.options.get(
+            CONF_SKIP_UNCHANGED_LIGHTS, DEFAULT_SKIP_UNCHANGED_LIGHTS
+        )
+        # Run the transitions in the integration, sending the intermediate brightnesses to the lights
+        self.__software_transition: bool = config_entry.options.get(
+            CONF_SOFTWARE_TRANSITION, DEFAULT_SOFTWARE_TRANSITION
+        )
+        self.__transition_frame_interval: float = 1 / config_entry.options.get(
+            CONF_TRANSITION_FRAME_RATE, DEFAULT_TRANSITION_FRAME_RATE
+        )
+        self.__transition_task: asyncio.Task | None = None
+        # Follow the daylight curve, moved by the scheduler shared by all the mixers
+        self.__circadian: bool = config_entry.options.get(CONF_CIRCADIAN, DEFAULT_CIRCADIAN)
+        # Brightness of the last command, kept by the circadian updates instead of the one the lights could reach
+        self.__requested_brightness: int | None = None
+        self.__command_worker: asyncio.Task | None = None
+        # Command each light on its own, at most this many at a time, instead of a single call per channel
+        max_concurrent_lights: int = config_entry.options.get(CONF_MAX_CONCURRENT_LIGHTS, DEFAULT_MAX_CONCURRENT_LIGHTS)
+        self.__light_semaphore = asyncio.Semaphore(max_concurrent_lights) if max_concurrent_lights else None
+        # Calls to each light on its own not awaited by the commands, cancelled along with the mixer
+        self.__fan_out_tasks: set[asyncio.Task] = set()
+        # Write the requested state right away, then skip the updates of the lights confirming it
+        self.__optimistic: bool = config_entry.options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC)
+        # Brightnesses sent to the lights by the last optimistic command, until each light confirms them
+        self.__expected_brightnesses: dict[str, tuple[int, ...]] = {}
 
     async def async_internal_added_to_hass(self) -> None:
         """
@@ -86,22 +314,156 @@ async def async_internal_added_to_hass(self) -> None:
         """
 
         await super().async_internal_added_to_hass()
+        # The entity id and name are now available
+        self.__log.refresh_name()
 
         if (
             (state := await self.async_get_last_state())
             and state.state is not None
             and (previous := await self.async_get_last_stored_data())
         ):
-            LOGGER.debug("%s: restoring state data: %s", self._friendly_name(), previous)
+            self.__log.debug("restoring state data: %s", previous)
             self.__last_turned_on_brightness = previous.brightness
             self.__last_turned_on_temperature = previous.color_temperature
 
-        # Continue initialization of parent object
-        await super().async_added_to_hass()
+        if self.__use_brightness_table:
+            # Build the table in the background, until it is ready the brightnesses are computed on each call
+            self.hass.async_create_background_task(
+                self._async_build_brightness_table(),
+                name=f"{DOMAIN} brightness lookup table for {self.entity_id}",
+            )
+
+        if self.__temperature_table is None and self.__channel_model is None:
+            # Fill the table in the background, until it is ready the temperature is computed on each state change
+            self.hass.async_create_background_task(
+                self._async_build_temperature_table(),
+                name=f"{DOMAIN} temperature lookup table for {self.entity_id}",
+            )
+
+    async def async_added_to_hass(self) -> None:
+        """Track the state changes of the lights.
+
+        Replaces the listener of `GroupEntity`, which re-reads the states of all the lights on every change, with one
+        updating only the light whose state changed, from the payload of the event. The state changes are routed by
+        the dispatcher shared by all the mixers, subscribed once to the state changes of all their lights.
+        """
+
+        self.async_on_remove(
+            async_get_child_state_dispatcher(self.hass).async_register(
+                self._entity_ids, self._async_child_state_changed
+            )
+        )
+        self.async_on_remove(start.async_at_start(self.hass, self._update_at_start))
+        self.async_on_remove(self._cancel_pending_state_write)
+        self.async_on_remove(self._cancel_queued_command)
+        self.async_on_remove(self._cancel_transition)
+        self.async_on_remove(self._cancel_fan_out_calls)
+        if self.__circadian:
+            self.async_on_remove(async_get_circadian_scheduler(self.hass).async_register(self))
+
+    @callback
+    def _update_at_start(self, _: HomeAssistant) -> None:
+        """Read the states of all the lights once Home Assistant has started, then update the mixer state."""
+
+        for entity_id, lights in self.__lights_by_entity_id.items():
+            self._update_lights_state(lights, self.hass.states.get(entity_id))
+        super()._update_at_start(_)
+
+    @callback
+    def _async_child_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the state of the light that changed, then the mixer state."""
+
+        self.async_set_context(event.context)
+        entity_id = event.data["entity_id"]
+        lights = self.__lights_by_entity_id[entity_id]
+        self._update_lights_state(lights, event.data["new_state"])
+
+        if self.__expected_brightnesses:
+            expected_brightnesses = self.__expected_brightnesses.pop(entity_id, None)
+            if (
+                expected_brightnesses == tuple(light.brightness for _, light in lights)
+                and self.__cancel_state_write is None
+                and not self._effects_changed()
+            ):
+                # The light confirms the last command, already written in the optimistic state
+                self.__log.debug("skipping expected update of %s", entity_id)
+                return
+            # Reconcile the state with the actual brightnesses, no longer relying on the expected ones
+            self.__expected_brightnesses.clear()
+
+        if not self.__state_write_window:
+            self.async_defer_or_update_ha_state()
+        elif self.__cancel_state_write is None:
+            # Wait for the other light, which usually follows after a command, and for the lights coming online
+            # together, to compute and write the state only once
+            self.__cancel_state_write = async_call_later(
+                self.hass, self.__state_write_window, self._async_write_coalesced_state
+            )
+
+    @callback
+    def _async_write_coalesced_state(self, _: datetime) -> None:
+        """Compute and write the state after the updates of the lights received during the window."""
+
+        self.__cancel_state_write = None
+        self.async_defer_or_update_ha_state()
+
+    @callback
+    def _cancel_pending_state_write(self) -> None:
+        """Cancel the coalesced state write, if pending."""
+
+        if self.__cancel_state_write is not None:
+            self.__cancel_state_write()
+            self.__cancel_state_write = None
+
+    def _update_lights_state(
+        self, lights: tuple[tuple[ChildLightState, ChildLightState], ...], state: State | None
+    ) -> None:
+        """Copy the attributes used by the mixer from the state of a light entity to the channels it drives."""
+
+        # The brightnesses of the warm and cold channels are the last two of the RGBWW color, scaled by the brightness
+        # of the light since the color is usually reported with its largest channel at 255
+        white_brightnesses: tuple[int, int] | None = None
+        if (
+            self.__rgbww_output
+            and state is not None
+            and state.state == STATE_ON
+            and (rgbww_color := state.attributes.get(ATTR_RGBWW_COLOR)) is not None
+        ):
+            brightness = state.attributes.get(ATTR_BRIGHTNESS) or 0
+            white_brightnesses = (round(rgbww_color[4] * brightness / 255), round(rgbww_color[3] * brightness / 255))
+        for channel, light in lights:
+            self._update_child_state(light, state)
+            if white_brightnesses is not None:
+                light.brightness = white_brightnesses[0] if channel is self.__warm_light else white_brightnesses[1]
+            if light is not channel:
+                channel.aggregate_members()
+
+    @staticmethod
+    def _update_child_state(light: ChildLightState, state: State | None) -> None:
+        """Copy the attributes used by the mixer from the state of one of its lights."""
+
+        if state is None:
+            light.state = None
+            light.brightness = 0
+            light.supported_features = 0
+            light.effect_list = light.effect = None
+            light.assumed_state = False
+            return
+
+        light.state = state.state
+        light.supported_features = state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+        # Lights that are not on have no brightness, nor effect
+        light.brightness = int(state.attributes.get(ATTR_BRIGHTNESS) or 0) if state.state == STATE_ON else 0
+        light.effect_list = state.attributes.get(ATTR_EFFECT_LIST)
+        light.effect = state.attributes.get(ATTR_EFFECT) if state.state == STATE_ON else None
+        light.assumed_state = state.attributes.get(ATTR_ASSUMED_STATE, False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Given a combination of brightness or color_temp_kelvin, compute the required brightnesses for all the lights in the group."""
-        LOGGER.debug("%s: turn on with params: %s", self._friendly_name(), kwargs)
+        span = self.__tracer.start_span("turn_on")
+        self.__log.debug("turn on with params: %s", kwargs)
+        # Any new command replaces the running transition
+        self._cancel_transition()
 
         # Extract information about the target temperature and brightness passed as kwargs, if available.
         # Otherwise try to maintain the currently set temperature and brightness, restoring them from the dedicated sensor if unavailable locally
@@ -127,10 +489,10 @@ async def async_turn_on(self, **kwargs: Any) -> None:
         # Try to read the missing value from our restored state, if available
         if target_brightness is None:  # and priority is not BrightnessTemperaturePriority.MIXED:
             target_brightness = self.__last_turned_on_brightness
-            LOGGER.debug("%s: using last turned on brightness: %s", self._friendly_name(), target_brightness)
+            self.__log.debug("using last turned on brightness: %s", target_brightness)
         if target_temp_kelvin is None:  # and priority is not BrightnessTemperaturePriority.MIXED:
             target_temp_kelvin = self.__last_turned_on_temperature
-            LOGGER.debug("%s: using last turned on temperature: %s", self._friendly_name(), target_temp_kelvin)
+            self.__log.debug("using last turned on temperature: %s", target_temp_kelvin)
 
         # Populate the base service data common to all the lights
         common_data = {key: value for key, value in kwargs.items() if key in FORWARDED_ATTRIBUTES}
@@ -138,116 +500,683 @@ async def async_turn_on(self, **kwargs: Any) -> None:
         # If we are not able to identify both target_brightness and target_temp_kelvin,
         # we cannot properly compute the desired settings for each light, therefore do not alter the current brightness of each light
         if target_brightness is None or target_temp_kelvin is None:
-            LOGGER.debug(
-                "%s: cannot compute target state given target brightness: %d and temp: %d, turning on all lights without altering brightness",
-                self._friendly_name(),
+            self.__log.debug(
+                "cannot compute target state given target brightness: %s and temp: %s, turning on all lights without altering brightness",
                 target_brightness,
                 target_temp_kelvin,
             )
-            ww_settings = TurnOnSettings(self.__warm_light.entity_id, common_data)
-            cw_settings = TurnOnSettings(self.__cold_light.entity_id, common_data)
-            await self._turn_on_lights(ww_settings, cw_settings)
+            self.__expected_brightnesses.clear()
+            await self._async_dispatch_latest(
+                *(TurnOnSettings(light.entity_ids, common_data) for light in self.__lights)
+            )
+            if span is not None:
+                span.lap("dispatch")
+                span.finish()
             return
 
+        self.__requested_brightness = target_brightness
         # Clamp between min and max possible temperatures
         target_temp_kelvin = min(
             self.__cold_light.color_temp_kelvin,
             max(target_temp_kelvin, self.__warm_light.color_temp_kelvin),
         )
 
-        brightness_calculator = BrightnessCalculator(
-            self.min_color_temp_kelvin,
-            self.max_color_temp_kelvin,
-            target_temp_kelvin,
-            target_brightness,
-            priority,
-        )
-        ww_brightness, cw_brightness = brightness_calculator.compute_brightnesses()
+        if self.__software_transition and common_data.get(ATTR_TRANSITION):
+            self._start_transition(target_temp_kelvin, target_brightness, priority, common_data)
+            if span is not None:
+                span.finish()
+            return
+
+        settings = self._compute_turn_on_settings(target_temp_kelvin, target_brightness, priority, common_data)
+        if span is not None:
+            span.lap("compute")
+
+        await self._async_dispatch_latest(*settings)
+        if span is not None:
+            span.lap("dispatch")
+            span.finish()
+
+    def _compute_turn_on_settings(
+        self,
+        target_temp_kelvin: int,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority,
+        common_data: dict[str, Any],
+        *,
+        frame: bool = False,
+        optimistic: bool = True,
+    ) -> tuple[TurnOnSettings, ...]:
+        """Compute the brightnesses of all the lights reaching the target, within the range of the mixer.
+
+        With intermediate lights only the two lights adjacent to the target temperature are mixed, the others are off.
+        The frames of a transition, each targeted once, are computed bypassing the cache so as not to evict the targets
+        requested repeatedly, and leave the optimistic state to the end of the transition. Settings computed only to be
+        compared with the states of the lights leave the optimistic state as it is.
+        """
+
+        if frame and self.__channel_model is not None:
+            outputs = self.__channel_model.compute_brightnesses(target_temp_kelvin, target_brightness, priority)
+        elif self.__channel_model is not None:
+            segment = self.__channel_model.segment(target_temp_kelvin)
+            outputs = self.__channel_model.spread(
+                segment,
+                *BRIGHTNESS_CACHE.compute_brightnesses(
+                    self.__channel_model.segments[segment], target_temp_kelvin, target_brightness, priority
+                ),
+            )
+        elif self.__brightness_table is not None and BRIGHTNESS_RANGE[0] <= target_brightness <= BRIGHTNESS_RANGE[1]:
+            outputs = self.__brightness_table.lookup(target_temp_kelvin, target_brightness, priority)
+        elif frame:
+            outputs = self.__model.compute_brightnesses(target_temp_kelvin, target_brightness, priority)
+        else:
+            outputs = BRIGHTNESS_CACHE.compute_brightnesses(
+                self.__model, target_temp_kelvin, target_brightness, priority
+            )
+
+        optimistic = optimistic and self.__optimistic and not frame
+        if optimistic:
+            self._write_optimistic_state(target_temp_kelvin, target_brightness, outputs)
+
+        # The model computes the outputs of linear lights, convert them to the brightnesses giving those outputs
+        brightnesses = list(outputs)
+        if self.__warm_calibration is not None:
+            brightnesses[0] = self.__warm_calibration.inverse[brightnesses[0]]
+        if self.__cold_calibration is not None:
+            brightnesses[-1] = self.__cold_calibration.inverse[brightnesses[-1]]
+        if frame:
+            # The lights reporting the frames are reconciled with the state
+            self.__expected_brightnesses = {}
+        elif optimistic:
+            expected_brightnesses: dict[str, tuple[int, ...]] = {}
+            for light, brightness in zip(self.__lights, brightnesses, strict=True):
+                for entity_id in light.entity_ids:
+                    expected_brightnesses[entity_id] = (*expected_brightnesses.get(entity_id, ()), brightness)
+            self.__expected_brightnesses = expected_brightnesses
 
         # Personalize the service data with the light-specific brightness
-        ww_settings = TurnOnSettings(self.__warm_light.entity_id, common_data.copy(), ww_brightness)
-        cw_settings = TurnOnSettings(self.__cold_light.entity_id, common_data.copy(), cw_brightness)
+        return tuple(
+            TurnOnSettings(light.entity_ids, common_data.copy(), brightness)
+            for light, brightness in zip(self.__lights, brightnesses, strict=True)
+        )
+
+    def _start_transition(
+        self,
+        target_temp_kelvin: int,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority,
+        common_data: dict[str, Any],
+    ) -> None:
+        """Start the transition of the mixer from its current state to the target, in place of the lights."""
+
+        # A transition from off starts from the target temperature
+        start = (
+            (self.color_temp_kelvin or target_temp_kelvin, self.brightness or 0)
+            if self.is_on
+            else (target_temp_kelvin, 0)
+        )
+        plan = TransitionPlan.from_kelvin(start, (target_temp_kelvin, target_brightness), common_data[ATTR_TRANSITION])
+        # A queued command would be forwarded in between the frames
+        self._cancel_queued_command()
+        self.__log.debug("starting a transition of %s seconds from %s", plan.duration, start)
+        self.__transition_task = self.hass.async_create_background_task(
+            self._async_run_transition(
+                plan,
+                (target_temp_kelvin, target_brightness),
+                priority,
+                {key: value for key, value in common_data.items() if key != ATTR_TRANSITION},
+            ),
+            name=f"{DOMAIN} transition for {self.entity_id}",
+        )
+
+    async def _async_run_transition(
+        self,
+        plan: TransitionPlan,
+        target: tuple[int, int],
+        priority: BrightnessTemperaturePriority,
+        common_data: dict[str, Any],
+    ) -> None:
+        """Send the frames of a transition to the lights, ending with the target along with the other attributes.
+
+        The target is sent as requested, since the frames are interpolated in mireds and rounded back to kelvin.
+
+        Each frame is sent once the previous one has been forwarded, at the frame rate. Only when the dispatch is
+        awaited the previous frame is also completed by the lights, so that slow lights get fewer frames at the pace
+        they can follow instead of falling behind; otherwise the pace does not depend on the latency of the lights.
+        """
+
+        loop = self.hass.loop
+        begin = loop.time()
+        try:
+            while (elapsed := loop.time() - begin) < plan.duration:
+                frame_temp_kelvin, frame_brightness = plan.frame(elapsed)
+                async with self.__dispatch_lock:
+                    await self._async_dispatch_in_background(
+                        self._turn_on_lights(
+                            *self._compute_turn_on_settings(
+                                frame_temp_kelvin, frame_brightness, priority, {}, frame=True
+                            )
+                        )
+                    )
+                await asyncio.sleep(max(0.0, self.__transition_frame_interval - (loop.time() - begin - elapsed)))
+
+            target_temp_kelvin, target_brightness = target
+            async with self.__dispatch_lock:
+                await self._async_dispatch_in_background(
+                    self._turn_on_lights(
+                        *self._compute_turn_on_settings(target_temp_kelvin, target_brightness, priority, common_data)
+                    )
+                )
+        finally:
+            # Unless already replaced by a newer transition
+            if self.__transition_task is asyncio.current_task():
+                self.__transition_task = None
+
+    async def async_apply_circadian(self, fraction: float) -> None:
+        """Move the lights to the temperature of the daylight fraction, at the brightness last requested to the mixer.
+
+        The brightness is the requested one rather than the current one, so that the brightness lost at the ends of the
+        range is regained once the temperature moves back. The command goes through the queue of the commands, at the
+        maximum rate. Nothing is changed while the mixer is off, or is being commanded, nor when the lights are already
+        there.
+        """
+
+        if (
+            not self.is_on
+            or self.brightness is None
+            or self.__transition_task is not None
+            or self.__queued_command is not None
+            or self.__dispatch_lock.locked()
+        ):
+            return
+
+        target_temp_kelvin = circadian_temperature(
+            self.__warm_light.color_temp_kelvin, self.__cold_light.color_temp_kelvin, fraction
+        )
+        target_brightness = self.__requested_brightness or self.brightness
+        priority = BrightnessTemperaturePriority.TEMPERATURE
+        settings = self._compute_turn_on_settings(target_temp_kelvin, target_brightness, priority, {}, optimistic=False)
+        if all(self._is_unchanged(light, child) for light, child in zip(settings, self.__lights, strict=True)):
+            return
 
-        await self._turn_on_lights(ww=ww_settings, cw=cw_settings)
+        # Computed again, from the cache, writing the optimistic state as any command
+        await self._async_dispatch_in_background(
+            self._async_dispatch_latest(
+                *self._compute_turn_on_settings(target_temp_kelvin, target_brightness, priority, {})
+            )
+        )
+
+    @callback
+    def _cancel_transition(self) -> None:
+        """Stop the running transition, if any, leaving the lights at its last frame."""
+
+        if self.__transition_task is not None:
+            self.__transition_task.cancel()
+            self.__transition_task = None
+
+    def _write_optimistic_state(self, target_temp_kelvin: int, target_brightness: int, outputs: Sequence[int]) -> None:
+        """Write the state the mixer will have once the lights reach the given outputs.
+
+        When the target is achievable it is written as requested, instead of the temperature computed back from the
+        rounded brightnesses of the lights.
+        """
+
+        total_output = sum(outputs)
+        self._attr_is_on = total_output > 0
+        if abs(total_output - 2 * target_brightness) <= 1:
+            self._attr_brightness = target_brightness
+            self._attr_color_temp_kelvin = target_temp_kelvin
+        else:
+            # The target has been projected on the achievable temperatures and brightnesses
+            self._attr_brightness = int(total_output / 2)
+            self._attr_color_temp_kelvin = (
+                self.__model.current_temperature(*outputs)
+                if self.__channel_model is None
+                else self.__channel_model.current_temperature(outputs)
+            )
+        self.async_write_ha_state()
+
+    async def _async_build_brightness_table(self) -> None:
+        """Precompute the brightness lookup table of the mixer in the executor."""
+
+        try:
+            table = await self.hass.async_add_executor_job(
+                BrightnessLookupTable,
+                self.__warm_light.color_temp_kelvin,
+                self.__cold_light.color_temp_kelvin,
+                self.__temperature_weight,
+                type(self.__model),
+            )
+        except ValueError as err:
+            self.__log.warning("brightness lookup table disabled: %s", err)
+            return
+
+        self.__log.debug("built brightness lookup table of %d bytes", table.nbytes)
+        self.__brightness_table = table
+
+    async def _async_build_temperature_table(self) -> None:
+        """Precompute the temperature lookup table of the mixer in the executor."""
+
+        table = await self.hass.async_add_executor_job(
+            partial(
+                TemperatureLookupTable,
+                self.__warm_light.color_temp_kelvin,
+                self.__cold_light.color_temp_kelvin,
+                warm_calibration=self.__warm_calibration,
+                cold_calibration=self.__cold_calibration,
+            )
+        )
+
+        self.__log.debug("built temperature lookup table of %d bytes", table.nbytes)
+        self.__temperature_table = table
+
+    async def _async_dispatch_latest(self, *lights: TurnOnSettings) -> None:
+        """Forward a command to the lights right away if possible, otherwise queue it replacing any queued one.
+
+        The queued command is forwarded in the background as soon as the previous one completed and the maximum rate
+        allows it, so that the lights skip the intermediate targets of a burst but always reach the last one.
+        """
+
+        if (
+            self.__command_worker is None
+            and not self.__dispatch_lock.locked()
+            and self.hass.loop.time() >= self.__next_dispatch
+        ):
+            async with self.__dispatch_lock:
+                self.__next_dispatch = self.hass.loop.time() + self.__dispatch_interval
+                await self._turn_on_lights(*lights)
+            return
+
+        if self.__queued_command is not None:
+            self.__log.debug("dropping the queued command, superseded by a newer one")
+        self.__queued_command = lights
+        if self.__command_worker is None:
+            self.__command_worker = self.hass.async_create_background_task(
+                self._async_forward_queued_commands(), name=f"{DOMAIN} command queue for {self.entity_id}"
+            )
+
+    async def _async_forward_queued_commands(self) -> None:
+        """Forward the queued commands, one at a time and no faster than the maximum rate, until none is left."""
+
+        try:
+            while self.__queued_command is not None:
+                await asyncio.sleep(max(0.0, self.__next_dispatch - self.hass.loop.time()))
+                async with self.__dispatch_lock:
+                    # The most recent command, queued while waiting
+                    if (command := self.__queued_command) is None:
+                        break
+                    self.__queued_command = None
+                    self.__next_dispatch = self.hass.loop.time() + self.__dispatch_interval
+                    await self._async_dispatch_in_background(self._turn_on_lights(*command))
+        finally:
+            self.__command_worker = None
+
+    @callback
+    def _cancel_queued_command(self) -> None:
+        """Drop the queued command, if any, and stop forwarding it."""
+
+        self.__queued_command = None
+        if self.__command_worker is not None:
+            self.__command_worker.cancel()
+            self.__command_worker = None
+
+    async def _turn_on_lights(self, *lights: TurnOnSettings) -> None:
+        if self.__rgbww_output:
+            await self._turn_on_rgbww_light(*lights)
+            return
+
+        # Lights with the same service data are turned on with a single call, processed in one batch by integrations
+        # supporting it. The lights left off by a mixer with intermediate lights share the same call, so that the
+        # number of calls does not grow with the number of lights
+        calls: list[tuple[dict[str, Any], list[str]]] = []
+        commands = skipped = 0
+        for light, child in zip(lights, self.__lights, strict=True):
+            if self.__skip_unchanged_lights and self._is_unchanged(light, child):
+                self.__log.debug(
+                    "skipping turn_on call to %s, already at brightness %s",
+                    ", ".join(light.entity_ids),
+                    light.brightness,
+                )
+                # No update of the light will confirm the brightness
+                self._drop_expected_brightnesses(child)
+                skipped += len(light.entity_ids)
+                continue
+
+            commands += len(light.entity_ids)
+            service_data = light.service_data
+            for call_data, entity_ids in calls:
+                if call_data == service_data:
+                    entity_ids.extend(light.entity_ids)
+                    break
+            else:
+                calls.append((service_data, list(light.entity_ids)))
+        self.__dispatch_stats.record(
+            commands=commands, calls=len(calls) if self.__light_semaphore is None else commands, skipped=skipped
+        )
+
+        _raise_first_error(
+            await asyncio.gather(
+                *(
+                    self._async_call_lights(SERVICE_TURN_ON, entity_ids, service_data)
+                    for service_data, entity_ids in calls
+                ),
+                return_exceptions=True,
+            )
+        )
+
+    async def _turn_on_rgbww_light(self, ww: TurnOnSettings, cw: TurnOnSettings) -> None:
+        """Turn on the single light driving both white channels with one call, setting its RGBWW color."""
+
+        if (
+            self.__skip_unchanged_lights
+            and self._is_unchanged(ww, self.__warm_light)
+            and self._is_unchanged(cw, self.__cold_light)
+        ):
+            self.__log.debug(
+                "skipping turn_on call to %s, already at brightnesses %s and %s",
+                ", ".join(ww.entity_ids),
+                ww.brightness,
+                cw.brightness,
+            )
+            self._drop_expected_brightnesses(self.__warm_light)
+            self.__dispatch_stats.record(commands=0, calls=0, skipped=2 * len(ww.entity_ids))
+            return
+
+        self.__dispatch_stats.record(
+            commands=2 * len(ww.entity_ids), calls=1 if self.__light_semaphore is None else len(ww.entity_ids)
+        )
+        settings = self._rgbww_settings(ww, cw)
+        if settings.brightness == 0:
+            # Both channels off: a light may stay on, dark, with an RGBWW color of zeros
+            service_data = {key: value for key, value in settings.common_data.items() if key == ATTR_TRANSITION}
+            await self._async_call_lights(SERVICE_TURN_OFF, ww.entity_ids, service_data)
+            return
+        await self._async_call_lights(SERVICE_TURN_ON, ww.entity_ids, settings.service_data)
 
-    async def _turn_on_lights(self, ww: TurnOnSettings, cw: TurnOnSettings) -> Awaitable:
-        service_calls = []
-        for light in (ww, cw):
-            target = {ATTR_ENTITY_ID: light.entity_id}
-            service_data = light.common_data
+    @staticmethod
+    def _rgbww_settings(ww: TurnOnSettings, cw: TurnOnSettings) -> TurnOnSettings:
+        """Return the settings of the single light driving both white channels, packing their brightnesses.
 
-            if light.brightness is not None:
-                service_data[ATTR_BRIGHTNESS] = light.brightness
+        Home Assistant scales the RGBWW color by the brightness of the light, so the color is sent with its largest
+        channel at 255 along with the brightness of that channel.
+        """
+
+        if ww.brightness is None or cw.brightness is None:
+            # The brightnesses of the channels are left as they are
+            return ww
+        # The brightness and temperature are those of the white channels, and cannot be set along with a color
+        common_data = {key: value for key, value in ww.common_data.items() if key not in MIXER_ATTRIBUTES}
+        if not (brightness := max(ww.brightness, cw.brightness)):
+            return TurnOnSettings(ww.entity_ids, common_data, 0)
+        rgbww_color = (0, 0, 0, round(cw.brightness * 255 / brightness), round(ww.brightness * 255 / brightness))
+        return TurnOnSettings(ww.entity_ids, {**common_data, ATTR_RGBWW_COLOR: rgbww_color}, brightness)
+
+    def _drop_expected_brightnesses(self, light: ChildLightState) -> None:
+        """Stop expecting the lights of a channel to confirm the last command, not being sent to them."""
+
+        for entity_id in light.entity_ids:
+            self.__expected_brightnesses.pop(entity_id, None)
+
+    @staticmethod
+    def _is_unchanged(light: TurnOnSettings, child: ChildLightState) -> bool:
+        """Return whether turning on the light with the settings would leave it as it is.
+
+        Only the commands setting the brightness alone can be skipped, any other attribute such as a transition or an
+        effect is always forwarded.
+        """
+
+        if (
+            light.brightness is None
+            or light.brightness != child.brightness
+            or light.common_data.keys() - MIXER_ATTRIBUTES
+        ):
+            return False
+        # A light that is not on has brightness 0, the one it is left at by a brightness of 0. The brightness of a
+        # channel of several lights is their average, each of them must be at the brightness
+        return all(
+            member.brightness == light.brightness
+            and (member.state == STATE_ON or (light.brightness == 0 and member.state == STATE_OFF))
+            for member in child.members or (child,)
+        )
+
+    async def _async_call_lights(self, service: str, entity_ids: list[str], service_data: dict[str, Any]) -> None:
+        """Forward a service call to some of the lights, waiting for them to complete it if the dispatch is awaited.
+
+        With a maximum number of concurrent lights each light is called on its own, once a previous one completed.
+        """
+
+        if self.__light_semaphore is not None:
+            calls = self._async_fan_out_call(service, entity_ids, service_data)
+            if self.__await_dispatch:
+                await calls
+            else:
+                task = self.hass.async_create_task(
+                    self._async_dispatch_in_background(calls), f"{DOMAIN} {service} call for {self.entity_id}"
+                )
+                self.__fan_out_tasks.add(task)
+                task.add_done_callback(self.__fan_out_tasks.discard)
+            return
+
+        if not self.__await_dispatch:
+            self.__log.debug("forwarding service %s call to: %s %s", service, entity_ids, service_data)
+            await self.hass.services.async_call(
+                DOMAIN_LIGHT,
+                service,
+                target={ATTR_ENTITY_ID: entity_ids},
+                service_data=service_data,
+                blocking=False,
+                context=self._context,
+            )
+            return
+
+        await self._async_await_call(service, entity_ids, service_data)
+
+    async def _async_fan_out_call(self, service: str, entity_ids: list[str], service_data: dict[str, Any]) -> None:
+        """Forward a service call to each of the lights on its own, at most the maximum number of lights at a time.
+
+        Each call is awaited, so that a light holds its turn until it completes the call or times out.
+        """
+
+        async def call_light(entity_id: str) -> None:
+            async with self.__light_semaphore:  # pyright: ignore[reportOptionalContextManager]
+                await self._async_await_call(service, [entity_id], service_data)
+
+        _raise_first_error(
+            await asyncio.gather(*(call_light(entity_id) for entity_id in entity_ids), return_exceptions=True)
+        )
+
+    @callback
+    def _cancel_fan_out_calls(self) -> None:
+        """Stop the calls to each light on its own still running in the background, if any."""
+
+        for task in self.__fan_out_tasks:
+            task.cancel()
+        self.__fan_out_tasks.clear()
+
+    async def _async_dispatch_in_background(self, dispatch: Awaitable[None]) -> None:
+        """Forward a command to the lights in the background, where there is no caller to raise its error to."""
+
+        try:
+            await dispatch
+        except HomeAssistantError as err:
+            self.__log.debug("command not completed: %s", err)
+
+    async def _async_await_call(self, service: str, entity_ids: list[str], service_data: dict[str, Any]) -> None:
+        """Forward a service call to some of the lights, waiting for them to complete it and measuring their latency.
 
-            LOGGER.debug("%s: forwarding service turn_on call to: %s %s", self._friendly_name(), target, service_data)
-            service_calls.append(
-                self.hass.services.async_call(
+        A light that fails or times out is logged and counted, then a `HomeAssistantError` is raised to fail the
+        command of the mixer.
+        """
+
+        target = {ATTR_ENTITY_ID: entity_ids}
+        self.__log.debug("forwarding service %s call to: %s %s", service, target, service_data)
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.__dispatch_timeout):
+                await self.hass.services.async_call(
                     DOMAIN_LIGHT,
-                    SERVICE_TURN_ON,
+                    service,
                     target=target,
                     service_data=service_data,
-                    blocking=False,
+                    blocking=True,
                     context=self._context,
                 )
+        except TimeoutError as err:
+            self.__log.warning(
+                "%s did not complete %s within %.1f seconds", ", ".join(entity_ids), service, self.__dispatch_timeout
             )
+            for entity_id in entity_ids:
+                self.__dispatch_stats.child(entity_id).timeouts += 1
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="dispatch_timeout",
+                translation_placeholders={
+                    "entity_ids": ", ".join(entity_ids),
+                    "service": service,
+                    "timeout": f"{self.__dispatch_timeout:.1f}",
+                },
+            ) from err
+        except HomeAssistantError as err:
+            self.__log.warning("%s failed to %s: %s", ", ".join(entity_ids), service, err)
+            for entity_id in entity_ids:
+                self.__dispatch_stats.child(entity_id).failures += 1
+            raise
 
-        return asyncio.gather(*service_calls)
+        latency = time.perf_counter() - start
+        for entity_id in entity_ids:
+            self.__dispatch_stats.child(entity_id).latencies.append(latency)
 
     @callback
     def async_update_group_state(self) -> None:
-        """Customize method from parent class LightGroup to apply custom brightness and color temperature."""
+        """Compute the mixer state from the last known states of its lights, as `LightGroup` with mode "any"."""
 
-        super().async_update_group_state()
+        span = self.__tracer.start_span("state update")
+        warm_light, cold_light = self.__warm_light, self.__cold_light
+        states = [light.state for light in self.__lights]
 
-        # Ensure COLOR_TEMP is always supported, since it is the main feature of the group
-        self._attr_supported_color_modes = {ColorMode.COLOR_TEMP}
-        # Ensure COLOR_TEMP is always the current mode, since it is the main feature of the group
-        self._attr_color_mode = ColorMode.COLOR_TEMP
+        # The mixer is on if any light is on, and unknown only if no light has a known state
+        if all(state in INVALID_STATES for state in states):
+            self._attr_is_on = None
+        else:
+            self._attr_is_on = STATE_ON in states
+        self._attr_available = any(state not in UNAVAILABLE_STATES for state in states)
+        supported_features = 0
+        for light in self.__lights:
+            supported_features |= light.supported_features
+        self._attr_supported_features = LightEntityFeature(supported_features) & SUPPORT_GROUP_LIGHT
+        self._update_effects()
+
+        if STATE_ON not in states:
+            # If no light is on, we are unable to compute the temperature
+            self._attr_brightness = None
+            self._attr_color_temp_kelvin = None
+            # The lights may be turned on again outside of the mixer, at another brightness
+            self.__requested_brightness = None
+        elif self.__channel_model is not None:
+            outputs = [
+                self._light_output(light.brightness, calibration)
+                for light, calibration in zip(self.__lights, self.__calibrations, strict=True)
+            ]
+            # More than two lights may have been turned on outside of the mixer
+            self._attr_brightness = min(int(sum(outputs) / 2), BRIGHTNESS_RANGE[1])
+            self._attr_color_temp_kelvin = self.__channel_model.current_temperature(outputs)
+        elif self.__warm_calibration is None and self.__cold_calibration is None:
+            self._attr_brightness = int((warm_light.brightness + cold_light.brightness) / 2)
+            self._attr_color_temp_kelvin = self._compute_color_temp_kelvin()
+        else:
+            # Report the combined output of the lights, as requested when turning on the mixer
+            self._attr_brightness = int(
+                (
+                    self._light_output(warm_light.brightness, self.__warm_calibration)
+                    + self._light_output(cold_light.brightness, self.__cold_calibration)
+                )
+                / 2
+            )
+            self._attr_color_temp_kelvin = self._compute_color_temp_kelvin()
 
-        states = [state for entity_id in self._entity_ids if (state := self.hass.states.get(entity_id)) is not None]
-        on_states = [state for state in states if state.state == STATE_ON]
+        if span is not None:
+            span.lap("compute")
+            span.finish()
 
-        brightnesses: list[int] = list(find_state_attributes(on_states, ATTR_BRIGHTNESS))
+    def _effects_changed(self) -> bool:
+        """Aggregate the effects and the assumed state of the lights, returning whether they changed."""
 
-        self._attr_brightness = int(sum(brightnesses) / 2) if brightnesses else None
-        self._attr_color_temp_kelvin = self._compute_color_temp_kelvin(on_states)
+        effects = (self._attr_effect_list, self._attr_effect, self._attr_assumed_state)
+        self._update_effects()
+        return effects != (self._attr_effect_list, self._attr_effect, self._attr_assumed_state)
 
-    def _compute_color_temp_kelvin(self, on_states: list[State]) -> int | None:
-        """
-        Compute the color temperature of the light group.
+    def _update_effects(self) -> None:
+        """Aggregate the effects and the assumed state of the lights, as `LightGroup`."""
 
-        Given the states containing the lights that are currently on,
-        compute the combined temperature of the light group as a weighted average of the warm and cold lights temperatures.
-        """
+        # A light driving both channels of an RGBWW output is counted once
+        lights = [lights[0][1] for lights in self.__lights_by_entity_id.values()]
+        self._attr_assumed_state = any(light.assumed_state for light in lights)
 
-        # If no light is on, we are unable to compute the temperature
-        if not on_states:
-            return None
+        self._attr_effect_list = None
+        self._attr_effect = None
+        if not self._attr_supported_features & LightEntityFeature.EFFECT:
+            return
+        effect_lists = [light.effect_list for light in lights if light.effect_list is not None]
+        if effect_lists:
+            # Merge the effects of all the lights, "None" first
+            self._attr_effect_list = sorted(set().union(*effect_lists))
+            if "None" in self._attr_effect_list:
+                self._attr_effect_list.remove("None")
+                self._attr_effect_list.insert(0, "None")
+        effects = [light.effect for light in lights if light.effect is not None]
+        if effects:
+            # Report the most common effect
+            self._attr_effect = Counter(effects).most_common(1)[0][0]
 
-        def find_state(entity_id: str) -> State | None:
-            return next(filter(lambda state: state.entity_id == entity_id, on_states), None)
+    def _compute_color_temp_kelvin(self) -> int:
+        """Compute the combined temperature of the warm and cold lights at their current brightnesses."""
 
-        warm_light_state = find_state(self.__warm_light.entity_id)
-        cold_light_state = find_state(self.__cold_light.entity_id)
+        warm_brightness, cold_brightness = self.__warm_light.brightness, self.__cold_light.brightness
+        if self.__temperature_table is not None and (
+            0 <= warm_brightness <= BRIGHTNESS_RANGE[1] and 0 <= cold_brightness <= BRIGHTNESS_RANGE[1]
+        ):
+            return self.__temperature_table.lookup(warm_brightness, cold_brightness)
 
-        # Try to extract the brightness attribute if the light is on, otherwise fallback to 0
-        self.__warm_light.brightness = (
-            int(warm_light_state.attributes.get(ATTR_BRIGHTNESS, 0)) if warm_light_state is not None else 0
-        )
-        self.__cold_light.brightness = (
-            int(cold_light_state.attributes.get(ATTR_BRIGHTNESS, 0)) if cold_light_state is not None else 0
+        return self.__model.current_temperature(
+            self._light_output(warm_brightness, self.__warm_calibration),
+            self._light_output(cold_brightness, self.__cold_calibration),
         )
 
-        temperature_calc = TemperatureCalculator(self.__warm_light, self.__cold_light)
-        return temperature_calc.current_temperature()
+    @staticmethod
+    def _light_output(brightness: int, calibration: ChannelCalibration | None) -> float:
+        """Return the output of a light at the given brightness, on the same 0...255 scale."""
+
+        if calibration is None or not 0 <= brightness <= BRIGHTNESS_RANGE[1]:
+            return brightness
+        return calibration.forward[brightness]
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Save the turned on state of each child light, and forward the turn_off command to all the lights in the light group."""
         # Save the current turned on state
         self._save_turned_on_state()
+        # A queued command or a transition would turn the lights back on
+        self._cancel_queued_command()
+        self._cancel_transition()
+
+        if self.__optimistic:
+            self._attr_is_on = False
+            self._attr_brightness = None
+            self._attr_color_temp_kelvin = None
+            self.async_write_ha_state()
+            self.__expected_brightnesses = {
+                entity_id: (0,) * len(lights) for entity_id, lights in self.__lights_by_entity_id.items()
+            }
+
+        self.__log.debug("invoking turn_off for the light group")
+        # LightGroup turns off all the lights with a single call
+        self.__dispatch_stats.record(
+            commands=len(self._entity_ids), calls=1 if self.__light_semaphore is None else len(self._entity_ids)
+        )
+        if not self.__await_dispatch and self.__light_semaphore is None:
+            await super().async_turn_off(**kwargs)
+            return
 
-        LOGGER.debug("%s: invoking turn_off for the light group", self._friendly_name())
-        await super().async_turn_off(**kwargs)
+        service_data = {ATTR_TRANSITION: kwargs[ATTR_TRANSITION]} if ATTR_TRANSITION in kwargs else {}
+        await self._async_call_lights(SERVICE_TURN_OFF, self._entity_ids, service_data)
 
     def _save_turned_on_state(self):
         """Store the current turned on state in ad-hoc properties, so that it is possible to compute the temperature and brightness on the next turn request."""
@@ -257,9 +1186,8 @@ def _save_turned_on_state(self):
             return
 
         # Store the state as a serialized JSON string
-        LOGGER.debug(
-            "%s: saving turned on state: bright: %d, temp: %d",
-            self._friendly_name(),
+        self.__log.debug(
+            "saving turned on state: bright: %d, temp: %d",
             self.brightness,
             self.color_temp_kelvin,
         )
@@ -289,7 +1217,7 @@ def _friendly_name(self) -> str:
             if self._cached_friendly_name and self._cached_friendly_name[1]
             else (
                 self.name
-                if self.name and type(self.name) is not UndefinedType
+                if self.name and isinstance(self.name, str)
                 else (self.entity_id or self.unique_id if self.unique_id else "unknown")
             )
-        )  # pyright: ignore[reportReturnType] pyright does not correctly handles `type(self.name) is not UndefinedType`
+        )
@@ -0,0 +1,81 @@
+"""Integration-wide scheduler moving the mixers in circadian mode along the daylight curve."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Protocol
+
+from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.sun import get_astral_event_date
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CIRCADIAN_UPDATE_INTERVAL, DOMAIN, LOGGER
+from .utils.circadian import daylight_fraction
+
+CIRCADIAN_SCHEDULER: HassKey[CircadianScheduler] = HassKey(f"{DOMAIN}_circadian_scheduler")
+
+
+class CircadianMixer(Protocol):
+    """A mixer following the daylight curve."""
+
+    async def async_apply_circadian(self, fraction: float) -> None:
+        """Move the lights to the temperature at the daylight fraction, as a command of the mixer."""
+
+
+class CircadianScheduler:
+    """Single timer of all the mixers in circadian mode.
+
+    At each tick the daylight curve is computed once, then each mixer commands its lights as any other command, within
+    its dispatch lock, statistics and limits.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler, started by its first mixer."""
+
+        self._hass = hass
+        self._mixers: set[CircadianMixer] = set()
+        self._cancel_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, mixer: CircadianMixer) -> CALLBACK_TYPE:
+        """Move a mixer along the daylight curve until the returned callback is called."""
+
+        self._mixers.add(mixer)
+        if self._cancel_timer is None:
+            self._cancel_timer = async_track_time_interval(
+                self._hass, self._async_tick, CIRCADIAN_UPDATE_INTERVAL, name=f"{DOMAIN} circadian scheduler"
+            )
+
+        @callback
+        def unregister() -> None:
+            self._mixers.discard(mixer)
+            if not self._mixers and self._cancel_timer is not None:
+                self._cancel_timer()
+                self._cancel_timer = None
+
+        return unregister
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Move all the mixers to the temperature of the daylight curve at the given time."""
+
+        fraction = daylight_fraction(
+            now,
+            get_astral_event_date(self._hass, SUN_EVENT_SUNRISE, now),
+            get_astral_event_date(self._hass, SUN_EVENT_SUNSET, now),
+        )
+
+        LOGGER.debug("circadian tick at daylight fraction %.3f: %d mixers", fraction, len(self._mixers))
+        for mixer in self._mixers:
+            self._hass.async_create_task(mixer.async_apply_circadian(fraction), f"{DOMAIN} circadian update")
+
+
+@callback
+def async_get_circadian_scheduler(hass: HomeAssistant) -> CircadianScheduler:
+    """Return the circadian scheduler of the integration, creating it on first use."""
+
+    if (scheduler := hass.data.get(CIRCADIAN_SCHEDULER)) is None:
+        scheduler = hass.data[CIRCADIAN_SCHEDULER] = CircadianScheduler(hass)
+    return scheduler
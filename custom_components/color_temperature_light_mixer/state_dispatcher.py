@@ -0,0 +1,77 @@
+"""Integration-wide dispatcher of the state changes of the lights to the mixers using them."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+CHILD_STATE_DISPATCHER: HassKey[ChildStateDispatcher] = HassKey(f"{DOMAIN}_child_state_dispatcher")
+
+type ChildStateListener = Callable[[Event[EventStateChangedData]], None]
+
+
+class ChildStateDispatcher:
+    """Single subscription to the state changes of the lights of all the mixers.
+
+    The lights are indexed by entity id, so that each state change is filtered with a single lookup and routed only to
+    the mixers using the light, and a mixer is added or removed in time proportional to its own lights only.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher, subscribed by its first mixer."""
+
+        self._hass = hass
+        self._listeners: dict[str, dict[ChildStateListener, None]] = {}
+        self._unsubscribe: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, entity_ids: Iterable[str], listener: ChildStateListener) -> CALLBACK_TYPE:
+        """Call the listener on each state change of the lights, until the returned callback is called."""
+
+        entity_ids = list(entity_ids)
+        for entity_id in entity_ids:
+            self._listeners.setdefault(entity_id, {})[listener] = None
+        if self._unsubscribe is None:
+            self._unsubscribe = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_dispatch, event_filter=self._async_filter
+            )
+
+        @callback
+        def unregister() -> None:
+            for entity_id in entity_ids:
+                listeners = self._listeners[entity_id]
+                listeners.pop(listener, None)
+                if not listeners:
+                    del self._listeners[entity_id]
+            if not self._listeners and self._unsubscribe is not None:
+                self._unsubscribe()
+                self._unsubscribe = None
+
+        return unregister
+
+    @callback
+    def _async_filter(self, event_data: EventStateChangedData) -> bool:
+        """Return whether the state change is of a light used by any mixer."""
+        return event_data["entity_id"] in self._listeners
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Route a state change to the mixers using the light."""
+
+        # A copy, since a mixer may be removed by a listener
+        for listener in list(self._listeners.get(event.data["entity_id"], ())):
+            listener(event)
+
+
+@callback
+def async_get_child_state_dispatcher(hass: HomeAssistant) -> ChildStateDispatcher:
+    """Return the child state dispatcher of the integration, creating it on first use."""
+
+    if (dispatcher := hass.data.get(CHILD_STATE_DISPATCHER)) is None:
+        dispatcher = hass.data[CHILD_STATE_DISPATCHER] = ChildStateDispatcher(hass)
+    return dispatcher
@@ -1,11 +1,37 @@
 """Utils package for color_temperature_light_mixer."""
 
-from .calculator import BrightnessCalculator, TemperatureCalculator
+from .cache import BRIGHTNESS_CACHE, BrightnessCache
+from .calculator import (
+    BrightnessCalculator,
+    TemperatureCalculator,
+    compute_brightnesses_batch,
+    compute_mired_brightnesses_batch,
+)
+from .calibration import ChannelCalibration
+from .lookup_tables import BrightnessLookupTable, TemperatureLookupTable
+from .mixer_model import FixedPointMixerModel, MixerModel
+from .multi_channel import MultiChannelModel
 from .string_helpers import slugify_name, truncate_string
+from .tracing import MixerLoggerAdapter, MixerTracer, TraceSpan
+from .transition import TransitionPlan
 
 __all__ = [
+    "BRIGHTNESS_CACHE",
+    "BrightnessCache",
     "BrightnessCalculator",
+    "BrightnessLookupTable",
+    "ChannelCalibration",
+    "FixedPointMixerModel",
+    "MixerLoggerAdapter",
+    "MixerModel",
+    "MixerTracer",
+    "MultiChannelModel",
     "TemperatureCalculator",
+    "TemperatureLookupTable",
+    "TraceSpan",
+    "TransitionPlan",
+    "compute_brightnesses_batch",
+    "compute_mired_brightnesses_batch",
     "slugify_name",
     "truncate_string",
 ]
@@ -0,0 +1,108 @@
+"""Memoization of the brightness computations, shared by all the mixers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from custom_components.color_temperature_light_mixer.const import DEFAULT_BRIGHTNESS_CACHE_SIZE
+from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority
+
+from .mixer_model import MixerModel
+
+type BrightnessCacheKey = tuple[type[MixerModel], int, int, int, int, BrightnessTemperaturePriority, float | None]
+
+
+class BrightnessCache:
+    """Least recently used cache of the (warm, cold) brightnesses computed by `MixerModel`.
+
+    Entries are keyed on the type of model, the mixer and target temperatures, the target brightness and the priority,
+    so mixers with the same warm and cold temperatures and arithmetic share them. The temperature weight is part of the
+    key only for the MIXED priority, the only one depending on it.
+    Each config entry requests a maximum size, and the cache holds as many entries as the largest request.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_BRIGHTNESS_CACHE_SIZE) -> None:
+        """Initialize an empty cache."""
+
+        self._entries: OrderedDict[BrightnessCacheKey, tuple[int, int]] = OrderedDict()
+        self._default_maxsize = maxsize
+        self._requested_maxsizes: dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of cached entries."""
+        return max(self._requested_maxsizes.values(), default=self._default_maxsize)
+
+    def compute_brightnesses(
+        self,
+        model: MixerModel,
+        target_temperature_kelvin: int,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    ) -> tuple[int, int]:
+        """Return the result of `model.compute_brightnesses()`, computing it only if not cached."""
+
+        key = (
+            type(model),
+            model.warm_temperature_kelvin,
+            model.cold_temperature_kelvin,
+            target_temperature_kelvin,
+            target_brightness,
+            priority,
+            model.temperature_weight if priority is BrightnessTemperaturePriority.MIXED else None,
+        )
+        if (brightnesses := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return brightnesses
+
+        self.misses += 1
+        brightnesses = model.compute_brightnesses(target_temperature_kelvin, target_brightness, priority)
+        self._entries[key] = brightnesses
+        self._evict()
+        return brightnesses
+
+    def request_maxsize(self, owner: str, maxsize: int) -> None:
+        """Request the cache to hold up to `maxsize` entries on behalf of `owner`, usually a config entry id."""
+        self._requested_maxsizes[owner] = maxsize
+        self._evict()
+
+    def release_maxsize(self, owner: str) -> None:
+        """Withdraw the size requested by `owner`."""
+        self._requested_maxsizes.pop(owner, None)
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the usage statistics of the cache."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries exceeding the maximum size."""
+        maxsize = self.maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+BRIGHTNESS_CACHE = BrightnessCache()
+"""Cache shared by all the mixers of the process."""
@@ -1,11 +1,29 @@
 """Herlper classes to compute the desired light brightness and temperature."""
 
-from dataclasses import dataclass
-import math
+from __future__ import annotations
 
-from custom_components.color_temperature_light_mixer.const import BRIGHTNESS_RANGE, LOGGER
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from custom_components.color_temperature_light_mixer.const import (
+    BATCH_MIXED_CHUNK_SIZE,
+    BRIGHTNESS_RANGE,
+    DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+    LOGGER,
+)
 from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority, ChildLightState
-from homeassistant.util.color import color_temperature_kelvin_to_mired, rgbww_to_color_temperature
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+from .cache import BRIGHTNESS_CACHE
+from .calibration import ChannelCalibration
+from .mixer_model import MixerModel
+from .multi_channel import MultiChannelModel
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 
 @dataclass
@@ -15,25 +33,48 @@ class TemperatureCalculator:
     warm_light: ChildLightState
     cold_light: ChildLightState
 
+    warm_calibration: ChannelCalibration | None = None
+    """Output of the warm light at each brightness, linear if None"""
+    cold_calibration: ChannelCalibration | None = None
+    """Output of the cold light at each brightness, linear if None"""
+
+    intermediate_lights: Sequence[ChildLightState] = ()
+    """Lights with temperatures between the warm and cold ones, whose output is linear, in any order"""
+
     def current_temperature(self) -> int:
         """Compute the current combined temperature."""
 
-        combined_temperature, _ = rgbww_to_color_temperature(
-            (0, 0, 0, self.cold_light.brightness, self.warm_light.brightness),
-            self.warm_light.color_temp_kelvin,
-            self.cold_light.color_temp_kelvin,
+        warm_output = (
+            self.warm_light.brightness
+            if self.warm_calibration is None
+            else self.warm_calibration.forward[self.warm_light.brightness]
         )
-
-        # Clamp the computed temperature between the min and maximum supported temperatures
-        return max(
-            self.warm_light.color_temp_kelvin,
-            min(self.cold_light.color_temp_kelvin, combined_temperature),
+        cold_output = (
+            self.cold_light.brightness
+            if self.cold_calibration is None
+            else self.cold_calibration.forward[self.cold_light.brightness]
         )
+        if not self.intermediate_lights:
+            return MixerModel.from_kelvin(
+                self.warm_light.color_temp_kelvin, self.cold_light.color_temp_kelvin
+            ).current_temperature(warm_output, cold_output)
+
+        intermediate_lights = sorted(self.intermediate_lights, key=lambda light: light.color_temp_kelvin)
+        return MultiChannelModel.from_kelvin(
+            [
+                self.warm_light.color_temp_kelvin,
+                *(light.color_temp_kelvin for light in intermediate_lights),
+                self.cold_light.color_temp_kelvin,
+            ]
+        ).current_temperature([warm_output, *(light.brightness for light in intermediate_lights), cold_output])
 
 
 @dataclass
 class BrightnessCalculator:
-    """Class that given a target temperature and target, computes the brightness of the two combined lights."""
+    """Class that given a target temperature and target, computes the brightness of the two combined lights.
+
+    Mixers computing many targets should reuse a `MixerModel` instead.
+    """
 
     warm_temperature_kelvin: int
     """Temperature of the warm light in kelvin"""
@@ -48,9 +89,22 @@ class BrightnessCalculator:
     priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED
     """Govern the behavior when we we want to reach a brightness and temperature outside the admissible range"""
 
+    temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT
+    """Weight of the temperature error relative to the brightness error, used by the MIXED priority"""
+
+    warm_calibration: ChannelCalibration | None = None
+    """Output of the warm light at each brightness, linear if None"""
+    cold_calibration: ChannelCalibration | None = None
+    """Output of the cold light at each brightness, linear if None"""
+
+    intermediate_temperatures_kelvin: Sequence[int] = ()
+    """Temperatures of the lights between the warm and cold ones, whose output is linear, in any order"""
+
     def compute_brightnesses(self) -> tuple[int, int]:
         """Compute the warm and cold light brightness required to reach the target temperature.
 
+        The brightnesses are served by the cache shared with the mixers, computing them only on a miss.
+
         Returns:
             (warm, cold) brightness in range 1-255
 
@@ -63,142 +117,210 @@ def compute_brightnesses(self) -> tuple[int, int]:
             self.priority.name,
         )
 
-        # Convert temperature to mired to operate on a linear temperature space
-        target_temperature_mired = color_temperature_kelvin_to_mired(self.target_temperature_kelvin)
-        warm_temperature_mired = color_temperature_kelvin_to_mired(self.warm_temperature_kelvin)
-        cold_temperature_mired = color_temperature_kelvin_to_mired(self.cold_temperature_kelvin)
-
-        # These functions are obtained by inverting the one defined in the util module `rgbww_to_color_temperature()`
-        cold_brightness, warm_brightness = self._decompose_brightnesses(
-            target_temperature_mired,
-            self.target_brightness,
-            warm_temperature_mired,
-            cold_temperature_mired,
+        return self._calibrate(
+            *BRIGHTNESS_CACHE.compute_brightnesses(
+                self.model, self.target_temperature_kelvin, self.target_brightness, self.priority
+            )
         )
 
-        # Compute the half-point between the range of possible temperatures
-        half_temperature_mired = (warm_temperature_mired + cold_temperature_mired) / 2
+    def compute_mired_brightnesses(self, target_temperature_mired: int) -> tuple[int, int]:
+        """Compute the warm and cold light brightness required to reach a target temperature expressed in mired.
 
-        # Flag that takes into account if the target temperature is in the first or second half of the temperature range
-        is_temp_in_second_half = target_temperature_mired > half_temperature_mired
+        The `target_temperature_kelvin` field is ignored.
 
-        if is_temp_in_second_half and warm_brightness > BRIGHTNESS_RANGE[1]:
-            # If the computed warm brightness is greater than the achievable brightness, mirror the temperature against the x=target_temperature_mired line,
-            # obtaining the specular case than the one in the other branch
-            mirrored_temperature_mired = 2 * half_temperature_mired - target_temperature_mired
-            cold_brightness, warm_brightness = self._target_outside_range(
-                mirrored_temperature_mired,
-                warm_temperature_mired,
-                cold_temperature_mired,
-            )
-        elif cold_brightness > BRIGHTNESS_RANGE[1]:
-            # If the cold brightness is greater than the achievable brightness, scale it back to an acceptable range,
-            # depending on the priority between brightness and temperature
-            warm_brightness, cold_brightness = self._target_outside_range(
-                target_temperature_mired, warm_temperature_mired, cold_temperature_mired
-            )
+        Returns:
+            (warm, cold) brightness in range 1-255
+
+        """
 
-        # Clamp brightness to acceptable ranges
-        warm_brightness = min(warm_brightness, BRIGHTNESS_RANGE[1])
-        cold_brightness = min(cold_brightness, BRIGHTNESS_RANGE[1])
+        return self._calibrate(
+            *self.model.compute_mired_brightnesses(target_temperature_mired, self.target_brightness, self.priority)
+        )
+
+    def _calibrate(self, warm_brightness: int, cold_brightness: int) -> tuple[int, int]:
+        """Convert the outputs of linear lights computed by the model to the brightnesses giving those outputs."""
+
+        if self.warm_calibration is not None:
+            warm_brightness = self.warm_calibration.inverse[warm_brightness]
+        if self.cold_calibration is not None:
+            cold_brightness = self.cold_calibration.inverse[cold_brightness]
         return warm_brightness, cold_brightness
 
-    def _target_outside_range(
-        self, target_temperature_mired, warm_temperature_mired, cold_temperature_mired
-    ) -> tuple[int, int]:
-        """Compute ad adjusted brightness and temperature when outside the achievable range.
+    def compute_channel_brightnesses(self) -> tuple[int, ...]:
+        """Compute the brightness of every light, including the intermediate ones, to reach the target.
+
+        At most the two lights adjacent to the target temperature are on.
+
+        Returns:
+            brightness of each light in range 0-255, from the warmest to the coldest
 
-        Given a target_temperature outside the achievable range, compute a new target_temperature or target_brightness depending on the configured BrightnessTemperaturePriority.
         """
-        match self.priority:
+
+        brightnesses = list(
+            MultiChannelModel.from_kelvin(
+                [self.warm_temperature_kelvin, *self.intermediate_temperatures_kelvin, self.cold_temperature_kelvin],
+                self.temperature_weight,
+            ).compute_brightnesses(self.target_temperature_kelvin, self.target_brightness, self.priority)
+        )
+        if self.warm_calibration is not None:
+            brightnesses[0] = self.warm_calibration.inverse[brightnesses[0]]
+        if self.cold_calibration is not None:
+            brightnesses[-1] = self.cold_calibration.inverse[brightnesses[-1]]
+        return tuple(brightnesses)
+
+    @cached_property
+    def model(self) -> MixerModel:
+        """Return the model of the mixer performing the computation, built on first access."""
+        return MixerModel.from_kelvin(
+            self.warm_temperature_kelvin, self.cold_temperature_kelvin, self.temperature_weight
+        )
+
+
+def compute_brightnesses_batch(
+    warm_temperature_kelvin: int,
+    cold_temperature_kelvin: int,
+    target_temperatures_kelvin: ArrayLike,
+    target_brightnesses: ArrayLike,
+    *,
+    priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `MixerModel.compute_brightnesses()`, for many targets of the same mixer at once.
+
+    The target arrays are broadcast against each other. NumPy is imported on the first call, it is not a requirement of
+    the integration: callers must handle the ImportError raised when it is not installed.
+
+    Returns:
+        (warm, cold) brightness arrays, identical to the ones computed one target at a time
+
+    """
+    import numpy as np  # noqa: PLC0415
+
+    target_temperatures_mired = np.floor(1_000_000 / np.asarray(target_temperatures_kelvin, dtype=np.float64))
+    return compute_mired_brightnesses_batch(
+        warm_temperature_kelvin,
+        cold_temperature_kelvin,
+        target_temperatures_mired,
+        target_brightnesses,
+        priority=priority,
+        temperature_weight=temperature_weight,
+    )
+
+
+def compute_mired_brightnesses_batch(
+    warm_temperature_kelvin: int,
+    cold_temperature_kelvin: int,
+    target_temperatures_mired: ArrayLike,
+    target_brightnesses: ArrayLike,
+    *,
+    priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `MixerModel.compute_mired_brightnesses()`, for many targets of the same mixer at once.
+
+    Every step performs the same floating point operations as the scalar path, in the same order, so that the
+    results match exactly. The MIXED projection evaluates every achievable integer mired for each target instead of
+    running the Newton iteration, which selects the same point and is cheaper when vectorized. As
+    `compute_brightnesses_batch()`, raises ImportError when NumPy is not installed.
+
+    Returns:
+        (warm, cold) brightness arrays, identical to the ones computed one target at a time
+
+    """
+    import numpy as np  # noqa: PLC0415
+
+    warm_temperature_mired = color_temperature_kelvin_to_mired(warm_temperature_kelvin)
+    cold_temperature_mired = color_temperature_kelvin_to_mired(cold_temperature_kelvin)
+
+    def decompose_brightnesses(temperatures_mired, brightnesses) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `MixerModel._decompose_brightnesses()`, returning (cold, warm)."""
+        cold_brightnesses = np.rint(
+            (2 * brightnesses)
+            * (temperatures_mired - warm_temperature_mired)
+            / (cold_temperature_mired - warm_temperature_mired)
+        )
+        warm_brightnesses = np.rint(
+            (2 * brightnesses)
+            * (cold_temperature_mired - temperatures_mired)
+            / (cold_temperature_mired - warm_temperature_mired)
+        )
+        return cold_brightnesses, warm_brightnesses
+
+    def find_closest_achievable_targets(temperatures_mired, brightnesses) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `MixerModel._find_closest_achievable_target()`."""
+        scale = BRIGHTNESS_RANGE[1] * (cold_temperature_mired - warm_temperature_mired) / 2
+        lowest_temperature_mired = cold_temperature_mired
+        highest_temperature_mired = int((warm_temperature_mired + cold_temperature_mired) / 2) - 1
+        if highest_temperature_mired < lowest_temperature_mired:
+            return (
+                np.full(len(temperatures_mired), cold_temperature_mired),
+                np.full(len(temperatures_mired), int(scale / (cold_temperature_mired - warm_temperature_mired))),
+            )
+
+        candidates_mired = np.arange(lowest_temperature_mired, highest_temperature_mired + 1)
+        candidates_brightness = np.trunc(scale / (candidates_mired - warm_temperature_mired))
+
+        # argmin() returns the first minimum, resolving ties in favor of the coldest temperature as the scalar path
+        closest = np.empty(len(temperatures_mired), dtype=np.intp)
+        for start in range(0, len(temperatures_mired), BATCH_MIXED_CHUNK_SIZE):
+            chunk = slice(start, start + BATCH_MIXED_CHUNK_SIZE)
+            distances = (
+                temperature_weight * (temperatures_mired[chunk, np.newaxis] - candidates_mired) ** 2
+                + (brightnesses[chunk, np.newaxis] - candidates_brightness) ** 2
+            )
+            closest[chunk] = np.argmin(distances, axis=1)
+
+        return candidates_mired[closest], candidates_brightness[closest]
+
+    def target_outside_range(temperatures_mired, brightnesses) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `MixerModel._target_outside_range()`, returning (warm, cold)."""
+        match priority:
             case BrightnessTemperaturePriority.BRIGHTNESS:
-                # Find the horizontal projection of the point (target_temp, target_brightness) on the hyperbolic curve
-                new_target_brightness = self.target_brightness
-                new_target_temperature_mired = (
-                    (2 * self.target_brightness * warm_temperature_mired)
+                new_brightnesses = brightnesses
+                new_temperatures_mired = (
+                    (2 * brightnesses * warm_temperature_mired)
                     + BRIGHTNESS_RANGE[1] * cold_temperature_mired
                     - BRIGHTNESS_RANGE[1] * warm_temperature_mired
-                ) / (2 * self.target_brightness)
-
-                LOGGER.debug("Computed new target_temperature: %d", new_target_temperature_mired)
-
+                ) / (2 * brightnesses)
             case BrightnessTemperaturePriority.TEMPERATURE:
-                # Find the vertical projection of the point (target_temp, target_brightness) on the hyperbolic curve
-                new_target_temperature_mired = target_temperature_mired
-                new_target_brightness = (
+                new_temperatures_mired = temperatures_mired
+                new_brightnesses = (
                     BRIGHTNESS_RANGE[1]
                     * (cold_temperature_mired - warm_temperature_mired)
-                    / (2 * (target_temperature_mired - warm_temperature_mired))
+                    / (2 * (temperatures_mired - warm_temperature_mired))
                 )
-                LOGGER.debug("Computed new target_brightness: %d", new_target_brightness)
-
             case BrightnessTemperaturePriority.MIXED:
-                new_target_temperature_mired, new_target_brightness = self._find_closest_achievable_target(
-                    target_temperature_mired,
-                    warm_temperature_mired,
-                    cold_temperature_mired,
-                )
-                LOGGER.debug(
-                    "Computed new target_temperature: %d, target_brightness: %d",
-                    new_target_temperature_mired,
-                    new_target_brightness,
+                new_temperatures_mired, new_brightnesses = find_closest_achievable_targets(
+                    temperatures_mired, brightnesses
                 )
 
-        cold_brightness, warm_brightness = self._decompose_brightnesses(
-            target_temperature_mired=new_target_temperature_mired,
-            target_brightness=new_target_brightness,
-            warm_temperature_mired=warm_temperature_mired,
-            cold_temperature_mired=cold_temperature_mired,
-        )
-        return warm_brightness, cold_brightness
-
-    def _decompose_brightnesses(
-        self,
-        target_temperature_mired,
-        target_brightness,
-        warm_temperature_mired,
-        cold_temperature_mired,
-    ):
-        """Compute the warm and cold brightnesses required to reach the target temperature and brightness combo."""
-
-        cold_brightness = round(
-            (2 * target_brightness)
-            * (target_temperature_mired - warm_temperature_mired)
-            / (cold_temperature_mired - warm_temperature_mired)
-        )
-        warm_brightness = round(
-            (2 * target_brightness)
-            * (cold_temperature_mired - target_temperature_mired)
-            / (cold_temperature_mired - warm_temperature_mired)
-        )
+        cold_brightnesses, warm_brightnesses = decompose_brightnesses(new_temperatures_mired, new_brightnesses)
+        return warm_brightnesses, cold_brightnesses
 
-        LOGGER.debug("Decomposed brightnesses cold: %d, warm: %d", cold_brightness, warm_brightness)
-
-        return cold_brightness, warm_brightness
-
-    def _find_closest_achievable_target(
-        self,
-        target_temperature_mired: int,
-        warm_temperature_mired: int,
-        cold_temperature_mired: int,
-    ):
-        def brightness_value(temp):
-            """Compute the combined brightness given a temperature."""
-            return int(
-                BRIGHTNESS_RANGE[1]
-                * (cold_temperature_mired - warm_temperature_mired)
-                / (2 * (temp - warm_temperature_mired))
-            )
+    target_temperatures_mired, target_brightnesses = np.broadcast_arrays(
+        np.asarray(target_temperatures_mired, dtype=np.float64), np.asarray(target_brightnesses, dtype=np.int64)
+    )
+    shape = target_temperatures_mired.shape
+    target_temperatures_mired = target_temperatures_mired.ravel()
+    target_brightnesses = target_brightnesses.ravel()
 
-        half_temperature_mired = int((warm_temperature_mired + cold_temperature_mired) / 2)
+    cold_brightnesses, warm_brightnesses = decompose_brightnesses(target_temperatures_mired, target_brightnesses)
 
-        # Init variables
-        closest_temperature_mired, best_distance = cold_temperature_mired, math.inf
+    half_temperature_mired = (warm_temperature_mired + cold_temperature_mired) / 2
+    # Same branches as the scalar path: the warm excess is handled by mirroring the target around the half-point
+    mirrored = (target_temperatures_mired > half_temperature_mired) & (warm_brightnesses > BRIGHTNESS_RANGE[1])
+    projected = ~mirrored & (cold_brightnesses > BRIGHTNESS_RANGE[1])
 
-        # Distance between target point and hyperbolic curve of achievable brightness targets
-        for x in range(cold_temperature_mired, half_temperature_mired):
-            d = (target_temperature_mired - x) ** 2 + (self.target_brightness - brightness_value(x)) ** 2
-            if d < best_distance:
-                closest_temperature_mired, best_distance = x, d
+    if mirrored.any():
+        cold_brightnesses[mirrored], warm_brightnesses[mirrored] = target_outside_range(
+            2 * half_temperature_mired - target_temperatures_mired[mirrored], target_brightnesses[mirrored]
+        )
+    if projected.any():
+        warm_brightnesses[projected], cold_brightnesses[projected] = target_outside_range(
+            target_temperatures_mired[projected], target_brightnesses[projected]
+        )
 
-        return closest_temperature_mired, brightness_value(closest_temperature_mired)
+    return (
+        np.minimum(warm_brightnesses, BRIGHTNESS_RANGE[1]).astype(np.int64).reshape(shape),
+        np.minimum(cold_brightnesses, BRIGHTNESS_RANGE[1]).astype(np.int64).reshape(shape),
+    )
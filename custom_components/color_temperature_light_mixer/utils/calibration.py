@@ -0,0 +1,110 @@
+"""Calibration of the light output of a channel, for lights whose output is not linear in their brightness."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import pairwise
+from typing import Self
+
+from custom_components.color_temperature_light_mixer.const import BRIGHTNESS_RANGE
+
+
+class ChannelCalibration:
+    """Light output of a channel for each of its brightnesses, compiled into forward and inverse lookup tables.
+
+    The mixer computes the brightnesses of the lights assuming that their output is linear: a calibration maps those
+    linear outputs to the brightnesses actually sent to the lights, and back the brightnesses reported by the lights
+    to their outputs, with a single indexed read each.
+
+    `forward[brightness]` is the output at each brightness in 0...255, as a float on the same 0...255 scale.
+    `inverse[output]` is the brightness whose output is closest to each integer output in 0...255, never turning off a
+    light with a positive output.
+    """
+
+    __slots__ = ("forward", "inverse")
+
+    def __init__(self, relative_outputs: Sequence[float]) -> None:
+        """Compile the relative outputs in 0...1 at each brightness in 0...255, non decreasing."""
+
+        if len(relative_outputs) != BRIGHTNESS_RANGE[1] + 1:
+            raise ValueError(f"Expected {BRIGHTNESS_RANGE[1] + 1} outputs, got {len(relative_outputs)}")
+        if any(later < earlier for earlier, later in pairwise(relative_outputs)):
+            raise ValueError("The light output must not decrease as the brightness increases")
+
+        self.forward = array("d", (output * BRIGHTNESS_RANGE[1] for output in relative_outputs))
+
+        inverse = bytearray(BRIGHTNESS_RANGE[1] + 1)
+        brightness = BRIGHTNESS_RANGE[0]
+        for output in range(1, BRIGHTNESS_RANGE[1] + 1):
+            # Highest brightness not exceeding the output, which only moves forward as the outputs do not decrease
+            while brightness < BRIGHTNESS_RANGE[1] and self.forward[brightness + 1] <= output:
+                brightness += 1
+            closer_above = (
+                brightness < BRIGHTNESS_RANGE[1]
+                and self.forward[brightness + 1] - output < output - self.forward[brightness]
+            )
+            inverse[output] = brightness + 1 if closer_above else brightness
+        self.inverse = bytes(inverse)
+
+    @classmethod
+    def from_gamma(cls, gamma: float) -> Self:
+        """Compile the calibration of a light whose output is (brightness / 255) ** gamma."""
+
+        if gamma <= 0:
+            raise ValueError(f"The gamma exponent must be positive, got {gamma}")
+        return cls([(brightness / BRIGHTNESS_RANGE[1]) ** gamma for brightness in range(BRIGHTNESS_RANGE[1] + 1)])
+
+    @classmethod
+    def from_points(cls, points: Sequence[tuple[int, float]]) -> Self:
+        """Compile the calibration interpolating linearly between measured (brightness, output) points.
+
+        The points must have increasing brightnesses ending at 255. The output at brightness 0 is zero unless
+        measured, and the outputs are relative to the one at brightness 255, in any unit such as lumen or lux.
+        """
+
+        brightnesses = [brightness for brightness, _ in points]
+        outputs = [output for _, output in points]
+        if not points or brightnesses[-1] != BRIGHTNESS_RANGE[1]:
+            raise ValueError(f"The last measured point must be at brightness {BRIGHTNESS_RANGE[1]}")
+        if any(later <= earlier for earlier, later in pairwise(brightnesses)):
+            raise ValueError("The measured brightnesses must be increasing")
+        if brightnesses[0] < 0 or min(outputs) < 0 or outputs[-1] <= 0:
+            raise ValueError(
+                "The measured brightnesses and outputs must not be negative, nor the output at full brightness zero"
+            )
+        if brightnesses[0] != 0:
+            brightnesses.insert(0, 0)
+            outputs.insert(0, 0.0)
+
+        relative_outputs = []
+        for brightness in range(BRIGHTNESS_RANGE[1] + 1):
+            # Segment of the points containing the brightness
+            index = min(bisect_right(brightnesses, brightness), len(brightnesses) - 1)
+            low, high = brightnesses[index - 1], brightnesses[index]
+            output = outputs[index - 1] + (outputs[index] - outputs[index - 1]) * (brightness - low) / (high - low)
+            relative_outputs.append(output / outputs[-1])
+        return cls(relative_outputs)
+
+    @classmethod
+    def from_option(cls, text: str) -> Self | None:
+        """Parse a calibration option: nothing for a linear light, a gamma exponent, or `brightness:output` pairs.
+
+        For example "2.2" or "0:0, 64:35, 128:160, 255:800". Raises a `ValueError` if the option is not valid.
+        """
+
+        text = text.strip()
+        if not text:
+            return None
+        if ":" not in text:
+            gamma = float(text)
+            return None if gamma == 1 else cls.from_gamma(gamma)
+
+        points = []
+        for point in text.split(","):
+            brightness, separator, output = point.partition(":")
+            if not separator:
+                raise ValueError(f"Expected a brightness:output pair, got {point.strip()!r}")
+            points.append((int(brightness), float(output)))
+        return cls.from_points(points)
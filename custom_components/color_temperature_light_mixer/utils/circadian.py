@@ -0,0 +1,32 @@
+"""Daylight curve followed by the mixers in circadian mode."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import math
+
+from homeassistant.util.color import color_temperature_kelvin_to_mired, color_temperature_mired_to_kelvin
+
+
+def daylight_fraction(now: datetime, sunrise: datetime | None, sunset: datetime | None) -> float:
+    """Return how far the day is from night, from 0 before sunrise and after sunset to 1 at solar noon.
+
+    The fraction follows a half sine between sunrise and sunset, rising quickly in the morning and falling in the
+    evening. Without a sunrise or a sunset, e.g. during the polar night, it is 0.
+    """
+
+    if sunrise is None or sunset is None or not sunrise < now < sunset:
+        return 0.0
+    return math.sin(math.pi * (now - sunrise) / (sunset - sunrise))
+
+
+def circadian_temperature(warm_temperature_kelvin: int, cold_temperature_kelvin: int, fraction: float) -> int:
+    """Return the temperature of a mixer at the given daylight fraction, interpolated in mireds across its range.
+
+    The temperature is clamped to the range, since the conversion to whole mireds and back moves its ends.
+    """
+
+    warm_mired = color_temperature_kelvin_to_mired(warm_temperature_kelvin)
+    cold_mired = color_temperature_kelvin_to_mired(cold_temperature_kelvin)
+    temperature_kelvin = round(color_temperature_mired_to_kelvin(warm_mired + (cold_mired - warm_mired) * fraction))
+    return min(cold_temperature_kelvin, max(warm_temperature_kelvin, temperature_kelvin))
@@ -0,0 +1,204 @@
+"""Precomputed lookup tables replacing the per-call computations of a mixer."""
+
+from __future__ import annotations
+
+from array import array
+
+from custom_components.color_temperature_light_mixer.const import (
+    BRIGHTNESS_RANGE,
+    BRIGHTNESS_TABLE_MAX_BYTES,
+    DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+    LOGGER,
+)
+from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+from .calculator import compute_mired_brightnesses_batch
+from .calibration import ChannelCalibration
+from .mixer_model import MixerModel
+
+
+class BrightnessLookupTable:
+    """(warm, cold) brightnesses of a mixer, precomputed for every target mired, brightness and priority.
+
+    Each priority is stored as a flat `bytes` object holding a (warm, cold) pair for every integer mired between the
+    cold and the warm temperature and every brightness in 1...255, so each table takes
+    `(warm_mired - cold_mired + 1) * 255 * 2` bytes, and the three of them `nbytes_for()` bytes in total:
+    about 250 KiB for a 3000K-6000K mixer and 520 KiB for a 2000K-6500K one.
+    Mixers whose tables would exceed `BRIGHTNESS_TABLE_MAX_BYTES` are rejected with a `ValueError`.
+
+    The tables are computed with the NumPy batch API when NumPy is installed, it is not a requirement of the
+    integration: otherwise they are computed one target at a time with `MixerModel`, with identical results. Tables of
+    another type of model, such as `FixedPointMixerModel`, are always computed one target at a time with that model.
+    """
+
+    def __init__(
+        self,
+        warm_temperature_kelvin: int,
+        cold_temperature_kelvin: int,
+        temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+        model_type: type[MixerModel] = MixerModel,
+    ) -> None:
+        """Compute the tables for all the priorities. This is CPU bound, run it in the executor."""
+
+        nbytes = self.nbytes_for(warm_temperature_kelvin, cold_temperature_kelvin)
+        if not 0 < nbytes <= BRIGHTNESS_TABLE_MAX_BYTES:
+            raise ValueError(
+                f"Brightness lookup table for {warm_temperature_kelvin}K-{cold_temperature_kelvin}K would take "
+                f"{nbytes} bytes, outside the allowed range of 1...{BRIGHTNESS_TABLE_MAX_BYTES}"
+            )
+
+        self.warm_temperature_kelvin = warm_temperature_kelvin
+        self.cold_temperature_kelvin = cold_temperature_kelvin
+        self._warm_temperature_mired = color_temperature_kelvin_to_mired(warm_temperature_kelvin)
+        self._cold_temperature_mired = color_temperature_kelvin_to_mired(cold_temperature_kelvin)
+
+        if model_type is not MixerModel:
+            # The batch API reproduces the floating point arithmetic of MixerModel only
+            self._tables = self._compute_tables(
+                model_type.from_kelvin(warm_temperature_kelvin, cold_temperature_kelvin, temperature_weight)
+            )
+            return
+
+        try:
+            self._tables = self._compute_tables_batch(temperature_weight)
+        except ImportError:
+            LOGGER.warning(
+                "NumPy is not installed, computing the brightness lookup table of %sK-%sK one target at a time",
+                warm_temperature_kelvin,
+                cold_temperature_kelvin,
+            )
+            self._tables = self._compute_tables(
+                MixerModel.from_kelvin(warm_temperature_kelvin, cold_temperature_kelvin, temperature_weight)
+            )
+
+    def _compute_tables_batch(self, temperature_weight: float) -> dict[BrightnessTemperaturePriority, bytes]:
+        """Compute the tables for all the priorities with the NumPy batch API, raising ImportError without NumPy."""
+        import numpy as np  # noqa: PLC0415
+
+        target_temperatures_mired, target_brightnesses = np.meshgrid(
+            np.arange(self._cold_temperature_mired, self._warm_temperature_mired + 1),
+            np.arange(1, BRIGHTNESS_RANGE[1] + 1),
+            indexing="ij",
+        )
+        tables: dict[BrightnessTemperaturePriority, bytes] = {}
+        for priority in BrightnessTemperaturePriority:
+            warm_brightnesses, cold_brightnesses = compute_mired_brightnesses_batch(
+                self.warm_temperature_kelvin,
+                self.cold_temperature_kelvin,
+                target_temperatures_mired,
+                target_brightnesses,
+                priority=priority,
+                temperature_weight=temperature_weight,
+            )
+            # Interleave the (warm, cold) pairs, row by row
+            tables[priority] = np.stack((warm_brightnesses, cold_brightnesses), axis=-1).astype(np.uint8).tobytes()
+        return tables
+
+    def _compute_tables(self, model: MixerModel) -> dict[BrightnessTemperaturePriority, bytes]:
+        """Compute the tables for all the priorities one target at a time, in the same layout as the batch API."""
+
+        tables: dict[BrightnessTemperaturePriority, bytes] = {}
+        for priority in BrightnessTemperaturePriority:
+            table = bytearray()
+            for target_temperature_mired in range(self._cold_temperature_mired, self._warm_temperature_mired + 1):
+                for target_brightness in range(1, BRIGHTNESS_RANGE[1] + 1):
+                    table.extend(
+                        model.compute_mired_brightnesses(target_temperature_mired, target_brightness, priority)
+                    )
+            tables[priority] = bytes(table)
+        return tables
+
+    @staticmethod
+    def nbytes_for(warm_temperature_kelvin: int, cold_temperature_kelvin: int) -> int:
+        """Return the memory taken by the tables of a mixer with the given temperatures."""
+        rows = (
+            color_temperature_kelvin_to_mired(warm_temperature_kelvin)
+            - color_temperature_kelvin_to_mired(cold_temperature_kelvin)
+            + 1
+        )
+        return rows * BRIGHTNESS_RANGE[1] * 2 * len(BrightnessTemperaturePriority)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory taken by the tables."""
+        return sum(len(table) for table in self._tables.values())
+
+    def lookup(
+        self, target_temperature_kelvin: int, target_brightness: int, priority: BrightnessTemperaturePriority
+    ) -> tuple[int, int]:
+        """Return the (warm, cold) brightnesses for a target inside the mixer temperature range and brightness 1...255."""
+
+        row = color_temperature_kelvin_to_mired(target_temperature_kelvin) - self._cold_temperature_mired
+        offset = 2 * (row * BRIGHTNESS_RANGE[1] + target_brightness - 1)
+        table = self._tables[priority]
+        return table[offset], table[offset + 1]
+
+    def lookup_mired(
+        self, target_temperature_mired: int, target_brightness: int, priority: BrightnessTemperaturePriority
+    ) -> tuple[int, int]:
+        """Return the (warm, cold) brightnesses for a target expressed in mired, otherwise as `lookup()`."""
+
+        offset = 2 * (
+            (target_temperature_mired - self._cold_temperature_mired) * BRIGHTNESS_RANGE[1] + target_brightness - 1
+        )
+        table = self._tables[priority]
+        return table[offset], table[offset + 1]
+
+
+class TemperatureLookupTable:
+    """Combined temperature of a mixer, precomputed for every pair of (warm, cold) brightnesses.
+
+    The 256x256 temperatures are stored in a row of 256 unsigned shorts per warm brightness, indexed by the cold
+    brightness, taking 128 KiB once filled. When `lazy` is set each entry is computed on its first lookup instead, zero
+    marking the ones not computed yet, and each row is allocated on the first lookup of its warm brightness, so that
+    the table only takes 512 bytes for each warm brightness reached by the light.
+    The calibrations of the lights, if any, are folded in the entries, so they are still indexed by the brightnesses.
+    """
+
+    def __init__(
+        self,
+        warm_temperature_kelvin: int,
+        cold_temperature_kelvin: int,
+        *,
+        lazy: bool = False,
+        warm_calibration: ChannelCalibration | None = None,
+        cold_calibration: ChannelCalibration | None = None,
+    ) -> None:
+        """Allocate the table, computing all its entries unless `lazy`. This is CPU bound, run it in the executor."""
+
+        self._model = MixerModel.from_kelvin(warm_temperature_kelvin, cold_temperature_kelvin)
+        # Outputs of the lights at each brightness
+        self._warm_outputs = range(BRIGHTNESS_RANGE[1] + 1) if warm_calibration is None else warm_calibration.forward
+        self._cold_outputs = range(BRIGHTNESS_RANGE[1] + 1) if cold_calibration is None else cold_calibration.forward
+
+        # A kelvin value is never zero, so a zero-filled row has no entry computed yet
+        self._typecode = "H" if cold_temperature_kelvin <= 0xFFFF else "I"
+        self._rows: list[array | None] = [None] * (BRIGHTNESS_RANGE[1] + 1)
+
+        if not lazy:
+            current_temperature = self._model.current_temperature
+            for warm_brightness in range(BRIGHTNESS_RANGE[1] + 1):
+                warm_output = self._warm_outputs[warm_brightness]
+                self._rows[warm_brightness] = array(
+                    self._typecode,
+                    (current_temperature(warm_output, cold_output) for cold_output in self._cold_outputs),
+                )
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory taken by the rows allocated so far."""
+        return sum(len(row) * row.itemsize for row in self._rows if row is not None)
+
+    def lookup(self, warm_brightness: int, cold_brightness: int) -> int:
+        """Return the combined temperature in kelvin for brightnesses in 0...255."""
+
+        if (row := self._rows[warm_brightness]) is None:
+            row = self._rows[warm_brightness] = array(
+                self._typecode, bytes(array(self._typecode).itemsize * (BRIGHTNESS_RANGE[1] + 1))
+            )
+        if not (temperature := row[cold_brightness]):
+            temperature = row[cold_brightness] = self._model.current_temperature(
+                self._warm_outputs[warm_brightness], self._cold_outputs[cold_brightness]
+            )
+        return temperature
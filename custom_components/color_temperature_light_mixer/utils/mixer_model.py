@@ -0,0 +1,404 @@
+"""Immutable model of a mixer, holding the constants derived from its light temperatures."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Self
+
+from custom_components.color_temperature_light_mixer.const import (
+    BRIGHTNESS_RANGE,
+    DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+    FIXED_POINT_SHIFT,
+    MIXED_SOLVER_MAX_ITERATIONS,
+)
+from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+
+@dataclass(frozen=True, slots=True)
+class MixerModel:
+    """Brightness and temperature calculations of a mixer with a fixed pair of warm and cold lights.
+
+    The mired constants are computed once in `from_kelvin()`, so that each calculation only does the arithmetic
+    depending on its target and allocates nothing besides the returned tuple.
+    """
+
+    warm_temperature_kelvin: int
+    """Temperature of the warm light in kelvin"""
+    cold_temperature_kelvin: int
+    """Temperature of the cold light in kelvin"""
+    temperature_weight: float
+    """Weight of the temperature error relative to the brightness error, used by the MIXED priority"""
+
+    warm_temperature_mired: int
+    """Temperature of the warm light in mired"""
+    cold_temperature_mired: int
+    """Temperature of the cold light in mired"""
+    half_temperature_mired: float
+    """Half-point between the temperatures of the two lights in mired"""
+    curve_scale: float
+    """Constant k of the hyperbola b(x) = k / (x - warm_temperature_mired) of the achievable maximum brightnesses"""
+    highest_achievable_mired: int
+    """Warmest integer temperature considered when projecting a target on the achievable curve"""
+
+    @classmethod
+    def from_kelvin(
+        cls,
+        warm_temperature_kelvin: int,
+        cold_temperature_kelvin: int,
+        temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+    ) -> Self:
+        """Create the model of a mixer given the temperatures of its lights in kelvin."""
+
+        warm_temperature_mired = color_temperature_kelvin_to_mired(warm_temperature_kelvin)
+        cold_temperature_mired = color_temperature_kelvin_to_mired(cold_temperature_kelvin)
+        half_temperature_mired = (warm_temperature_mired + cold_temperature_mired) / 2
+        return cls(
+            warm_temperature_kelvin,
+            cold_temperature_kelvin,
+            temperature_weight,
+            warm_temperature_mired,
+            cold_temperature_mired,
+            half_temperature_mired,
+            BRIGHTNESS_RANGE[1] * (cold_temperature_mired - warm_temperature_mired) / 2,
+            int(half_temperature_mired) - 1,
+        )
+
+    def compute_brightnesses(
+        self,
+        target_temperature_kelvin: int,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    ) -> tuple[int, int]:
+        """Compute the warm and cold light brightness required to reach the target temperature and brightness.
+
+        Returns:
+            (warm, cold) brightness in range 1-255
+
+        """
+
+        # Convert temperature to mired to operate on a linear temperature space
+        return self.compute_mired_brightnesses(
+            color_temperature_kelvin_to_mired(target_temperature_kelvin), target_brightness, priority
+        )
+
+    def compute_mired_brightnesses(
+        self,
+        target_temperature_mired: float,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    ) -> tuple[int, int]:
+        """Compute the warm and cold light brightness required to reach a target temperature expressed in mired.
+
+        Returns:
+            (warm, cold) brightness in range 1-255
+
+        """
+
+        # These functions are obtained by inverting the one defined in the util module `rgbww_to_color_temperature()`
+        cold_brightness, warm_brightness = self._decompose_brightnesses(target_temperature_mired, target_brightness)
+
+        # Flag that takes into account if the target temperature is in the first or second half of the temperature range
+        is_temp_in_second_half = target_temperature_mired > self.half_temperature_mired
+
+        if is_temp_in_second_half and warm_brightness > BRIGHTNESS_RANGE[1]:
+            # If the computed warm brightness is greater than the achievable brightness, mirror the temperature against the x=target_temperature_mired line,
+            # obtaining the specular case than the one in the other branch
+            mirrored_temperature_mired = 2 * self.half_temperature_mired - target_temperature_mired
+            cold_brightness, warm_brightness = self._target_outside_range(
+                mirrored_temperature_mired, target_brightness, priority
+            )
+        elif cold_brightness > BRIGHTNESS_RANGE[1]:
+            # If the cold brightness is greater than the achievable brightness, scale it back to an acceptable range,
+            # depending on the priority between brightness and temperature
+            warm_brightness, cold_brightness = self._target_outside_range(
+                target_temperature_mired, target_brightness, priority
+            )
+
+        # Clamp brightness to acceptable ranges
+        return min(warm_brightness, BRIGHTNESS_RANGE[1]), min(cold_brightness, BRIGHTNESS_RANGE[1])
+
+    def current_temperature(self, warm_brightness: float, cold_brightness: float) -> int:
+        """Compute the combined temperature in kelvin of the two lights at the given brightnesses.
+
+        Same result as `rgbww_to_color_temperature()`, clamped between the temperatures of the two lights.
+        The brightnesses can also be the outputs of calibrated lights, on the same 0...255 scale.
+        """
+
+        brightness = warm_brightness / 255 + cold_brightness / 255
+        if brightness == 0:
+            # Return the warmest color if brightness is 0
+            return self.warm_temperature_kelvin
+
+        combined_temperature_mired = (cold_brightness / 255 / brightness) * (
+            self.cold_temperature_mired - self.warm_temperature_mired
+        ) + self.warm_temperature_mired
+        combined_temperature = round(math.floor(1000000 / combined_temperature_mired))
+
+        # Clamp the computed temperature between the min and maximum supported temperatures
+        return max(self.warm_temperature_kelvin, min(self.cold_temperature_kelvin, combined_temperature))
+
+    def _target_outside_range(
+        self,
+        target_temperature_mired: float,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority,
+    ) -> tuple[int, int]:
+        """Compute ad adjusted brightness and temperature when outside the achievable range.
+
+        Given a target_temperature outside the achievable range, compute a new target_temperature or target_brightness depending on the configured BrightnessTemperaturePriority.
+        """
+        match priority:
+            case BrightnessTemperaturePriority.BRIGHTNESS:
+                # Find the horizontal projection of the point (target_temp, target_brightness) on the hyperbolic curve
+                new_target_brightness = target_brightness
+                new_target_temperature_mired = (
+                    (2 * target_brightness * self.warm_temperature_mired)
+                    + BRIGHTNESS_RANGE[1] * self.cold_temperature_mired
+                    - BRIGHTNESS_RANGE[1] * self.warm_temperature_mired
+                ) / (2 * target_brightness)
+
+            case BrightnessTemperaturePriority.TEMPERATURE:
+                # Find the vertical projection of the point (target_temp, target_brightness) on the hyperbolic curve
+                new_target_temperature_mired = target_temperature_mired
+                new_target_brightness = (
+                    BRIGHTNESS_RANGE[1]
+                    * (self.cold_temperature_mired - self.warm_temperature_mired)
+                    / (2 * (target_temperature_mired - self.warm_temperature_mired))
+                )
+
+            case BrightnessTemperaturePriority.MIXED:
+                new_target_temperature_mired, new_target_brightness = self._find_closest_achievable_target(
+                    target_temperature_mired, target_brightness
+                )
+
+        cold_brightness, warm_brightness = self._decompose_brightnesses(
+            new_target_temperature_mired, new_target_brightness
+        )
+        return warm_brightness, cold_brightness
+
+    def _decompose_brightnesses(self, target_temperature_mired: float, target_brightness: float) -> tuple[int, int]:
+        """Compute the (cold, warm) brightnesses required to reach the target temperature and brightness combo."""
+
+        cold_brightness = round(
+            (2 * target_brightness)
+            * (target_temperature_mired - self.warm_temperature_mired)
+            / (self.cold_temperature_mired - self.warm_temperature_mired)
+        )
+        warm_brightness = round(
+            (2 * target_brightness)
+            * (self.cold_temperature_mired - target_temperature_mired)
+            / (self.cold_temperature_mired - self.warm_temperature_mired)
+        )
+        return cold_brightness, warm_brightness
+
+    def _find_closest_achievable_target(
+        self, target_temperature_mired: float, target_brightness: int
+    ) -> tuple[int, int]:
+        """Find the achievable (temperature, brightness) point closest to the target.
+
+        The achievable points lie on the hyperbola b(x) = k / (x - warm_temperature_mired), with
+        k = 255 * (cold_temperature_mired - warm_temperature_mired) / 2, sampled on the integer mireds between the cold
+        temperature and the half-point of the range.
+        The minimum of the weighted squared distance is first located on the continuous curve with a safeguarded Newton
+        iteration, then only the integer mireds around it that can still beat the best candidate are evaluated.
+        This returns the same point as a full scan of the range, at a fraction of the cost.
+        """
+        lowest_temperature_mired = self.cold_temperature_mired
+        highest_temperature_mired = self.highest_achievable_mired
+        if highest_temperature_mired < lowest_temperature_mired:
+            return lowest_temperature_mired, int(self._brightness_value(lowest_temperature_mired))
+
+        # The closest point lies between the vertical and the horizontal projections of the target on the curve
+        horizontal_projection_mired = self.warm_temperature_mired + self.curve_scale / target_brightness
+        low = min(
+            max(min(target_temperature_mired, horizontal_projection_mired), lowest_temperature_mired),
+            highest_temperature_mired,
+        )
+        high = min(
+            max(target_temperature_mired, horizontal_projection_mired, lowest_temperature_mired),
+            highest_temperature_mired,
+        )
+
+        if self._gradient(low, target_temperature_mired, target_brightness) >= 0:
+            closest_temperature_mired = low
+        elif self._gradient(high, target_temperature_mired, target_brightness) <= 0:
+            closest_temperature_mired = high
+        else:
+            closest_temperature_mired = (low + high) / 2
+            for _ in range(MIXED_SOLVER_MAX_ITERATIONS):
+                slope = self._gradient(closest_temperature_mired, target_temperature_mired, target_brightness)
+                if slope > 0:
+                    high = closest_temperature_mired
+                else:
+                    low = closest_temperature_mired
+
+                # Fallback to bisection whenever the Newton step leaves the bracket
+                second_derivative = self._curvature(closest_temperature_mired, target_brightness)
+                next_temperature_mired = (
+                    closest_temperature_mired - slope / second_derivative if second_derivative > 0 else low
+                )
+                if not low < next_temperature_mired < high:
+                    next_temperature_mired = (low + high) / 2
+
+                converged = abs(next_temperature_mired - closest_temperature_mired) < 0.25 or high - low < 1
+                closest_temperature_mired = next_temperature_mired
+                if converged:
+                    break
+
+        # Walk the integer mireds on both sides of the continuous solution, as long as they could still be closer.
+        # Ties are resolved in favor of the coldest temperature, as in a scan starting from the cold end.
+        start = int(min(max(round(closest_temperature_mired), lowest_temperature_mired), highest_temperature_mired))
+        best_temperature_mired = start
+        best_distance = self._distance(start, target_temperature_mired, target_brightness)
+
+        x = start - 1
+        while (
+            x >= lowest_temperature_mired
+            and self._distance_lower_bound(x, target_temperature_mired, target_brightness) <= best_distance
+        ):
+            if (d := self._distance(x, target_temperature_mired, target_brightness)) <= best_distance:
+                best_temperature_mired, best_distance = x, d
+            x -= 1
+
+        x = start + 1
+        while (
+            x <= highest_temperature_mired
+            and self._distance_lower_bound(x, target_temperature_mired, target_brightness) < best_distance
+        ):
+            if (d := self._distance(x, target_temperature_mired, target_brightness)) < best_distance:
+                best_temperature_mired, best_distance = x, d
+            x += 1
+
+        return best_temperature_mired, int(self._brightness_value(best_temperature_mired))
+
+    def _brightness_value(self, temp: float) -> float:
+        """Compute the combined brightness given a temperature."""
+        return self.curve_scale / (temp - self.warm_temperature_mired)
+
+    def _distance(self, temp: int, target_temperature_mired: float, target_brightness: int) -> float:
+        """Weighted distance between the target and an achievable point, using the truncated brightness."""
+        return (
+            self.temperature_weight * (target_temperature_mired - temp) ** 2
+            + (target_brightness - int(self._brightness_value(temp))) ** 2
+        )
+
+    def _distance_lower_bound(self, temp: int, target_temperature_mired: float, target_brightness: int) -> float:
+        """Lower bound of `_distance()`, since the truncation moves the brightness by less than one step."""
+        return (
+            self.temperature_weight * (target_temperature_mired - temp) ** 2
+            + max(0.0, abs(target_brightness - self._brightness_value(temp)) - 1) ** 2
+        )
+
+    def _gradient(self, temp: float, target_temperature_mired: float, target_brightness: int) -> float:
+        """Half of the derivative of the continuous weighted distance."""
+        brightness = self._brightness_value(temp)
+        return self.temperature_weight * (temp - target_temperature_mired) - (
+            brightness - target_brightness
+        ) * brightness / (temp - self.warm_temperature_mired)
+
+    def _curvature(self, temp: float, target_brightness: int) -> float:
+        """Half of the second derivative of the continuous weighted distance."""
+        brightness = self._brightness_value(temp)
+        slope = brightness / (temp - self.warm_temperature_mired)
+        return (
+            self.temperature_weight
+            + slope**2
+            + 2 * (brightness - target_brightness) * slope / (temp - self.warm_temperature_mired)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FixedPointMixerModel(MixerModel):
+    """`MixerModel` computing the decomposition and the BRIGHTNESS and TEMPERATURE projections with integers only.
+
+    Targets are whole mireds, so the decomposition divides by the same `warm - cold` mired span on every call: it is
+    replaced by a multiplication with its reciprocal, precomputed in `FIXED_POINT_SHIFT` bits, and a shift.
+    The projections reduce to closed forms once decomposed: the BRIGHTNESS one needs no division at all, the
+    TEMPERATURE one a single floor division. Only the MIXED projection still searches the curve in floating point.
+
+    Rounding is deterministic, halves of the cold brightness are rounded up and the warm one takes the rest of the
+    total brightness. The results differ from `MixerModel`, which rounds halves to even, by at most 1.
+    """
+
+    decomposition_reciprocal: int = field(init=False)
+    """Reciprocal of the `warm - cold` mired span, scaled by 2**FIXED_POINT_SHIFT and rounded up"""
+
+    def __post_init__(self) -> None:
+        """Precompute the reciprocal of the mired span."""
+        span = self.warm_temperature_mired - self.cold_temperature_mired
+        object.__setattr__(self, "decomposition_reciprocal", -(-(1 << FIXED_POINT_SHIFT) // span))
+
+    def compute_mired_brightnesses(
+        self,
+        target_temperature_mired: float,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    ) -> tuple[int, int]:
+        """Compute the warm and cold light brightness required to reach a target temperature expressed in mired.
+
+        Fractional targets are truncated to whole mireds.
+
+        Returns:
+            (warm, cold) brightness in range 1-255
+
+        """
+
+        target_temperature_mired = int(target_temperature_mired)
+        cold_brightness, warm_brightness = self._decompose_brightnesses(target_temperature_mired, target_brightness)
+
+        # Same branches as `MixerModel`, comparing twice the target with the sum of the mireds to stay in integers
+        if (
+            2 * target_temperature_mired > self.warm_temperature_mired + self.cold_temperature_mired
+            and warm_brightness > BRIGHTNESS_RANGE[1]
+        ):
+            cold_brightness, warm_brightness = self._target_outside_range(
+                self.warm_temperature_mired + self.cold_temperature_mired - target_temperature_mired,
+                target_brightness,
+                priority,
+            )
+        elif cold_brightness > BRIGHTNESS_RANGE[1]:
+            warm_brightness, cold_brightness = self._target_outside_range(
+                target_temperature_mired, target_brightness, priority
+            )
+
+        return min(warm_brightness, BRIGHTNESS_RANGE[1]), min(cold_brightness, BRIGHTNESS_RANGE[1])
+
+    def _target_outside_range(
+        self,
+        target_temperature_mired: int,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority,
+    ) -> tuple[int, int]:
+        """Compute the (warm, cold) brightnesses of the projection of a target outside the achievable range."""
+        match priority:
+            case BrightnessTemperaturePriority.BRIGHTNESS:
+                # The horizontal projection has the cold light at full brightness and the warm one providing the rest
+                return 2 * target_brightness - BRIGHTNESS_RANGE[1], BRIGHTNESS_RANGE[1]
+
+            case BrightnessTemperaturePriority.TEMPERATURE:
+                # The vertical projection has the cold light at full brightness, and the warm one at
+                # 255 * (target - cold) / (warm - target), rounded half up
+                numerator = 2 * BRIGHTNESS_RANGE[1] * (target_temperature_mired - self.cold_temperature_mired)
+                denominator = self.warm_temperature_mired - target_temperature_mired
+                return (numerator + denominator) // (2 * denominator), BRIGHTNESS_RANGE[1]
+
+            case BrightnessTemperaturePriority.MIXED:
+                new_target_temperature_mired, new_target_brightness = self._find_closest_achievable_target(
+                    target_temperature_mired, target_brightness
+                )
+                cold_brightness, warm_brightness = self._decompose_brightnesses(
+                    new_target_temperature_mired, new_target_brightness
+                )
+                return warm_brightness, cold_brightness
+
+    def _decompose_brightnesses(self, target_temperature_mired: int, target_brightness: int) -> tuple[int, int]:
+        """Compute the (cold, warm) brightnesses required to reach the target temperature and brightness combo."""
+
+        total_brightness = 2 * target_brightness
+        cold_brightness = (
+            total_brightness * (self.warm_temperature_mired - target_temperature_mired) * self.decomposition_reciprocal
+            + (1 << (FIXED_POINT_SHIFT - 1))
+        ) >> FIXED_POINT_SHIFT
+        return cold_brightness, total_brightness - cold_brightness
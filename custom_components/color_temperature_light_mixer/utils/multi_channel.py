@@ -0,0 +1,116 @@
+"""Model of a mixer with three or more lights, mixing at most two adjacent ones for each target."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import pairwise
+import math
+from typing import Self
+
+from custom_components.color_temperature_light_mixer.const import DEFAULT_MIXED_TEMPERATURE_WEIGHT
+from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+from .mixer_model import MixerModel
+
+
+@dataclass(frozen=True, slots=True)
+class MultiChannelModel:
+    """Brightness and temperature calculations of a mixer with any number of lights of different temperatures.
+
+    The lights, sorted from the warmest to the coldest, split the range of the mixer into segments between adjacent
+    lights. A target is reached by the two lights of the segment containing its temperature, found by bisection, with
+    the calculations of a two lights `MixerModel`, while all the other lights are off.
+    """
+
+    temperatures_kelvin: tuple[int, ...]
+    """Temperatures of the lights in kelvin, from the warmest to the coldest"""
+    temperatures_mired: tuple[int, ...]
+    """Temperatures of the lights in mired, from the warmest to the coldest"""
+    segments: tuple[MixerModel, ...]
+    """Model of each pair of adjacent lights, from the warmest to the coldest"""
+
+    @classmethod
+    def from_kelvin(
+        cls,
+        temperatures_kelvin: Sequence[int],
+        temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT,
+        model_type: type[MixerModel] = MixerModel,
+    ) -> Self:
+        """Create the model of a mixer given the temperatures of its lights in kelvin, in any order."""
+
+        temperatures_kelvin = tuple(sorted(temperatures_kelvin))
+        temperatures_mired = tuple(color_temperature_kelvin_to_mired(kelvin) for kelvin in temperatures_kelvin)
+        if len(temperatures_kelvin) < 2 or len(set(temperatures_mired)) != len(temperatures_mired):
+            raise ValueError(f"Expected at least two lights of different temperatures, got {temperatures_kelvin}")
+
+        return cls(
+            temperatures_kelvin,
+            temperatures_mired,
+            tuple(
+                model_type.from_kelvin(warm_kelvin, cold_kelvin, temperature_weight)
+                for warm_kelvin, cold_kelvin in pairwise(temperatures_kelvin)
+            ),
+        )
+
+    def segment(self, target_temperature_kelvin: int) -> int:
+        """Return the index of the segment containing the target temperature, the warm light of the segment.
+
+        Temperatures outside the range of the mixer belong to the closest segment.
+        """
+
+        # Index of the first light not warmer than the target, searched on the increasing negated mireds
+        coldest = bisect_left(
+            self.temperatures_mired,
+            -color_temperature_kelvin_to_mired(target_temperature_kelvin),
+            key=lambda mired: -mired,
+        )
+        return min(max(coldest - 1, 0), len(self.segments) - 1)
+
+    def spread(self, segment: int, warm_brightness: int, cold_brightness: int) -> tuple[int, ...]:
+        """Return the brightnesses of all the lights, given the ones of the two lights of a segment."""
+
+        brightnesses = [0] * len(self.temperatures_kelvin)
+        brightnesses[segment] = warm_brightness
+        brightnesses[segment + 1] = cold_brightness
+        return tuple(brightnesses)
+
+    def compute_brightnesses(
+        self,
+        target_temperature_kelvin: int,
+        target_brightness: int,
+        priority: BrightnessTemperaturePriority = BrightnessTemperaturePriority.MIXED,
+    ) -> tuple[int, ...]:
+        """Compute the brightness of each light required to reach the target temperature and brightness.
+
+        Returns:
+            brightness of each light in range 0-255, from the warmest to the coldest
+
+        """
+
+        segment = self.segment(target_temperature_kelvin)
+        return self.spread(
+            segment,
+            *self.segments[segment].compute_brightnesses(target_temperature_kelvin, target_brightness, priority),
+        )
+
+    def current_temperature(self, brightnesses: Sequence[float]) -> int:
+        """Compute the combined temperature in kelvin of the lights at the given brightnesses, or outputs.
+
+        The average of the temperatures of the lights in mired weighted by their brightness, as `current_temperature()`
+        of `MixerModel` for two lights, clamped between the temperatures of the warmest and coldest lights.
+        """
+
+        total = sum(brightnesses)
+        if total == 0:
+            # Return the warmest color if brightness is 0
+            return self.temperatures_kelvin[0]
+
+        combined_temperature_mired = (
+            sum(brightness * mired for brightness, mired in zip(brightnesses, self.temperatures_mired, strict=True))
+            / total
+        )
+        combined_temperature = math.floor(1000000 / combined_temperature_mired)
+        return max(self.temperatures_kelvin[0], min(self.temperatures_kelvin[-1], combined_temperature))
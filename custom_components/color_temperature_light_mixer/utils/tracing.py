@@ -0,0 +1,86 @@
+"""Debug logging and timing of the mixer operations, costing close to nothing when debug logging is disabled."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, MutableMapping
+import logging
+import time
+from typing import Any
+
+
+class MixerLoggerAdapter(logging.LoggerAdapter):
+    """Logger prefixing each message with the name of a mixer.
+
+    The name is resolved on the first message actually emitted and then cached, until `refresh_name()` is called.
+    As for any `LoggerAdapter`, nothing is formatted when the level of the message is disabled.
+    """
+
+    def __init__(self, logger: logging.Logger, resolve_name: Callable[[], str]) -> None:
+        """Initialize the adapter, with the function returning the name of the mixer."""
+        super().__init__(logger)
+        self._resolve_name = resolve_name
+        self._name: str | None = None
+
+    def refresh_name(self) -> None:
+        """Resolve the name again on the next message, e.g. once the entity has been added to hass."""
+        self._name = None
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> tuple[Any, MutableMapping[str, Any]]:
+        """Prefix the message with the name of the mixer."""
+        if self._name is None:
+            self._name = self._resolve_name()
+        return f"{self._name}: {msg}", kwargs
+
+
+class TraceSpan:
+    """Timing of a single traced operation, split in consecutive phases."""
+
+    __slots__ = ("_last", "_log", "_operation", "_phases", "_start")
+
+    def __init__(self, log: MixerLoggerAdapter, operation: str) -> None:
+        """Start timing the operation."""
+        self._log = log
+        self._operation = operation
+        self._phases: list[tuple[str, float]] = []
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Record the time elapsed since the previous phase, or the start of the span."""
+        now = time.perf_counter()
+        self._phases.append((phase, now - self._last))
+        self._last = now
+
+    def finish(self) -> None:
+        """Log the total time of the operation and of each of its phases."""
+        self._log.debug(
+            "%s took %.3f ms (%s)",
+            self._operation,
+            (time.perf_counter() - self._start) * 1000,
+            ", ".join(f"{phase}: {elapsed * 1000:.3f} ms" for phase, elapsed in self._phases),
+        )
+
+
+class MixerTracer:
+    """Source of the trace spans of a mixer.
+
+    A span is created only when debug logging is enabled, for one operation every `sample_interval`. Otherwise
+    `start_span()` returns None after a single cached level check, and callers skip all the tracing code with an
+    `is not None` test.
+    """
+
+    def __init__(self, log: MixerLoggerAdapter, sample_interval: int = 1) -> None:
+        """Initialize the tracer, tracing one operation every `sample_interval`."""
+        self._log = log
+        self._sample_interval = max(1, sample_interval)
+        self._countdown = 1
+
+    def start_span(self, operation: str) -> TraceSpan | None:
+        """Start a span for the operation, if it has to be traced."""
+        if not self._log.logger.isEnabledFor(logging.DEBUG):
+            return None
+
+        self._countdown -= 1
+        if self._countdown:
+            return None
+        self._countdown = self._sample_interval
+        return TraceSpan(self._log, operation)
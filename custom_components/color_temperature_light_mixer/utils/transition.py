@@ -0,0 +1,57 @@
+"""Interpolation of the targets of a mixer during a transition computed by the integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Self
+
+from custom_components.color_temperature_light_mixer.const import BRIGHTNESS_RANGE
+from homeassistant.util.color import color_temperature_kelvin_to_mired, color_temperature_mired_to_kelvin
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionPlan:
+    """Linear transition of a mixer from a (temperature, brightness) pair to another, in mired and brightness space.
+
+    Interpolating in mireds keeps the perceived temperature changing at a constant pace, and matches the space in
+    which the brightnesses of the lights are decomposed.
+    """
+
+    start_mired: float
+    start_brightness: float
+    target_mired: float
+    target_brightness: float
+    duration: float
+    """Seconds"""
+
+    @classmethod
+    def from_kelvin(
+        cls,
+        start: tuple[int, int],
+        target: tuple[int, int],
+        duration: float,
+    ) -> Self:
+        """Plan the transition between two (temperature in kelvin, brightness) pairs."""
+
+        return cls(
+            color_temperature_kelvin_to_mired(start[0]),
+            start[1],
+            color_temperature_kelvin_to_mired(target[0]),
+            target[1],
+            duration,
+        )
+
+    def frame(self, elapsed: float) -> tuple[int, int]:
+        """Return the (temperature in kelvin, brightness) target after the given seconds, the final one past the end.
+
+        The brightness of the frames is never below the minimum one, so that a transition from off turns on the lights
+        from the first frame.
+        """
+
+        progress = min(1.0, elapsed / self.duration) if self.duration > 0 else 1.0
+        mired = self.start_mired + (self.target_mired - self.start_mired) * progress
+        brightness = round(self.start_brightness + (self.target_brightness - self.start_brightness) * progress)
+        return (
+            round(color_temperature_mired_to_kelvin(mired)),
+            min(BRIGHTNESS_RANGE[1], max(BRIGHTNESS_RANGE[0], brightness)),
+        )
@@ -0,0 +1 @@
+"""Benchmarks for color_temperature_light_mixer, run them with `script/benchmark`."""
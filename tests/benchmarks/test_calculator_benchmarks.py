@@ -0,0 +1,135 @@
+"""Benchmark the brightness and temperature calculations."""
+
+import pytest
+
+from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority, ChildLightState
+from custom_components.color_temperature_light_mixer.utils import (
+    BrightnessCalculator,
+    FixedPointMixerModel,
+    MixerModel,
+    TemperatureCalculator,
+    TemperatureLookupTable,
+    compute_brightnesses_batch,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+KELVIN_PAIRS = {
+    "narrow": (4000, 5000),
+    "wide": (2000, 6500),
+}
+
+
+def targets(warm_kelvin: int, cold_kelvin: int, *, reachable: bool) -> list[tuple[int, int]]:
+    """Return (temperature, brightness) targets spread over the range of the mixer.
+
+    Reachable targets stay below the maximum brightness of the mixer at each temperature, the others are at full
+    brightness away from the extremes of the range, where only one light can be on.
+    """
+    step = (cold_kelvin - warm_kelvin) // 16
+    temperatures = range(warm_kelvin + step, cold_kelvin, step)
+    return [(temperature, 60 if reachable else 255) for temperature in temperatures]
+
+
+@pytest.mark.parametrize("priority", list(BrightnessTemperaturePriority))
+@pytest.mark.parametrize("reachable", [True, False], ids=["in_range", "out_of_range"])
+@pytest.mark.parametrize("kelvin_pair", list(KELVIN_PAIRS))
+class TestComputeBrightnesses:
+    """Benchmark the computation of the brightnesses required to reach a target."""
+
+    @pytest.mark.benchmark(group="compute_brightnesses")
+    def test_brightness_calculator(self, benchmark, kelvin_pair, reachable, priority):
+        """One BrightnessCalculator per target, as done by the callers of the public API."""
+
+        warm_kelvin, cold_kelvin = KELVIN_PAIRS[kelvin_pair]
+        mixer_targets = targets(warm_kelvin, cold_kelvin, reachable=reachable)
+
+        def compute():
+            for temperature, brightness in mixer_targets:
+                BrightnessCalculator(warm_kelvin, cold_kelvin, temperature, brightness, priority).compute_brightnesses()
+
+        benchmark(compute)
+
+    @pytest.mark.benchmark(group="compute_brightnesses")
+    def test_mixer_model(self, benchmark, kelvin_pair, reachable, priority):
+        """A single MixerModel for all the targets, as done by the light entity."""
+
+        model = MixerModel.from_kelvin(*KELVIN_PAIRS[kelvin_pair])
+        mixer_targets = targets(*KELVIN_PAIRS[kelvin_pair], reachable=reachable)
+
+        def compute():
+            for temperature, brightness in mixer_targets:
+                model.compute_brightnesses(temperature, brightness, priority)
+
+        benchmark(compute)
+
+    @pytest.mark.benchmark(group="compute_brightnesses")
+    def test_fixed_point_mixer_model(self, benchmark, kelvin_pair, reachable, priority):
+        """A single FixedPointMixerModel for all the targets, as done by the light entity with integer arithmetic."""
+
+        model = FixedPointMixerModel.from_kelvin(*KELVIN_PAIRS[kelvin_pair])
+        mixer_targets = targets(*KELVIN_PAIRS[kelvin_pair], reachable=reachable)
+
+        def compute():
+            for temperature, brightness in mixer_targets:
+                model.compute_brightnesses(temperature, brightness, priority)
+
+        benchmark(compute)
+
+
+@pytest.mark.benchmark(group="compute_brightnesses_batch")
+@pytest.mark.parametrize("priority", list(BrightnessTemperaturePriority))
+def test_compute_brightnesses_batch(benchmark, priority):
+    """Every temperature and brightness of a wide mixer at once."""
+
+    np = pytest.importorskip("numpy")
+    warm_kelvin, cold_kelvin = KELVIN_PAIRS["wide"]
+    temperatures = np.arange(warm_kelvin, cold_kelvin + 1, 10)[:, np.newaxis]
+    brightnesses = np.arange(1, 256)
+
+    benchmark(compute_brightnesses_batch, warm_kelvin, cold_kelvin, temperatures, brightnesses, priority=priority)
+
+
+BRIGHTNESS_PAIRS = [(warm, cold) for warm in range(0, 256, 51) for cold in range(0, 256, 51)]
+
+
+@pytest.mark.benchmark(group="current_temperature")
+@pytest.mark.parametrize("kelvin_pair", list(KELVIN_PAIRS))
+class TestCurrentTemperature:
+    """Benchmark the computation of the combined temperature of the lights."""
+
+    def test_temperature_calculator(self, benchmark, kelvin_pair):
+        """One TemperatureCalculator per state update."""
+
+        warm_kelvin, cold_kelvin = KELVIN_PAIRS[kelvin_pair]
+
+        def compute():
+            for warm_brightness, cold_brightness in BRIGHTNESS_PAIRS:
+                TemperatureCalculator(
+                    ChildLightState("light.warm", warm_kelvin, warm_brightness),
+                    ChildLightState("light.cold", cold_kelvin, cold_brightness),
+                ).current_temperature()
+
+        benchmark(compute)
+
+    def test_mixer_model(self, benchmark, kelvin_pair):
+        """The precomputed constants of the MixerModel."""
+
+        model = MixerModel.from_kelvin(*KELVIN_PAIRS[kelvin_pair])
+
+        def compute():
+            for warm_brightness, cold_brightness in BRIGHTNESS_PAIRS:
+                model.current_temperature(warm_brightness, cold_brightness)
+
+        benchmark(compute)
+
+    def test_lookup_table(self, benchmark, kelvin_pair):
+        """A filled TemperatureLookupTable."""
+
+        table = TemperatureLookupTable(*KELVIN_PAIRS[kelvin_pair])
+
+        def compute():
+            for warm_brightness, cold_brightness in BRIGHTNESS_PAIRS:
+                table.lookup(warm_brightness, cold_brightness)
+
+        benchmark(compute)
@@ -0,0 +1,83 @@
+"""Benchmark the hot paths of the light entity."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.color_temperature_light_mixer.const import (
+    CONF_COLD_LIGHT,
+    CONF_COLD_LIGHT_TEMPERATURE_KELVIN,
+    CONF_LAZY_TEMPERATURE_LOOKUP_TABLE,
+    CONF_STATE_WRITE_WINDOW,
+    CONF_WARM_LIGHT,
+    CONF_WARM_LIGHT_TEMPERATURE_KELVIN,
+    DOMAIN,
+)
+from custom_components.color_temperature_light_mixer.data import DispatchStats
+from custom_components.color_temperature_light_mixer.light.color_temperature_mixer import (
+    ENTITY_DESCRIPTIONS,
+    ColorTemperatureMixerLight,
+)
+from homeassistant.components.light import ATTR_BRIGHTNESS
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_ON
+from homeassistant.core import Event, EventStateChangedData, State
+
+pytest.importorskip("pytest_benchmark")
+
+
+def stub_light(options: dict) -> ColorTemperatureMixerLight:
+    """Create a mixer bound to a stub of a running hass."""
+
+    config_entry = SimpleNamespace(
+        entry_id="benchmark",
+        domain=DOMAIN,
+        title="Mixer",
+        data={
+            CONF_WARM_LIGHT: "light.warm",
+            CONF_WARM_LIGHT_TEMPERATURE_KELVIN: 3000,
+            CONF_COLD_LIGHT: "light.cold",
+            CONF_COLD_LIGHT_TEMPERATURE_KELVIN: 6000,
+        },
+        # Update the state on each change, without timers
+        options={CONF_STATE_WRITE_WINDOW: 0, **options},
+        runtime_data=SimpleNamespace(dispatch_stats=DispatchStats()),
+    )
+    light = ColorTemperatureMixerLight(config_entry, ENTITY_DESCRIPTIONS[0])  # pyright: ignore[reportArgumentType]
+    light.hass = SimpleNamespace(is_running=True)  # pyright: ignore[reportAttributeAccessIssue]
+    # Writing the state is the job of hass, not part of the benchmark
+    light.async_write_ha_state = lambda: None
+    return light
+
+
+def state_changed(entity_id: str, brightness: int) -> Event[EventStateChangedData]:
+    """Return the event fired when a light is turned on at the given brightness."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": State(entity_id, STATE_ON, {ATTR_BRIGHTNESS: brightness}),
+        },
+    )
+
+
+@pytest.mark.benchmark(group="child_state_changed")
+@pytest.mark.parametrize(
+    "options",
+    [{CONF_LAZY_TEMPERATURE_LOOKUP_TABLE: False}, {CONF_LAZY_TEMPERATURE_LOOKUP_TABLE: True}],
+    ids=["computed_temperature", "lookup_table"],
+)
+def test_child_state_changed(benchmark, options):
+    """Update the state of the mixer after a change of each of its lights."""
+
+    light = stub_light(options)
+    events = [state_changed("light.warm", 200), state_changed("light.cold", 120)]
+
+    def receive():
+        for event in events:
+            light._async_child_state_changed(event)  # noqa: SLF001
+
+    benchmark(receive)
+
+    assert light.brightness == 160
+    assert light.color_temp_kelvin is not None
@@ -0,0 +1,197 @@
+"""Fixtures of the tests running a mixer in Home Assistant, commanding mock child lights."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    setup_test_component_platform,
+)
+
+from custom_components.color_temperature_light_mixer.const import (
+    CONF_COLD_LIGHT,
+    CONF_COLD_LIGHT_TEMPERATURE_KELVIN,
+    CONF_WARM_LIGHT,
+    CONF_WARM_LIGHT_TEMPERATURE_KELVIN,
+    DOMAIN,
+)
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_EFFECT,
+    ATTR_RGBWW_COLOR,
+    DOMAIN as LIGHT_DOMAIN,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
+from homeassistant.const import ATTR_ENTITY_ID, CONF_NAME, CONF_PLATFORM, SERVICE_TURN_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+MIXER_ENTITY_ID = "light.mixer"
+
+
+class MockChildLight(LightEntity):
+    """Light commanded by a mixer, recording the commands it receives.
+
+    Setting `blocked` holds the commands until it is cleared, as a slow light completing them late.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        color_mode: ColorMode = ColorMode.BRIGHTNESS,
+        effect_list: list[str] | None = None,
+        normalize_rgbww: bool = False,
+    ) -> None:
+        """Initialize the light, off."""
+
+        self._attr_name = name
+        self._attr_unique_id = name
+        self._attr_is_on = False
+        self._attr_color_mode = color_mode
+        self._attr_supported_color_modes = {color_mode}
+        self._attr_supported_features = LightEntityFeature.TRANSITION
+        if effect_list:
+            self._attr_supported_features |= LightEntityFeature.EFFECT
+            self._attr_effect_list = effect_list
+        if color_mode is ColorMode.RGBWW:
+            self._attr_rgbww_color = (0, 0, 0, 0, 0)
+        # Report the RGBWW color with its largest channel at 255 and the level as brightness, as most integrations
+        self._normalize_rgbww = normalize_rgbww
+
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.blocked = asyncio.Event()
+        self.blocked.set()
+
+    async def _async_command(self, service: str, kwargs: dict[str, Any]) -> None:
+        """Record a command, waiting until the light is no longer blocked."""
+
+        self.calls.append((service, kwargs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.blocked.wait()
+        finally:
+            self.in_flight -= 1
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on the light, at the requested brightness or RGBWW color."""
+
+        await self._async_command("turn_on", kwargs)
+        self._attr_is_on = True
+        if (rgbww_color := kwargs.get(ATTR_RGBWW_COLOR)) is not None:
+            level = max(rgbww_color)
+            if self._normalize_rgbww and level:
+                self._attr_rgbww_color = tuple(round(channel * 255 / level) for channel in rgbww_color)
+                self._attr_brightness = level
+            else:
+                self._attr_rgbww_color = rgbww_color
+        if ATTR_BRIGHTNESS in kwargs:
+            self._attr_brightness = kwargs[ATTR_BRIGHTNESS]
+        elif self._attr_brightness is None:
+            self._attr_brightness = 255
+        if ATTR_EFFECT in kwargs:
+            self._attr_effect = kwargs[ATTR_EFFECT]
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off the light."""
+
+        await self._async_command("turn_off", kwargs)
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
+
+@pytest.fixture
+def mock_child_light() -> type[MockChildLight]:
+    """Return the class of the lights mixed by the mixer, to build them in the tests."""
+    return MockChildLight
+
+
+@pytest.fixture
+def child_lights() -> list[MockChildLight]:
+    """Return the lights mixed by the mixer, a warm and a cold one by default."""
+    return [MockChildLight("warm"), MockChildLight("cold")]
+
+
+@pytest.fixture
+def config_data() -> dict[str, Any]:
+    """Return the configuration of the mixer, mixing the warm and cold lights."""
+    return {
+        CONF_NAME: "Mixer",
+        CONF_WARM_LIGHT: ["light.warm"],
+        CONF_WARM_LIGHT_TEMPERATURE_KELVIN: 3000,
+        CONF_COLD_LIGHT: ["light.cold"],
+        CONF_COLD_LIGHT_TEMPERATURE_KELVIN: 6000,
+    }
+
+
+@pytest.fixture
+def options() -> dict[str, Any]:
+    """Return the options of the mixer, the defaults unless overridden."""
+    return {}
+
+
+@pytest.fixture
+async def lights(hass: HomeAssistant, child_lights: list[MockChildLight]) -> dict[str, MockChildLight]:
+    """Set up the child lights, returning them by entity id."""
+
+    setup_test_component_platform(hass, LIGHT_DOMAIN, child_lights)
+    assert await async_setup_component(hass, LIGHT_DOMAIN, {LIGHT_DOMAIN: {CONF_PLATFORM: "test"}})
+    await hass.async_block_till_done()
+    return {light.entity_id: light for light in child_lights}
+
+
+@pytest.fixture
+async def mixer(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    lights: dict[str, MockChildLight],
+    config_data: dict[str, Any],
+    options: dict[str, Any],
+) -> MockConfigEntry:
+    """Set up the mixer of the child lights, loaded from custom_components, returning its config entry."""
+
+    entry = MockConfigEntry(domain=DOMAIN, title=config_data[CONF_NAME], data=config_data, options=options)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.fixture
+def settle(hass: HomeAssistant) -> Callable[[], Awaitable[None]]:
+    """Return a function waiting for the lights to be commanded, and for the mixer to write its coalesced state."""
+
+    async def async_settle() -> None:
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    return async_settle
+
+
+@pytest.fixture
+def turn_on_mixer(hass: HomeAssistant, settle: Callable[[], Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+    """Return a function turning on the mixer with the given service data, waiting for its state to settle."""
+
+    async def async_turn_on_mixer(**service_data: Any) -> None:
+        await hass.services.async_call(
+            LIGHT_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: MIXER_ENTITY_ID, **service_data}, blocking=True
+        )
+        await settle()
+
+    return async_turn_on_mixer
@@ -0,0 +1 @@
+"""Golden grid of the brightness computations."""
@@ -0,0 +1,31 @@
+"""Compare the brightness implementations with the golden grid, or regenerate it.
+
+Usage: python -m tests.golden [--update]
+"""
+
+import argparse
+import sys
+
+from .harness import GOLDEN_FILE, IMPLEMENTATIONS, check, format_reports, load_golden, write_golden
+
+
+def main() -> int:
+    """Print the comparison of every implementation with the golden grid, failing if any is out of tolerance."""
+
+    parser = argparse.ArgumentParser(prog="python -m tests.golden", description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="regenerate the golden grid with the reference")
+    args = parser.parse_args()
+
+    if args.update:
+        write_golden()
+        print(f"Wrote {GOLDEN_FILE}")
+        return 0
+
+    golden = load_golden()
+    reports = [report for implementation in IMPLEMENTATIONS for report in check(implementation, golden)]
+    print(format_reports(reports))
+    return 0 if all(report.passed for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
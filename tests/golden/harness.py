@@ -0,0 +1,213 @@
+"""Golden grid of the brightness computations, to check alternative implementations against the reference one.
+
+The grid covers every integer target mired of a mixer, every brightness in 1...255 and every priority, for a set of
+kelvin pairs. The outputs of the reference implementation, the scalar `MixerModel`, are stored in `GOLDEN_FILE` as
+differences along the brightness axis, which compress to about 120 KiB.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache, partial
+from pathlib import Path
+import time
+
+import numpy as np
+
+from custom_components.color_temperature_light_mixer.const import BRIGHTNESS_RANGE, DEFAULT_MIXED_TEMPERATURE_WEIGHT
+from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority
+from custom_components.color_temperature_light_mixer.utils import (
+    BrightnessLookupTable,
+    FixedPointMixerModel,
+    MixerModel,
+    compute_mired_brightnesses_batch,
+)
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+GOLDEN_FILE = Path(__file__).with_name("brightness_grid.npz")
+
+KELVIN_PAIRS = [(2000, 6500), (2700, 6500), (3000, 6000), (4000, 5000), (3000, 3200)]
+"""Wide, common and narrow mixers, the last one so narrow that the MIXED projection has a single candidate"""
+
+
+@dataclass(frozen=True)
+class GridCase:
+    """A mixer and a priority, whose outputs are computed for every target mired and brightness."""
+
+    warm_temperature_kelvin: int
+    cold_temperature_kelvin: int
+    priority: BrightnessTemperaturePriority
+    temperature_weight: float = DEFAULT_MIXED_TEMPERATURE_WEIGHT
+
+    @property
+    def key(self) -> str:
+        """Return the name of the case in the golden file."""
+        return (
+            f"{self.warm_temperature_kelvin}_{self.cold_temperature_kelvin}_{self.priority}_{self.temperature_weight}"
+        )
+
+    def targets(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the (mired, brightness) grids of the targets, with one row per mired."""
+        return np.meshgrid(
+            np.arange(
+                color_temperature_kelvin_to_mired(self.cold_temperature_kelvin),
+                color_temperature_kelvin_to_mired(self.warm_temperature_kelvin) + 1,
+            ),
+            np.arange(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1),
+            indexing="ij",
+        )
+
+
+GRID_CASES = [
+    *(GridCase(*kelvin_pair, priority) for kelvin_pair in KELVIN_PAIRS for priority in BrightnessTemperaturePriority),
+    GridCase(3000, 6000, BrightnessTemperaturePriority.MIXED, 0.5),
+    GridCase(3000, 6000, BrightnessTemperaturePriority.MIXED, 4.0),
+]
+
+type Engine = Callable[[GridCase, np.ndarray, np.ndarray], np.ndarray]
+"""Function computing the (warm, cold) brightnesses of the target grids of a case, stacked on the last axis"""
+
+
+def _scalar_model(
+    case: GridCase, mireds: np.ndarray, brightnesses: np.ndarray, model_type: type[MixerModel] = MixerModel
+) -> np.ndarray:
+    model = model_type.from_kelvin(case.warm_temperature_kelvin, case.cold_temperature_kelvin, case.temperature_weight)
+    return np.array(
+        [
+            model.compute_mired_brightnesses(mired, brightness, case.priority)
+            for mired, brightness in zip(mireds.ravel().tolist(), brightnesses.ravel().tolist(), strict=True)
+        ]
+    ).reshape((*mireds.shape, 2))
+
+
+def _batch(case: GridCase, mireds: np.ndarray, brightnesses: np.ndarray) -> np.ndarray:
+    return np.stack(
+        compute_mired_brightnesses_batch(
+            case.warm_temperature_kelvin,
+            case.cold_temperature_kelvin,
+            mireds,
+            brightnesses,
+            priority=case.priority,
+            temperature_weight=case.temperature_weight,
+        ),
+        axis=-1,
+    )
+
+
+@cache
+def _cached_lookup_table(warm_kelvin: int, cold_kelvin: int, temperature_weight: float) -> BrightnessLookupTable:
+    return BrightnessLookupTable(warm_kelvin, cold_kelvin, temperature_weight)
+
+
+def _lookup_table(case: GridCase, mireds: np.ndarray, brightnesses: np.ndarray) -> np.ndarray:
+    table = _cached_lookup_table(case.warm_temperature_kelvin, case.cold_temperature_kelvin, case.temperature_weight)
+    return np.array(
+        [
+            table.lookup_mired(mired, brightness, case.priority)
+            for mired, brightness in zip(mireds.ravel().tolist(), brightnesses.ravel().tolist(), strict=True)
+        ]
+    ).reshape((*mireds.shape, 2))
+
+
+@dataclass(frozen=True)
+class Implementation:
+    """An engine computing the brightnesses, and the largest difference from the golden outputs it may have."""
+
+    name: str
+    compute: Engine
+    tolerance: int = 0
+
+
+REFERENCE = Implementation("scalar", _scalar_model)
+
+IMPLEMENTATIONS = [
+    REFERENCE,
+    Implementation("batch", _batch),
+    Implementation("lookup_table", _lookup_table),
+    # Rounds ties half up instead of half to even
+    Implementation("fixed_point", partial(_scalar_model, model_type=FixedPointMixerModel), tolerance=1),
+]
+
+
+@dataclass(frozen=True)
+class CaseReport:
+    """Comparison of the outputs of an implementation with the golden ones, for one case."""
+
+    implementation: Implementation
+    case: GridCase
+    cells: int
+    mismatches: int
+    max_difference: int
+    seconds: float
+
+    @property
+    def passed(self) -> bool:
+        """Return whether all the outputs are within the tolerance of the implementation."""
+        return self.max_difference <= self.implementation.tolerance
+
+
+def compute_grid(implementation: Implementation, case: GridCase) -> tuple[np.ndarray, float]:
+    """Compute the outputs of an implementation for a case, and the time it took."""
+
+    mireds, brightnesses = case.targets()
+    start = time.perf_counter()
+    outputs = implementation.compute(case, mireds, brightnesses)
+    return outputs.astype(np.int16), time.perf_counter() - start
+
+
+def write_golden(path: Path = GOLDEN_FILE) -> None:
+    """Record the outputs of the reference implementation as the golden ones."""
+
+    grids = {case.key: compute_grid(REFERENCE, case)[0] for case in GRID_CASES}
+    np.savez_compressed(path, **{key: np.diff(grid, axis=1, prepend=0) for key, grid in grids.items()})
+
+
+def load_golden(path: Path = GOLDEN_FILE) -> dict[str, np.ndarray]:
+    """Return the golden outputs of every case."""
+
+    with np.load(path) as deltas:
+        return {key: np.cumsum(deltas[key], axis=1, dtype=np.int16) for key in deltas.files}
+
+
+def check(implementation: Implementation, golden: dict[str, np.ndarray]) -> list[CaseReport]:
+    """Compare the outputs of an implementation with the golden ones, for every case."""
+
+    reports = []
+    for case in GRID_CASES:
+        outputs, seconds = compute_grid(implementation, case)
+        differences = np.abs(outputs - golden[case.key])
+        reports.append(
+            CaseReport(
+                implementation,
+                case,
+                cells=differences.shape[0] * differences.shape[1],
+                mismatches=int(np.count_nonzero(differences.max(axis=-1))),
+                max_difference=int(differences.max()),
+                seconds=seconds,
+            )
+        )
+    return reports
+
+
+def format_reports(reports: list[CaseReport]) -> str:
+    """Format the reports as a table, one row per case, with the implementations side by side."""
+
+    implementations = list(dict.fromkeys(report.implementation.name for report in reports))
+    by_case: dict[str, dict[str, CaseReport]] = {}
+    for report in reports:
+        by_case.setdefault(report.case.key, {})[report.implementation.name] = report
+
+    header = f"{'case':<32}{'cells':>8}" + "".join(
+        f" | {name + ' mism/maxdiff':>26} {'ms':>9}" for name in implementations
+    )
+    lines = [header, "-" * len(header)]
+    for key, case_reports in by_case.items():
+        cells = next(iter(case_reports.values())).cells
+        line = f"{key:<32}{cells:>8}"
+        for name in implementations:
+            report = case_reports[name]
+            outcome = f"{report.mismatches}/{report.max_difference}{'' if report.passed else ' FAIL'}"
+            line += f" | {outcome:>26} {report.seconds * 1000:>9.2f}"
+        lines.append(line)
+    return "\n".join(lines)
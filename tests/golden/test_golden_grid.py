@@ -0,0 +1,23 @@
+"""Check every brightness implementation against the golden grid."""
+
+import pytest
+
+from .harness import GRID_CASES, IMPLEMENTATIONS, Implementation, check, format_reports, load_golden
+
+
+@pytest.fixture(scope="module")
+def golden():
+    """Load the golden grid once for all the implementations."""
+    return load_golden()
+
+
+def test_golden_grid_covers_every_case(golden) -> None:
+    """The golden file is up to date with the cases of the harness."""
+    assert sorted(golden) == sorted(case.key for case in GRID_CASES)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS, ids=lambda implementation: implementation.name)
+def test_implementation_matches_golden_grid(implementation: Implementation, golden) -> None:
+    """Every output of the implementation is within its tolerance from the golden one."""
+    reports = check(implementation, golden)
+    assert all(report.passed for report in reports), "\n" + format_reports(reports)
@@ -0,0 +1,94 @@
+"""Test the config flow, entering the intermediate lights one at a time."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.color_temperature_light_mixer import CONFIG_SCHEMA
+from custom_components.color_temperature_light_mixer.const import (
+    CONF_ADD_INTERMEDIATE_LIGHT,
+    CONF_INTERMEDIATE_LIGHTS,
+    DOMAIN,
+)
+from homeassistant.components.light import ATTR_COLOR_TEMP_KELVIN
+from homeassistant.config_entries import SOURCE_IMPORT, SOURCE_RECONFIGURE, SOURCE_USER
+from homeassistant.const import CONF_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def test_intermediate_lights(hass: HomeAssistant, config_data: dict[str, Any]):
+    """The intermediate lights are entered in turn, rejecting a temperature out of the range of the mixer."""
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {**config_data, CONF_ADD_INTERMEDIATE_LIGHT: True}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "intermediate_light"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_ENTITY_ID: "light.neutral", ATTR_COLOR_TEMP_KELVIN: 6000, CONF_ADD_INTERMEDIATE_LIGHT: False},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_ENTITY_ID: "invalid_intermediate_lights"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_ENTITY_ID: "light.neutral", ATTR_COLOR_TEMP_KELVIN: 4000, CONF_ADD_INTERMEDIATE_LIGHT: True},
+    )
+    assert result["step_id"] == "intermediate_light"
+    assert result["description_placeholders"] == {"number": "2"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_ENTITY_ID: "light.daylight", ATTR_COLOR_TEMP_KELVIN: 5000, CONF_ADD_INTERMEDIATE_LIGHT: False},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_INTERMEDIATE_LIGHTS] == [
+        {CONF_ENTITY_ID: "light.neutral", ATTR_COLOR_TEMP_KELVIN: 4000},
+        {CONF_ENTITY_ID: "light.daylight", ATTR_COLOR_TEMP_KELVIN: 5000},
+    ]
+    assert CONF_ADD_INTERMEDIATE_LIGHT not in result["data"]
+
+
+async def test_reconfigure_keeps_intermediate_lights(hass: HomeAssistant, config_data: dict[str, Any]):
+    """Reconfiguring the warm and cold lights alone keeps the intermediate lights."""
+
+    intermediate_lights = [{CONF_ENTITY_ID: "light.neutral", ATTR_COLOR_TEMP_KELVIN: 4000}]
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="Mixer", data={**config_data, CONF_INTERMEDIATE_LIGHTS: intermediate_lights}
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_RECONFIGURE, "entry_id": entry.entry_id}
+    )
+    user_input = {key: value for key, value in config_data.items() if key in result["data_schema"].schema}
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {**user_input, CONF_ADD_INTERMEDIATE_LIGHT: False}
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reconfigure_successful"
+    assert entry.data[CONF_INTERMEDIATE_LIGHTS] == intermediate_lights
+
+
+async def test_import_intermediate_lights(hass: HomeAssistant, config_data: dict[str, Any]):
+    """A mixer configured via YAML lists its intermediate lights, imported as they are."""
+
+    intermediate_lights = [{CONF_ENTITY_ID: "light.neutral", ATTR_COLOR_TEMP_KELVIN: 4000}]
+    config = CONFIG_SCHEMA({DOMAIN: {**config_data, CONF_INTERMEDIATE_LIGHTS: intermediate_lights}})
+    assert config[DOMAIN] == [{**config_data, CONF_INTERMEDIATE_LIGHTS: intermediate_lights}]
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_IMPORT}, data=config[DOMAIN][0]
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_INTERMEDIATE_LIGHTS] == intermediate_lights
+    assert CONF_ADD_INTERMEDIATE_LIGHT not in result["data"]
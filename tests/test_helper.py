@@ -1,13 +1,46 @@
 """Test the helper utilities."""
 
+from datetime import UTC, datetime
+import logging
+import sys
+
+import numpy as np
+import pytest
+
 from custom_components.color_temperature_light_mixer.const import (
     BRIGHTNESS_RANGE,
     CONF_DEFAULT_COLD_LIGHT_TEMPERATURE,
     CONF_DEFAULT_WARM_LIGHT_TEMPERATURE,
 )
-from custom_components.color_temperature_light_mixer.data import BrightnessTemperaturePriority
-from custom_components.color_temperature_light_mixer.utils import BrightnessCalculator
-from homeassistant.util.color import color_temperature_kelvin_to_mired, color_temperature_mired_to_kelvin
+from custom_components.color_temperature_light_mixer.data import (
+    BrightnessTemperaturePriority,
+    ChildLightState,
+    DispatchStats,
+)
+from custom_components.color_temperature_light_mixer.utils import (
+    BrightnessCache,
+    BrightnessCalculator,
+    BrightnessLookupTable,
+    ChannelCalibration,
+    FixedPointMixerModel,
+    MixerLoggerAdapter,
+    MixerModel,
+    MixerTracer,
+    MultiChannelModel,
+    TemperatureCalculator,
+    TemperatureLookupTable,
+    TransitionPlan,
+    compute_brightnesses_batch,
+)
+from custom_components.color_temperature_light_mixer.utils.circadian import circadian_temperature, daylight_fraction
+from homeassistant.util.color import (
+    color_temperature_kelvin_to_mired,
+    color_temperature_mired_to_kelvin,
+    rgbww_to_color_temperature,
+)
+
+MIXED = BrightnessTemperaturePriority.MIXED
+TEMPERATURE = BrightnessTemperaturePriority.TEMPERATURE
 
 
 class TestBrightnessCalculator:
@@ -201,3 +234,633 @@ def test_6000_189_mixed(self):
 
         assert ww == 65
         assert cw == 255
+
+    @pytest.mark.parametrize(("warm_kelvin", "cold_kelvin"), [(3000, 6000), (2000, 6500), (4000, 5000)])
+    def test_mixed_projection_matches_scan(self, warm_kelvin, cold_kelvin):
+        """The projection on the achievable curve picks the same point as a scan of every mired."""
+
+        class ScanMixerModel(MixerModel):
+            def _find_closest_achievable_target(self, target_mired, target_brightness):
+                warm_mired, cold_mired = self.warm_temperature_mired, self.cold_temperature_mired
+                scale = BRIGHTNESS_RANGE[1] * (cold_mired - warm_mired) / 2
+                closest = min(
+                    range(cold_mired, int((warm_mired + cold_mired) / 2)),
+                    key=lambda x: (target_mired - x) ** 2 + (target_brightness - int(scale / (x - warm_mired))) ** 2,
+                )
+                return closest, int(scale / (closest - warm_mired))
+
+        model = MixerModel.from_kelvin(warm_kelvin, cold_kelvin)
+        scan_model = ScanMixerModel.from_kelvin(warm_kelvin, cold_kelvin)
+        for target_temperature in range(warm_kelvin, cold_kelvin + 1, 50):
+            for target_brightness in range(1, BRIGHTNESS_RANGE[1] + 1, 5):
+                args = (target_temperature, target_brightness)
+                assert model.compute_brightnesses(*args) == scan_model.compute_brightnesses(*args), args
+                assert BrightnessCalculator(
+                    warm_kelvin, cold_kelvin, *args
+                ).compute_brightnesses() == scan_model.compute_brightnesses(*args), args
+
+    def test_mixed_temperature_weight(self):
+        """A higher temperature weight keeps the result closer to the target temperature."""
+
+        def cold_ratio(temperature_weight):
+            bc = BrightnessCalculator(
+                CONF_DEFAULT_WARM_LIGHT_TEMPERATURE,
+                CONF_DEFAULT_COLD_LIGHT_TEMPERATURE,
+                5000,
+                BRIGHTNESS_RANGE[1],
+                BrightnessTemperaturePriority.MIXED,
+                temperature_weight,
+            )
+            ww, cw = bc.compute_brightnesses()
+            return cw / (ww + cw)
+
+        # At 5000K the cold light provides 80% of the output
+        assert abs(cold_ratio(10) - 0.8) < abs(cold_ratio(1) - 0.8) < abs(cold_ratio(0.1) - 0.8)
+
+    def test_model_built_once(self):
+        """The model of the calculator is built once and reused."""
+
+        bc = BrightnessCalculator(CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE, 4000, 100)
+
+        assert bc.model is bc.model
+
+
+class TestBrightnessLookupTable:
+    """Test the BrightnessLookupTable."""
+
+    def test_matches_calculator(self):
+        """Every entry of the table matches the computed brightnesses."""
+
+        warm_kelvin, cold_kelvin = 4000, 5000
+        table = BrightnessLookupTable(warm_kelvin, cold_kelvin)
+
+        assert table.nbytes == BrightnessLookupTable.nbytes_for(warm_kelvin, cold_kelvin)
+        for priority in BrightnessTemperaturePriority:
+            for target_temperature in range(warm_kelvin, cold_kelvin + 1, 7):
+                for target_brightness in range(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1):
+                    bc = BrightnessCalculator(warm_kelvin, cold_kelvin, target_temperature, target_brightness, priority)
+                    assert table.lookup(target_temperature, target_brightness, priority) == bc.compute_brightnesses()
+
+    def test_without_numpy(self, monkeypatch, caplog):
+        """Without NumPy the tables are computed one target at a time, with the same entries."""
+
+        table = BrightnessLookupTable(4000, 5000)
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        with caplog.at_level(logging.WARNING):
+            scalar_table = BrightnessLookupTable(4000, 5000)
+
+        assert "NumPy is not installed" in caplog.text
+        assert scalar_table.nbytes == table.nbytes
+        for priority in BrightnessTemperaturePriority:
+            for target_temperature_mired in range(
+                color_temperature_kelvin_to_mired(5000), color_temperature_kelvin_to_mired(4000) + 1
+            ):
+                for target_brightness in range(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1):
+                    assert scalar_table.lookup_mired(
+                        target_temperature_mired, target_brightness, priority
+                    ) == table.lookup_mired(target_temperature_mired, target_brightness, priority)
+
+    def test_fixed_point_model(self):
+        """The tables of a fixed-point mixer match its model."""
+
+        table = BrightnessLookupTable(4000, 5000, model_type=FixedPointMixerModel)
+        model = FixedPointMixerModel.from_kelvin(4000, 5000)
+
+        for priority in BrightnessTemperaturePriority:
+            for target_temperature in range(4000, 5001, 7):
+                for target_brightness in range(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1):
+                    assert table.lookup(target_temperature, target_brightness, priority) == model.compute_brightnesses(
+                        target_temperature, target_brightness, priority
+                    )
+
+    def test_memory_bound(self):
+        """Tables exceeding the memory budget are rejected."""
+
+        with pytest.raises(ValueError):
+            BrightnessLookupTable(1000, 40000)
+
+
+class TestBatchBrightnessCalculator:
+    """Test the vectorized brightness computation."""
+
+    @pytest.mark.parametrize(("warm_kelvin", "cold_kelvin"), [(3000, 6000), (2000, 6500), (4000, 5000)])
+    @pytest.mark.parametrize("priority", list(BrightnessTemperaturePriority))
+    def test_matches_calculator(self, warm_kelvin, cold_kelvin, priority):
+        """The batch results are identical to the ones computed one target at a time."""
+
+        target_temperatures = np.arange(warm_kelvin, cold_kelvin + 1, 23)
+        target_brightnesses = np.arange(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1)
+        ww, cw = compute_brightnesses_batch(
+            warm_kelvin,
+            cold_kelvin,
+            target_temperatures[:, np.newaxis],
+            target_brightnesses,
+            priority=priority,
+            temperature_weight=2.5,
+        )
+
+        assert ww.shape == cw.shape == (len(target_temperatures), len(target_brightnesses))
+        for i, target_temperature in enumerate(target_temperatures):
+            for j, target_brightness in enumerate(target_brightnesses):
+                bc = BrightnessCalculator(
+                    warm_kelvin, cold_kelvin, int(target_temperature), int(target_brightness), priority, 2.5
+                )
+                assert (ww[i, j], cw[i, j]) == bc.compute_brightnesses(), (target_temperature, target_brightness)
+
+    def test_scalar_targets(self):
+        """Scalar targets are broadcast like arrays."""
+
+        ww, cw = compute_brightnesses_batch(
+            CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE, 5000, [BRIGHTNESS_RANGE[1]]
+        )
+
+        assert ww.tolist() == [223]
+        assert cw.tolist() == [255]
+
+
+class TestTemperatureLookupTable:
+    """Test the TemperatureLookupTable."""
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_matches_calculator(self, lazy):
+        """Every entry of the table matches the computed temperature."""
+
+        warm_kelvin, cold_kelvin = CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE
+        table = TemperatureLookupTable(warm_kelvin, cold_kelvin, lazy=lazy)
+
+        assert table.nbytes == (0 if lazy else 256 * 256 * 2)
+        for warm_brightness in range(BRIGHTNESS_RANGE[1] + 1):
+            for cold_brightness in range(BRIGHTNESS_RANGE[1] + 1):
+                tc = TemperatureCalculator(
+                    ChildLightState("light.warm", warm_kelvin, warm_brightness),
+                    ChildLightState("light.cold", cold_kelvin, cold_brightness),
+                )
+                assert table.lookup(warm_brightness, cold_brightness) == tc.current_temperature()
+        assert table.nbytes == 256 * 256 * 2
+
+    def test_lazy_rows(self):
+        """A lazy table allocates the row of a warm brightness on its first lookup."""
+
+        table = TemperatureLookupTable(
+            CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE, lazy=True
+        )
+        table.lookup(10, 20)
+        table.lookup(10, 30)
+        table.lookup(0, 255)
+
+        assert table.nbytes == 2 * 256 * 2
+
+
+class TestBrightnessCache:
+    """Test the BrightnessCache."""
+
+    def test_hits_and_misses(self):
+        """Repeated targets are served from the cache, also across mixers with the same temperatures."""
+
+        cache = BrightnessCache(maxsize=8)
+        kelvins = (CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE)
+        target = (5000, BRIGHTNESS_RANGE[1])
+
+        assert cache.compute_brightnesses(MixerModel.from_kelvin(*kelvins), *target) == (223, 255)
+        assert cache.compute_brightnesses(MixerModel.from_kelvin(*kelvins), *target) == (223, 255)
+        # The temperature weight only affects the MIXED priority
+        for priority, temperature_weight in ((TEMPERATURE, 1), (TEMPERATURE, 2), (MIXED, 2)):
+            cache.compute_brightnesses(MixerModel.from_kelvin(*kelvins, temperature_weight), *target, priority)
+
+        assert cache.stats() == {"size": 3, "maxsize": 8, "hits": 2, "misses": 3, "evictions": 0}
+
+    def test_eviction(self):
+        """The least recently used entries are evicted first."""
+
+        cache = BrightnessCache(maxsize=2)
+        model = MixerModel.from_kelvin(CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE)
+
+        def compute(target_temperature):
+            return cache.compute_brightnesses(model, target_temperature, BRIGHTNESS_RANGE[1])
+
+        compute(3000)
+        compute(4000)
+        compute(3000)
+        compute(5000)
+        assert (cache.evictions, cache.misses) == (1, 3)
+
+        compute(3000)
+        compute(4000)
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_calculator(self, monkeypatch):
+        """The calculator is served by the cache, calibrating the cached brightnesses."""
+
+        cache = BrightnessCache(maxsize=8)
+        monkeypatch.setattr("custom_components.color_temperature_light_mixer.utils.calculator.BRIGHTNESS_CACHE", cache)
+        calibration = ChannelCalibration.from_gamma(2.0)
+
+        assert BrightnessCalculator(3000, 6000, 4000, 100).compute_brightnesses() == (101, 99)
+        assert BrightnessCalculator(
+            3000, 6000, 4000, 100, warm_calibration=calibration, cold_calibration=calibration
+        ).compute_brightnesses() == (calibration.inverse[101], calibration.inverse[99])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_requested_maxsize(self):
+        """The cache is sized after the largest request."""
+
+        cache = BrightnessCache(maxsize=4)
+        cache.request_maxsize("first", 16)
+        cache.request_maxsize("second", 32)
+        assert cache.maxsize == 32
+
+        cache.release_maxsize("second")
+        assert cache.maxsize == 16
+        cache.release_maxsize("first")
+        assert cache.maxsize == 4
+
+
+class TestMixerModel:
+    """Test the MixerModel."""
+
+    def test_immutable(self):
+        """The model cannot be modified nor extended after its creation."""
+
+        model = MixerModel.from_kelvin(CONF_DEFAULT_WARM_LIGHT_TEMPERATURE, CONF_DEFAULT_COLD_LIGHT_TEMPERATURE)
+
+        assert model.warm_temperature_mired == color_temperature_kelvin_to_mired(CONF_DEFAULT_WARM_LIGHT_TEMPERATURE)
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.temperature_weight = 2  # pyright: ignore[reportAttributeAccessIssue]
+
+    @pytest.mark.parametrize(("warm_kelvin", "cold_kelvin"), [(3000, 6000), (2000, 6500), (2700, 2800)])
+    def test_current_temperature(self, warm_kelvin, cold_kelvin):
+        """The combined temperature matches the one computed by Home Assistant."""
+
+        model = MixerModel.from_kelvin(warm_kelvin, cold_kelvin)
+        for warm_brightness in range(BRIGHTNESS_RANGE[1] + 1):
+            for cold_brightness in range(BRIGHTNESS_RANGE[1] + 1):
+                expected, _ = rgbww_to_color_temperature(
+                    (0, 0, 0, cold_brightness, warm_brightness), warm_kelvin, cold_kelvin
+                )
+                assert model.current_temperature(warm_brightness, cold_brightness) == max(
+                    warm_kelvin, min(cold_kelvin, expected)
+                )
+
+
+class TestMultiChannelModel:
+    """Test the MultiChannelModel."""
+
+    def test_segment(self):
+        """A target is mixed by the two lights adjacent to its temperature, the closest ones outside of the range."""
+
+        model = MultiChannelModel.from_kelvin([6500, 2700, 4000])
+
+        assert model.temperatures_kelvin == (2700, 4000, 6500)
+        assert model.segment(2000) == model.segment(2700) == model.segment(3500) == 0
+        assert model.segment(4000) == 0
+        assert model.segment(4001) == model.segment(6500) == model.segment(10000) == 1
+
+    def test_compute_brightnesses(self):
+        """The lights outside of the segment of the target are off, the others mix as two lights would."""
+
+        model = MultiChannelModel.from_kelvin([2700, 4000, 5000, 6500])
+
+        assert model.compute_brightnesses(4500, 200) == (
+            0,
+            *MixerModel.from_kelvin(4000, 5000).compute_brightnesses(4500, 200),
+            0,
+        )
+        # A target at the temperature of an intermediate light is reached by that light alone
+        assert model.compute_brightnesses(4000, 100) == (0, 200, 0, 0)
+        assert model.current_temperature(model.compute_brightnesses(4000, 100)) == 4000
+
+    @pytest.mark.parametrize("target_kelvin", [2700, 3100, 4000, 4800, 6500])
+    def test_current_temperature(self, target_kelvin):
+        """The temperature computed back from the brightnesses is the target one, within the rounding."""
+
+        model = MultiChannelModel.from_kelvin([2700, 4000, 6500])
+
+        assert model.current_temperature(model.compute_brightnesses(target_kelvin, 128)) == pytest.approx(
+            target_kelvin, abs=15
+        )
+        assert model.current_temperature((0, 0, 0)) == 2700
+
+    def test_duplicate_temperatures(self):
+        """Lights of the same temperature cannot be mixed."""
+
+        with pytest.raises(ValueError, match="different temperatures"):
+            MultiChannelModel.from_kelvin([2700, 2700, 6500])
+        with pytest.raises(ValueError, match="at least two lights"):
+            MultiChannelModel.from_kelvin([2700])
+
+    def test_calculators(self):
+        """The calculators mix the intermediate lights, applying the calibrations of the warm and cold lights."""
+
+        calibration = ChannelCalibration.from_option("2.2")
+        calculator = BrightnessCalculator(
+            2700, 6500, 3000, 128, intermediate_temperatures_kelvin=(4000,), warm_calibration=calibration
+        )
+        warm_brightness, neutral_brightness, cold_brightness = calculator.compute_channel_brightnesses()
+        warm_output, expected_neutral_brightness = MixerModel.from_kelvin(2700, 4000).compute_brightnesses(3000, 128)
+
+        assert (warm_brightness, neutral_brightness, cold_brightness) == (
+            calibration.inverse[warm_output],
+            expected_neutral_brightness,
+            0,
+        )
+        assert TemperatureCalculator(
+            ChildLightState("light.warm", 2700, warm_brightness),
+            ChildLightState("light.cold", 6500, cold_brightness),
+            warm_calibration=calibration,
+            intermediate_lights=[ChildLightState("light.neutral", 4000, neutral_brightness)],
+        ).current_temperature() == pytest.approx(3000, abs=15)
+
+
+class TestFixedPointMixerModel:
+    """Test the FixedPointMixerModel."""
+
+    @pytest.mark.parametrize("priority", list(BrightnessTemperaturePriority))
+    @pytest.mark.parametrize(("warm_kelvin", "cold_kelvin"), [(3000, 6000), (2000, 6500), (1000, 10000)])
+    def test_close_to_reference(self, warm_kelvin, cold_kelvin, priority):
+        """Integer brightnesses within one step of the floating point ones, for targets inside and outside the range."""
+
+        reference = MixerModel.from_kelvin(warm_kelvin, cold_kelvin)
+        model = FixedPointMixerModel.from_kelvin(warm_kelvin, cold_kelvin)
+        for target_mired in range(reference.cold_temperature_mired - 5, reference.warm_temperature_mired + 6, 3):
+            for target_brightness in range(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1, 7):
+                warm, cold = model.compute_mired_brightnesses(target_mired, target_brightness, priority)
+                expected_warm, expected_cold = reference.compute_mired_brightnesses(
+                    target_mired, target_brightness, priority
+                )
+                assert type(warm) is int
+                assert type(cold) is int
+                assert abs(warm - expected_warm) <= 1
+                assert abs(cold - expected_cold) <= 1
+
+    def test_deterministic_ties(self):
+        """Halves round the cold light up, and the warm light gets the rest of the brightness."""
+
+        model = FixedPointMixerModel.from_kelvin(3000, 3500)
+        reference = MixerModel.from_kelvin(3000, 3500)
+        assert model.warm_temperature_mired - model.cold_temperature_mired == 48
+
+        # Exactly (21.5, 2.5), which the reference rounds to even
+        target_mired = model.warm_temperature_mired - 5
+        assert model.compute_mired_brightnesses(target_mired, 12) == (21, 3)
+        assert reference.compute_mired_brightnesses(target_mired, 12) == (22, 2)
+
+    def test_cached_apart(self):
+        """The shared cache does not mix the results of the two arithmetics."""
+
+        cache = BrightnessCache(16)
+        cache.compute_brightnesses(MixerModel.from_kelvin(3000, 3200), 3100, 21)
+        cache.compute_brightnesses(FixedPointMixerModel.from_kelvin(3000, 3200), 3100, 21)
+
+        assert cache.stats()["misses"] == 2
+
+
+class TestChannelCalibration:
+    """Test the ChannelCalibration."""
+
+    @pytest.mark.parametrize("option", ["", "  ", "1"])
+    def test_linear(self, option):
+        """Empty options and a unit gamma are linear lights, needing no calibration."""
+        assert ChannelCalibration.from_option(option) is None
+
+    @pytest.mark.parametrize("option", ["2.2", "0.6", "0:0, 64:35, 128:160, 255:800", "32:1, 255:10"])
+    def test_inverse_is_closest(self, option):
+        """The inverse table gives the brightness whose output is closest to each output, never turning off."""
+
+        calibration = ChannelCalibration.from_option(option)
+        assert calibration is not None
+        assert calibration.inverse[0] == 0
+        for output in range(1, BRIGHTNESS_RANGE[1] + 1):
+            brightness = calibration.inverse[output]
+            assert brightness >= BRIGHTNESS_RANGE[0]
+            assert abs(calibration.forward[brightness] - output) == min(
+                abs(calibration.forward[candidate] - output)
+                for candidate in range(BRIGHTNESS_RANGE[0], BRIGHTNESS_RANGE[1] + 1)
+            )
+
+    def test_measured_points(self):
+        """Outputs are interpolated between the points and relative to the one at full brightness."""
+
+        calibration = ChannelCalibration.from_option("0:0, 64:35, 128:160, 255:800")
+        assert calibration is not None
+        assert calibration.forward[0] == 0
+        assert calibration.forward[64] == pytest.approx(35 / 800 * 255)
+        assert calibration.forward[96] == pytest.approx((35 + 160) / 2 / 800 * 255)
+        assert calibration.forward[255] == 255
+
+    @pytest.mark.parametrize(
+        "option", ["warm", "0", "-2.2", "0:0, 128:10", "64:10, 32:5, 255:20", "0:0, 128:30, 255:20", "0:0 128:1"]
+    )
+    def test_invalid(self, option):
+        """Options that do not describe a non decreasing output curve are rejected."""
+        with pytest.raises(ValueError):
+            ChannelCalibration.from_option(option)
+
+    def test_calculators(self):
+        """Both calculators work with the outputs of the lights instead of their brightnesses."""
+
+        calibration = ChannelCalibration.from_gamma(2.0)
+        warm, cold = BrightnessCalculator(
+            3000, 6000, 4000, 100, warm_calibration=calibration, cold_calibration=calibration
+        ).compute_brightnesses()
+        linear_warm, linear_cold = BrightnessCalculator(3000, 6000, 4000, 100).compute_brightnesses()
+
+        assert (warm, cold) == (calibration.inverse[linear_warm], calibration.inverse[linear_cold])
+        assert warm > linear_warm
+        assert cold > linear_cold
+        assert TemperatureCalculator(
+            ChildLightState("light.warm", 3000, warm),
+            ChildLightState("light.cold", 6000, cold),
+            calibration,
+            calibration,
+        ).current_temperature() == pytest.approx(4000, abs=20)
+
+    def test_temperature_lookup_table(self):
+        """The calibrations are folded in the temperature lookup table."""
+
+        warm_calibration = ChannelCalibration.from_gamma(2.2)
+        cold_calibration = ChannelCalibration.from_option("0:0, 64:35, 128:160, 255:800")
+        table = TemperatureLookupTable(3000, 6000, warm_calibration=warm_calibration, cold_calibration=cold_calibration)
+        lazy_table = TemperatureLookupTable(
+            3000, 6000, lazy=True, warm_calibration=warm_calibration, cold_calibration=cold_calibration
+        )
+        for warm, cold in [(0, 0), (255, 0), (0, 255), (200, 100), (17, 230)]:
+            expected = TemperatureCalculator(
+                ChildLightState("light.warm", 3000, warm),
+                ChildLightState("light.cold", 6000, cold),
+                warm_calibration,
+                cold_calibration,
+            ).current_temperature()
+            assert table.lookup(warm, cold) == expected
+            assert lazy_table.lookup(warm, cold) == expected
+
+
+class TestTracing:
+    """Test the MixerTracer and MixerLoggerAdapter."""
+
+    def test_disabled(self):
+        """Without debug logging no span is created and the mixer name is never resolved."""
+
+        def resolve_name():
+            raise AssertionError("name resolved")
+
+        logger = logging.getLogger("tests.tracing.disabled")
+        logger.setLevel(logging.INFO)
+        log = MixerLoggerAdapter(logger, resolve_name)
+        tracer = MixerTracer(log)
+
+        assert tracer.start_span("turn_on") is None
+        log.debug("not emitted: %s", "argument")
+
+    def test_sampling_and_cached_name(self, caplog):
+        """One operation every sample interval is traced, and the mixer name is resolved once."""
+
+        resolved = []
+
+        def resolve_name():
+            resolved.append(True)
+            return "light.mixer"
+
+        logger = logging.getLogger("tests.tracing.enabled")
+        log = MixerLoggerAdapter(logger, resolve_name)
+        tracer = MixerTracer(log, sample_interval=3)
+
+        with caplog.at_level(logging.DEBUG, logger.name):
+            spans = [tracer.start_span("turn_on") for _ in range(6)]
+            for span in spans:
+                if span is not None:
+                    span.lap("compute")
+                    span.lap("dispatch")
+                    span.finish()
+
+        assert [span is not None for span in spans] == [True, False, False, True, False, False]
+        assert len(caplog.messages) == 2
+        assert caplog.messages[0].startswith("light.mixer: turn_on took ")
+        assert "compute: " in caplog.messages[0]
+        assert "dispatch: " in caplog.messages[0]
+        assert len(resolved) == 1
+
+        log.refresh_name()
+        with caplog.at_level(logging.DEBUG, logger.name):
+            log.debug("message")
+        assert len(resolved) == 2
+
+
+class TestDispatchStats:
+    """Test the counters of the commands forwarded to the lights."""
+
+    def test_calls_saved(self):
+        """Commands merged into fewer service calls are counted as saved calls."""
+
+        stats = DispatchStats()
+        stats.record(commands=2, calls=1)
+        stats.record(commands=2, calls=2)
+
+        assert stats.as_dict() == {"commands": 4, "calls": 3, "calls_saved": 1, "skipped": 0, "children": {}}
+
+    def test_latency_percentiles(self):
+        """The percentiles are the nearest ranks of the most recent latencies of each light."""
+
+        stats = DispatchStats()
+        assert stats.child("light.warm").percentile(50) is None
+
+        for milliseconds in range(200, 0, -1):
+            stats.child("light.warm").latencies.append(milliseconds / 1000)
+        stats.child("light.cold").timeouts += 1
+
+        assert stats.as_dict()["children"] == {
+            # Only the 100 most recent latencies, 100...1 ms, are kept
+            "light.warm": {
+                "samples": 100,
+                "p50_ms": 50.0,
+                "p95_ms": 95.0,
+                "max_ms": 100.0,
+                "timeouts": 0,
+                "failures": 0,
+            },
+            "light.cold": {"samples": 0, "p50_ms": None, "p95_ms": None, "max_ms": None, "timeouts": 1, "failures": 0},
+        }
+
+
+class TestTransitionPlan:
+    """Test the interpolation of the transitions run by the mixer."""
+
+    def test_frames(self):
+        """The frames are interpolated linearly in mireds and brightness, ending exactly at the target."""
+
+        plan = TransitionPlan.from_kelvin((2500, 200), (5000, 100), duration=2)
+
+        assert plan.frame(0) == (2500, 200)
+        # Halfway between 400 and 200 mireds
+        assert plan.frame(1) == (round(color_temperature_mired_to_kelvin(300)), 150)
+        assert plan.frame(2) == plan.frame(5) == (5000, 100)
+
+    def test_from_off(self):
+        """A transition from off turns on the lights from the first frame."""
+
+        plan = TransitionPlan.from_kelvin((4000, 0), (4000, 255), duration=1)
+
+        assert plan.frame(0) == (4000, 1)
+        assert TransitionPlan.from_kelvin((4000, 0), (4000, 255), duration=0).frame(0) == (4000, 255)
+
+
+class TestCircadian:
+    """Test the daylight curve followed by the mixers in circadian mode."""
+
+    def test_daylight_fraction(self):
+        """The fraction is 0 at night, and rises along a half sine to 1 at solar noon."""
+
+        sunrise = datetime(2026, 6, 1, 6, tzinfo=UTC)
+        sunset = datetime(2026, 6, 1, 20, tzinfo=UTC)
+
+        assert daylight_fraction(datetime(2026, 6, 1, 3, tzinfo=UTC), sunrise, sunset) == 0
+        assert daylight_fraction(datetime(2026, 6, 1, 13, tzinfo=UTC), sunrise, sunset) == pytest.approx(1)
+        assert daylight_fraction(datetime(2026, 6, 1, 9, 30, tzinfo=UTC), sunrise, sunset) == pytest.approx(0.5**0.5)
+        assert daylight_fraction(datetime(2026, 6, 1, 22, tzinfo=UTC), sunrise, sunset) == 0
+        # Polar night
+        assert daylight_fraction(datetime(2026, 6, 1, 13, tzinfo=UTC), None, None) == 0
+
+    def test_circadian_temperature(self):
+        """The temperature is interpolated in mireds across the range of the mixer."""
+
+        assert circadian_temperature(2500, 5000, 0) == 2500
+        assert circadian_temperature(2500, 5000, 1) == 5000
+        assert circadian_temperature(2500, 5000, 0.5) == round(color_temperature_mired_to_kelvin(300))
+        # The cold end, not a whole number of mireds, stays within the range instead of being rounded out of it
+        assert circadian_temperature(2700, 6500, 1) == 6500
+
+
+class TestChildLightState:
+    """Test the state of a channel made of several lights."""
+
+    def test_aggregate_members(self):
+        """The channel is on if any light is on, at the average brightness of the lights that are on or off."""
+
+        channel = ChildLightState(
+            "light.warm_1",
+            2700,
+            0,
+            members=(
+                ChildLightState("light.warm_1", 2700, 200, "on", 1),
+                ChildLightState("light.warm_2", 2700, 0, "off", 4),
+                ChildLightState("light.warm_3", 2700, 0, "unavailable"),
+            ),
+        )
+        channel.aggregate_members()
+
+        assert channel.entity_ids == ["light.warm_1", "light.warm_2", "light.warm_3"]
+        assert (channel.state, channel.brightness, channel.supported_features) == ("on", 100, 5)
+
+    def test_aggregate_unavailable_members(self):
+        """The channel is unavailable only if none of its lights is on or off."""
+
+        channel = ChildLightState(
+            "light.warm_1",
+            2700,
+            0,
+            members=(ChildLightState("light.warm_1", 2700, 0, "unavailable"), ChildLightState("light.warm_2", 2700, 0)),
+        )
+        channel.aggregate_members()
+
+        assert (channel.state, channel.brightness) == ("unavailable", 0)
+        assert ChildLightState("light.warm", 2700, 0).entity_ids == ["light.warm"]
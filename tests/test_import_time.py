@@ -0,0 +1,78 @@
+"""Test the time taken to import the integration."""
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+# Budget of the import of the integration and its light platform, on top of the Home Assistant modules it uses, as a
+# fraction of the time taken to import those modules in the same interpreter, so that it scales with the load of the
+# machine running the tests
+IMPORT_TIME_BUDGET = 0.1
+RUNS = 3
+
+# Measures the import of the Home Assistant modules used by the integration, loaded by Home Assistant before setting it
+# up, then the import of the integration alone
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import homeassistant.components.group.light
+import homeassistant.components.light
+import homeassistant.components.repairs
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.device_registry
+import homeassistant.helpers.event
+import homeassistant.helpers.redact
+import homeassistant.helpers.restore_state
+import homeassistant.helpers.sun
+baseline = time.perf_counter() - start
+
+modules = set(sys.modules)
+start = time.perf_counter()
+import custom_components.color_temperature_light_mixer
+import custom_components.color_temperature_light_mixer.light
+elapsed = time.perf_counter() - start
+print(json.dumps({"baseline": baseline, "elapsed": elapsed, "modules": sorted(set(sys.modules) - modules)}))
+"""
+
+
+def import_integration() -> dict:
+    """Import the integration in a new interpreter, returning the times taken and the modules imported."""
+
+    root = Path(__file__).parent.parent
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=root,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (str(root), os.environ.get("PYTHONPATH"))))},
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.fixture(scope="module")
+def imports() -> list[dict]:
+    """Import the integration a few times, each in a new interpreter."""
+    return [import_integration() for _ in range(RUNS)]
+
+
+def test_import_time(imports: list[dict]):
+    """The integration is imported within the budget, the fastest of a few runs to leave out the noise."""
+
+    ratio = min(run["elapsed"] / run["baseline"] for run in imports)
+    assert ratio < IMPORT_TIME_BUDGET, f"Importing the integration took {ratio:.1%} of the Home Assistant modules"
+
+
+def test_no_foreign_imports(imports: list[dict]):
+    """The integration imports no third-party package, nor the config flow until it is used."""
+
+    modules = imports[0]["modules"]
+    assert {module.split(".")[0] for module in modules} - sys.stdlib_module_names <= {"custom_components"}
+    assert not [module for module in modules if ".config_flow_handler" in module]
@@ -0,0 +1,610 @@
+"""Test the mixer light, commanding mock child lights in Home Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_capture_events, async_fire_time_changed
+
+from custom_components.color_temperature_light_mixer.const import (
+    CIRCADIAN_UPDATE_INTERVAL,
+    CONF_AWAIT_DISPATCH,
+    CONF_CIRCADIAN,
+    CONF_COLD_LIGHT,
+    CONF_DISPATCH_TIMEOUT,
+    CONF_MAX_CONCURRENT_LIGHTS,
+    CONF_MAX_DISPATCH_RATE,
+    CONF_OPTIMISTIC,
+    CONF_SOFTWARE_TRANSITION,
+    CONF_WARM_LIGHT,
+    DOMAIN,
+)
+from custom_components.color_temperature_light_mixer.data import TurnOnSettings
+from custom_components.color_temperature_light_mixer.utils.cache import BRIGHTNESS_CACHE
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_EFFECT,
+    ATTR_EFFECT_LIST,
+    ATTR_RGBWW_COLOR,
+    ATTR_TRANSITION,
+    DOMAIN as LIGHT_DOMAIN,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
+from homeassistant.const import (
+    ATTR_ASSUMED_STATE,
+    ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
+    CONF_NAME,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+MIXER_ENTITY_ID = "light.mixer"
+
+
+class TestGroupState:
+    """Test the state of the mixer aggregated from the states of its lights."""
+
+    @pytest.fixture
+    def child_lights(self, mock_child_light: type[LightEntity]) -> list[LightEntity]:
+        """Return lights supporting a few effects."""
+        return [
+            mock_child_light("warm", effect_list=["None", "rainbow", "blink"]),
+            mock_child_light("cold", effect_list=["None", "candle"]),
+        ]
+
+    async def test_effects(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+    ):
+        """The effects of the lights are merged, and the effect of the lights that are on is reported."""
+
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_SUPPORTED_FEATURES] & LightEntityFeature.EFFECT
+        assert state.attributes[ATTR_EFFECT_LIST] == ["None", "blink", "candle", "rainbow"]
+
+        await turn_on_mixer(effect="blink")
+        assert [call for call in lights["light.warm"].calls if call[1].get(ATTR_EFFECT) == "blink"]
+        assert hass.states.get(MIXER_ENTITY_ID).attributes[ATTR_EFFECT] == "blink"
+
+    async def test_assumed_state(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The state of the mixer is assumed if the state of any of its lights is."""
+
+        assert not hass.states.get(MIXER_ENTITY_ID).attributes.get(ATTR_ASSUMED_STATE)
+        light = lights["light.cold"]
+        light._attr_assumed_state = True  # noqa: SLF001
+        light.async_write_ha_state()
+        await settle()
+        assert hass.states.get(MIXER_ENTITY_ID).attributes[ATTR_ASSUMED_STATE]
+
+
+class TestStateWriteWindow:
+    """Test the coalescing of the updates of the lights into a single state write of the mixer."""
+
+    async def test_coalesced_write(
+        self, hass: HomeAssistant, mixer: MockConfigEntry, settle: Callable[[], Awaitable[None]]
+    ):
+        """The updates of both lights within the window are written as a single state, once the window elapses."""
+
+        writes = async_capture_events(hass, EVENT_STATE_CHANGED)
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: ["light.warm", "light.cold"], ATTR_BRIGHTNESS: 128},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        assert not [event for event in writes if event.data[ATTR_ENTITY_ID] == MIXER_ENTITY_ID]
+
+        await settle()
+        mixer_writes = [event for event in writes if event.data[ATTR_ENTITY_ID] == MIXER_ENTITY_ID]
+        assert len(mixer_writes) == 1
+        state = mixer_writes[0].data["new_state"]
+        assert state.state == STATE_ON
+        assert state.attributes[ATTR_BRIGHTNESS] == 128
+        # Mixed from both lights, not the temperature of the first one alone
+        assert 3000 < state.attributes[ATTR_COLOR_TEMP_KELVIN] < 6000
+
+
+class TestOptimistic:
+    """Test the optimistic state of the mixer, written before the lights confirm the command."""
+
+    @pytest.fixture
+    def options(self) -> dict[str, Any]:
+        """Return the options enabling the optimistic state."""
+        return {CONF_OPTIMISTIC: True}
+
+    async def test_reconciled(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The requested state is written at once, then reconciled with the states the lights actually report."""
+
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 200, ATTR_COLOR_TEMP_KELVIN: 4000},
+            blocking=True,
+        )
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_BRIGHTNESS] == 200
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == 4000
+
+        # The lights confirm the command, keeping the requested state
+        await settle()
+        assert hass.states.get(MIXER_ENTITY_ID).attributes[ATTR_COLOR_TEMP_KELVIN] == 4000
+
+        # The cold light reports another brightness than the one commanded
+        light = lights["light.cold"]
+        light._attr_brightness = 0  # noqa: SLF001
+        light._attr_is_on = False  # noqa: SLF001
+        light.async_write_ha_state()
+        await settle()
+        state = hass.states.get(MIXER_ENTITY_ID)
+        # Only the warm light is left on
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == pytest.approx(3000, abs=10)
+        assert state.attributes[ATTR_BRIGHTNESS] < 200
+
+
+class TestAwaitDispatch:
+    """Test the commands awaited until the lights complete them."""
+
+    @pytest.fixture
+    def options(self) -> dict[str, Any]:
+        """Return the options awaiting the lights, for a short time."""
+        return {CONF_AWAIT_DISPATCH: True, CONF_DISPATCH_TIMEOUT: 100}
+
+    async def test_timeout(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+    ):
+        """A light not completing the command in time fails the command of the mixer, once the others completed it."""
+
+        lights["light.cold"].blocked.clear()
+        with pytest.raises(HomeAssistantError, match="light.cold"):
+            await turn_on_mixer(brightness=200, color_temp_kelvin=4000)
+
+        assert lights["light.warm"].is_on
+        stats = mixer.runtime_data.dispatch_stats
+        assert stats.child("light.cold").timeouts == 1
+        assert stats.child("light.warm").timeouts == 0
+        assert len(stats.child("light.warm").latencies) == 1
+
+
+class TestCommandQueue:
+    """Test the queue of the commands received while one is being forwarded."""
+
+    @pytest.fixture
+    def options(self) -> dict[str, Any]:
+        """Return the options awaiting the lights, keeping a command in flight until they complete it."""
+        return {CONF_AWAIT_DISPATCH: True}
+
+    async def test_latest_wins(
+        self, hass: HomeAssistant, lights: dict[str, Any], mixer: MockConfigEntry, settle: Callable[[], Awaitable[None]]
+    ):
+        """The commands received while one is in flight are dropped, except the last one forwarded once it completes."""
+
+        warm_light, cold_light = lights["light.warm"], lights["light.cold"]
+        warm_light.blocked.clear()
+        first = asyncio.create_task(
+            hass.services.async_call(
+                LIGHT_DOMAIN,
+                SERVICE_TURN_ON,
+                {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 50, ATTR_COLOR_TEMP_KELVIN: 4000},
+                blocking=True,
+            )
+        )
+        while not warm_light.calls:
+            await asyncio.sleep(0)
+        for brightness in (100, 150, 200):
+            await hass.services.async_call(
+                LIGHT_DOMAIN,
+                SERVICE_TURN_ON,
+                {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: brightness, ATTR_COLOR_TEMP_KELVIN: 4000},
+                blocking=True,
+            )
+        assert len(warm_light.calls) == 1
+
+        warm_light.blocked.set()
+        await first
+        await settle()
+        assert len(warm_light.calls) == len(cold_light.calls) == 2
+        assert hass.states.get(MIXER_ENTITY_ID).attributes[ATTR_BRIGHTNESS] == pytest.approx(200, abs=2)
+
+    @pytest.mark.parametrize("options", [{CONF_MAX_DISPATCH_RATE: 10}])
+    async def test_circadian_update(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The circadian updates wait for the maximum rate like any command, and are superseded by newer ones."""
+
+        warm_light = lights["light.warm"]
+        await turn_on_mixer(brightness=100, color_temp_kelvin=4000)
+        entity = hass.data[LIGHT_DOMAIN].get_entity(MIXER_ENTITY_ID)
+
+        await entity.async_apply_circadian(1)
+        assert len(warm_light.calls) == 1
+
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 50, ATTR_COLOR_TEMP_KELVIN: 3000},
+            blocking=True,
+        )
+        await asyncio.sleep(0.2)
+        await settle()
+        assert len(warm_light.calls) == 2
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == pytest.approx(3000, abs=20)
+        assert state.attributes[ATTR_BRIGHTNESS] == pytest.approx(50, abs=2)
+
+
+class TestMaxConcurrentLights:
+    """Test the commands forwarded to each light on its own, to a limited number of lights at a time."""
+
+    @pytest.fixture
+    def options(self) -> dict[str, Any]:
+        """Return the options awaiting the lights, at most two at a time."""
+        return {CONF_AWAIT_DISPATCH: True, CONF_MAX_CONCURRENT_LIGHTS: 2}
+
+    @pytest.fixture
+    def child_lights(self, mock_child_light: type[LightEntity]) -> list[LightEntity]:
+        """Return two warm and two cold lights."""
+        return [mock_child_light(name) for name in ("warm_1", "warm_2", "cold_1", "cold_2")]
+
+    @pytest.fixture
+    def config_data(self, config_data: dict[str, Any]) -> dict[str, Any]:
+        """Return the configuration of the mixer, with two lights per channel."""
+        return {
+            **config_data,
+            CONF_WARM_LIGHT: ["light.warm_1", "light.warm_2"],
+            CONF_COLD_LIGHT: ["light.cold_1", "light.cold_2"],
+        }
+
+    async def test_in_flight(
+        self, hass: HomeAssistant, lights: dict[str, Any], mixer: MockConfigEntry, settle: Callable[[], Awaitable[None]]
+    ):
+        """No more lights than the maximum are commanded at a time, the next one once a light completes its command."""
+
+        for light in lights.values():
+            light.blocked.clear()
+        command = asyncio.create_task(
+            hass.services.async_call(
+                LIGHT_DOMAIN,
+                SERVICE_TURN_ON,
+                {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 200, ATTR_COLOR_TEMP_KELVIN: 4000},
+                blocking=True,
+            )
+        )
+        while sum(light.in_flight for light in lights.values()) < 2:
+            await asyncio.sleep(0)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        in_flight = [light for light in lights.values() if light.in_flight]
+        assert len(in_flight) == 2
+
+        in_flight[0].blocked.set()
+        while sum(len(light.calls) for light in lights.values()) < 3:
+            await asyncio.sleep(0)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert sum(light.in_flight for light in lights.values()) == 2
+
+        for light in lights.values():
+            light.blocked.set()
+        await command
+        await settle()
+        assert all(len(light.calls) == 1 for light in lights.values())
+        assert all(light.max_in_flight == 1 for light in lights.values())
+
+    @pytest.mark.parametrize("options", [{CONF_MAX_CONCURRENT_LIGHTS: 2}])
+    async def test_unloaded(
+        self, hass: HomeAssistant, lights: dict[str, Any], mixer: MockConfigEntry, settle: Callable[[], Awaitable[None]]
+    ):
+        """The lights not yet commanded in the background are left alone once the mixer is unloaded."""
+
+        for light in lights.values():
+            light.blocked.clear()
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 200, ATTR_COLOR_TEMP_KELVIN: 4000},
+            blocking=True,
+        )
+        while sum(light.in_flight for light in lights.values()) < 2:
+            await asyncio.sleep(0)
+
+        assert await hass.config_entries.async_unload(mixer.entry_id)
+        for light in lights.values():
+            light.blocked.set()
+        await settle()
+        assert sum(len(light.calls) for light in lights.values()) == 2
+
+
+class TestSkipUnchangedLights:
+    """Test the commands not forwarded to the lights already at the target."""
+
+    async def test_unchanged(
+        self, lights: dict[str, Any], mixer: MockConfigEntry, turn_on_mixer: Callable[..., Awaitable[None]]
+    ):
+        """The lights already at their target brightness are not called."""
+
+        warm_light, cold_light = lights["light.warm"], lights["light.cold"]
+        await turn_on_mixer(brightness=100, color_temp_kelvin=4000)
+        assert len(warm_light.calls) == len(cold_light.calls) == 1
+
+        await turn_on_mixer(brightness=100, color_temp_kelvin=4000)
+        assert len(warm_light.calls) == len(cold_light.calls) == 1
+        assert mixer.runtime_data.dispatch_stats.skipped == 2
+
+        # A transition is forwarded even to the lights already at the target
+        await turn_on_mixer(brightness=100, color_temp_kelvin=4000, transition=1)
+        assert len(warm_light.calls) == len(cold_light.calls) == 2
+
+
+class TestSoftwareTransition:
+    """Test the transitions run by the mixer."""
+
+    @pytest.fixture
+    def options(self) -> dict[str, Any]:
+        """Return the options running the transitions in the mixer, writing the state of their target."""
+        return {CONF_SOFTWARE_TRANSITION: True, CONF_OPTIMISTIC: True}
+
+    async def test_frames(
+        self, hass: HomeAssistant, lights: dict[str, Any], mixer: MockConfigEntry, settle: Callable[[], Awaitable[None]]
+    ):
+        """The frames are sent to the lights without filling the cache, which holds the target only."""
+
+        BRIGHTNESS_CACHE.clear()
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 200, ATTR_COLOR_TEMP_KELVIN: 4000, ATTR_TRANSITION: 0.3},
+            blocking=True,
+        )
+        await asyncio.sleep(0.5)
+        await settle()
+
+        warm_light = lights["light.warm"]
+        assert len(warm_light.calls) > 2
+        assert len(BRIGHTNESS_CACHE) == 1
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_BRIGHTNESS] == pytest.approx(200, abs=2)
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == pytest.approx(4000, abs=20)
+
+    async def test_exact_target(
+        self, hass: HomeAssistant, lights: dict[str, Any], mixer: MockConfigEntry, settle: Callable[[], Awaitable[None]]
+    ):
+        """The transition ends on the requested target, not on the target converted to mireds and back."""
+
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: MIXER_ENTITY_ID, ATTR_BRIGHTNESS: 100, ATTR_COLOR_TEMP_KELVIN: 6000, ATTR_TRANSITION: 0.1},
+            blocking=True,
+        )
+        await asyncio.sleep(0.3)
+        await settle()
+
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_BRIGHTNESS] == 100
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == 6000
+
+
+class TestCircadian:
+    """Test the mixers following the daylight curve."""
+
+    @pytest.fixture
+    def options(self) -> dict[str, Any]:
+        """Return the options following the daylight."""
+        return {CONF_CIRCADIAN: True}
+
+    @pytest.fixture(autouse=True)
+    def solar_noon(self, freezer: FrozenDateTimeFactory) -> None:
+        """Freeze the time around solar noon in the test location, before setting up the mixer."""
+        freezer.move_to("2024-06-21 19:50:00+00:00")
+
+    async def test_tick(
+        self,
+        hass: HomeAssistant,
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The lights are moved to the temperature of the daylight as a command of the mixer, once."""
+
+        await turn_on_mixer(brightness=100, color_temp_kelvin=3000)
+        stats = mixer.runtime_data.dispatch_stats
+        commands = stats.commands
+
+        async_fire_time_changed(hass, dt_util.utcnow() + CIRCADIAN_UPDATE_INTERVAL)
+        await settle()
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] > 5500
+        assert state.attributes[ATTR_BRIGHTNESS] == pytest.approx(100, abs=2)
+        assert stats.commands > commands
+
+        # The lights are already at the temperature of the daylight
+        commands = stats.commands
+        async_fire_time_changed(hass, dt_util.utcnow() + 2 * CIRCADIAN_UPDATE_INTERVAL)
+        await settle()
+        assert stats.commands == commands
+
+    async def test_requested_brightness(
+        self,
+        hass: HomeAssistant,
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The brightness lost at the end of the range is regained once the temperature moves back."""
+
+        await turn_on_mixer(brightness=255, color_temp_kelvin=4000)
+        entity = hass.data[LIGHT_DOMAIN].get_entity(MIXER_ENTITY_ID)
+
+        await entity.async_apply_circadian(1)
+        await settle()
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] > 5500
+        assert state.attributes[ATTR_BRIGHTNESS] < 200
+
+        await entity.async_apply_circadian(0.5)
+        await settle()
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == pytest.approx(4000, abs=20)
+        assert state.attributes[ATTR_BRIGHTNESS] == pytest.approx(255, abs=2)
+
+
+class TestChildStateDispatcher:
+    """Test the single subscription to the state changes of the lights of all the mixers."""
+
+    async def test_unregister(
+        self,
+        hass: HomeAssistant,
+        mixer: MockConfigEntry,
+        config_data: dict[str, Any],
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The mixers removed stop receiving the updates of their lights, unsubscribing with the last one."""
+
+        listeners = hass.bus.async_listeners()[EVENT_STATE_CHANGED]
+        other_mixer = MockConfigEntry(domain=DOMAIN, title="Other", data={**config_data, CONF_NAME: "Other"})
+        other_mixer.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(other_mixer.entry_id)
+        await hass.async_block_till_done()
+        assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners
+
+        assert await hass.config_entries.async_unload(mixer.entry_id)
+        await hass.services.async_call(
+            LIGHT_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: "light.warm", ATTR_BRIGHTNESS: 100}, blocking=True
+        )
+        await settle()
+        assert hass.states.get(MIXER_ENTITY_ID).state == STATE_UNAVAILABLE
+        assert hass.states.get("light.other").state == STATE_ON
+
+        assert await hass.config_entries.async_unload(other_mixer.entry_id)
+        await hass.async_block_till_done()
+        assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners - 1
+
+
+class TestRgbwwOutput:
+    """Test the mixer of a single light driving both white channels."""
+
+    @pytest.fixture
+    def child_lights(self, mock_child_light: type[LightEntity]) -> list[LightEntity]:
+        """Return two RGBWW lights reporting their color with the largest channel at 255."""
+        return [mock_child_light(name, color_mode=ColorMode.RGBWW, normalize_rgbww=True) for name in ("lamp", "lamp_2")]
+
+    @pytest.fixture
+    def config_data(self, config_data: dict[str, Any]) -> dict[str, Any]:
+        """Return the configuration of the mixer, with the lamp as both the warm and the cold light."""
+        return {**config_data, CONF_WARM_LIGHT: ["light.lamp"], CONF_COLD_LIGHT: ["light.lamp"]}
+
+    async def test_rgbww_color(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+    ):
+        """The channels are sent as a color scaled to 255 along with the brightness, and read back as such."""
+
+        lamp = lights["light.lamp"]
+        await turn_on_mixer(brightness=100, color_temp_kelvin=3000)
+        assert lamp.calls == [("turn_on", {ATTR_RGBWW_COLOR: (0, 0, 0, 0, 255), ATTR_BRIGHTNESS: 200})]
+
+        await turn_on_mixer(brightness=100, color_temp_kelvin=4000)
+        service, service_data = lamp.calls[-1]
+        assert service == "turn_on"
+        assert max(service_data[ATTR_RGBWW_COLOR]) == 255
+        state = hass.states.get(MIXER_ENTITY_ID)
+        assert state.attributes[ATTR_BRIGHTNESS] == pytest.approx(100, abs=1)
+        assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == pytest.approx(4000, abs=20)
+
+    async def test_turned_off(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        mixer: MockConfigEntry,
+        turn_on_mixer: Callable[..., Awaitable[None]],
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """Both channels off turn the light off, instead of turning it on with a color of zeros."""
+
+        await turn_on_mixer(brightness=100, color_temp_kelvin=4000)
+        entity = hass.data[LIGHT_DOMAIN].get_entity(MIXER_ENTITY_ID)
+        await entity._turn_on_rgbww_light(  # noqa: SLF001
+            TurnOnSettings(["light.lamp"], {}, 0), TurnOnSettings(["light.lamp"], {}, 0)
+        )
+        await settle()
+
+        assert lights["light.lamp"].calls[-1] == ("turn_off", {})
+        assert hass.states.get(MIXER_ENTITY_ID).state == STATE_OFF
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_reversed_order(
+        self,
+        hass: HomeAssistant,
+        lights: dict[str, Any],
+        config_data: dict[str, Any],
+        settle: Callable[[], Awaitable[None]],
+    ):
+        """The lights of both channels listed in different orders are still each set with a single RGBWW color."""
+
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Other",
+            data={
+                **config_data,
+                CONF_NAME: "Other",
+                CONF_WARM_LIGHT: ["light.lamp", "light.lamp_2"],
+                CONF_COLD_LIGHT: ["light.lamp_2", "light.lamp"],
+            },
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: "light.other", ATTR_BRIGHTNESS: 100, ATTR_COLOR_TEMP_KELVIN: 3000},
+            blocking=True,
+        )
+        await settle()
+        for light in lights.values():
+            assert light.calls == [("turn_on", {ATTR_RGBWW_COLOR: (0, 0, 0, 0, 255), ATTR_BRIGHTNESS: 200})]
+        state = hass.states.get("light.other")
+        assert state.attributes[ATTR_BRIGHTNESS] == pytest.approx(100, abs=1)